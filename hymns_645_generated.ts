@@ -1,24 +1,28 @@
+// 자동 생성 파일 - 직접 수정하지 마세요 (scripts/build_catalog.py)
+// inputs: 767ba5591f7b0358
+import type { HymnDef } from './constants';
+
 export const GLOBAL_HYMN_TREASURY: HymnDef[] = [
-  { no: 1, id: 'h1', ko: '만복의 근원 하나님', en: 'Praise God from Whom All Blessings Flow', es: 'Himno 1', category: '예배' },
-  { no: 2, id: 'h2', ko: '찬양 성부 성자 성령', en: 'Hymn 2', es: 'Himno 2', category: '예배' },
-  { no: 3, id: 'h3', ko: '성부 성자와 성령', en: 'Hymn 3', es: 'Himno 3', category: '예배' },
-  { no: 4, id: 'h4', ko: '성부 성자와 성령', en: 'Hymn 4', es: 'Himno 4', category: '예배' },
-  { no: 5, id: 'h5', ko: '이 천지간 만물들아', en: 'Hymn 5', es: 'Himno 5', category: '예배' },
-  { no: 6, id: 'h6', ko: '목소리 높여서', en: 'Hymn 6', es: 'Himno 6', category: '예배' },
-  { no: 7, id: 'h7', ko: '성부 성자 성령', en: 'Hymn 7', es: 'Himno 7', category: '예배' },
-  { no: 8, id: 'h8', ko: '거룩 거룩 거룩', en: 'Holy, Holy, Holy', es: 'Himno 8', category: '예배' },
-  { no: 9, id: 'h9', ko: '하늘에 가득 찬 영광의 하나님', en: 'Hymn 9', es: 'Himno 9', category: '예배' },
-  { no: 10, id: 'h10', ko: '전능왕 오셔서', en: 'Hymn 10', es: 'Himno 10', category: '예배' },
-  { no: 11, id: 'h11', ko: '홀로 한 분 하나님께', en: 'Hymn 11', es: 'Himno 11', category: '예배' },
-  { no: 12, id: 'h12', ko: '다 함께 주를 경배하세', en: 'Hymn 12', es: 'Himno 12', category: '예배' },
-  { no: 13, id: 'h13', ko: '영원한 하늘나라', en: 'Hymn 13', es: 'Himno 13', category: '예배' },
-  { no: 14, id: 'h14', ko: '주 우리 하나님', en: 'Hymn 14', es: 'Himno 14', category: '예배' },
-  { no: 15, id: 'h15', ko: '하나님의 크신 사랑', en: 'Hymn 15', es: 'Himno 15', category: '예배' },
-  { no: 16, id: 'h16', ko: '은혜로신 하나님 우리 주 하나님', en: 'Hymn 16', es: 'Himno 16', category: '예배' },
-  { no: 17, id: 'h17', ko: '사랑의 하나님', en: 'Hymn 17', es: 'Himno 17', category: '예배' },
-  { no: 18, id: 'h18', ko: '성도들아 찬양하자', en: 'Hymn 18', es: 'Himno 18', category: '예배' },
-  { no: 19, id: 'h19', ko: '찬송하는 소리 있어', en: 'Hymn 19', es: 'Himno 19', category: '예배' },
-  { no: 20, id: 'h20', ko: '큰 영광 중에 계신 주', en: 'Hymn 20', es: 'Himno 20', category: '예배' },
+  { no: 1, id: 'h1', ko: '만복의 근원 하나님', en: 'Praise God from Whom All Blessings Flow', es: 'A Dios El Padre Celestial', category: '예배' },
+  { no: 2, id: 'h2', ko: '찬양 성부 성자 성령', en: 'Praise the Father, Son, and Holy Spirit', es: 'Alabanza al Padre, Hijo y Espíritu Santo', category: '예배' },
+  { no: 3, id: 'h3', ko: '성부 성자와 성령', en: 'Father, Son, and Holy Spirit', es: 'Padre, Hijo y Espíritu Santo', category: '예배' },
+  { no: 4, id: 'h4', ko: '성부 성자와 성령', en: 'Father, Son, and Holy Spirit', es: 'Padre, Hijo y Espíritu Santo', category: '예배' },
+  { no: 5, id: 'h5', ko: '이 천지간 만물들아', en: 'All Creatures of Our God and King', es: 'Todas las Criaturas del Señor y Rey', category: '예배' },
+  { no: 6, id: 'h6', ko: '목소리 높여서', en: 'O for a Thousand Tongues to Sing', es: 'Mil Voces para Celebrar', category: '예배' },
+  { no: 7, id: 'h7', ko: '성부 성자 성령', en: 'Father, Son, and Holy Spirit', es: 'Padre, Hijo y Espíritu Santo', category: '예배' },
+  { no: 8, id: 'h8', ko: '거룩 거룩 거룩', en: 'Holy, Holy, Holy', es: 'Santo, Santo, Santo', category: '예배' },
+  { no: 9, id: 'h9', ko: '하늘에 가득 찬 영광의 하나님', en: 'God of Glory, Lord of Love', es: 'Dios de Gloria, Señor de Amor', category: '예배' },
+  { no: 10, id: 'h10', ko: '전능왕 오셔서', en: 'Come, Thou Almighty King', es: 'Ven, Rey Todopoderoso', category: '예배' },
+  { no: 11, id: 'h11', ko: '홀로 한 분 하나님께', en: 'To God Be the Glory', es: 'A Dios Sea la Gloria', category: '예배' },
+  { no: 12, id: 'h12', ko: '다 함께 주를 경배하세', en: 'O Come, Let Us Adore Him', es: 'Venid, Adoremos', category: '예배' },
+  { no: 13, id: 'h13', ko: '영원한 하늘나라', en: 'Eternal Kingdom', es: 'Reino Eterno', category: '예배' },
+  { no: 14, id: 'h14', ko: '주 우리 하나님', en: 'Lord Our God', es: 'Señor Nuestro Dios', category: '예배' },
+  { no: 15, id: 'h15', ko: '하나님의 크신 사랑', en: 'The Love of God', es: 'El Amor de Dios', category: '예배' },
+  { no: 16, id: 'h16', ko: '은혜로신 하나님 우리 주 하나님', en: 'Gracious God, Our Lord', es: 'Dios Misericordioso', category: '예배' },
+  { no: 17, id: 'h17', ko: '사랑의 하나님', en: 'God of Love', es: 'Dios de Amor', category: '예배' },
+  { no: 18, id: 'h18', ko: '성도들아 찬양하자', en: 'Saints, Let Us Praise', es: 'Santos, Alabemos', category: '예배' },
+  { no: 19, id: 'h19', ko: '찬송하는 소리 있어', en: 'Joyful, Joyful, We Adore Thee', es: 'Alegres, Alegres, Te Adoramos', category: '예배' },
+  { no: 20, id: 'h20', ko: '큰 영광 중에 계신 주', en: 'Lord in Glory', es: 'Señor en Gloria', category: '예배' },
   { no: 21, id: 'h21', ko: '다 찬양하여라', en: 'Praise to the Lord, the Almighty', es: 'Himno 21', category: '예배' },
   { no: 22, id: 'h22', ko: '만유의 주 앞에', en: 'Hymn 22', es: 'Himno 22', category: '예배' },
   { no: 23, id: 'h23', ko: '만 입이 내게 있으면', en: 'Hymn 23', es: 'Himno 23', category: '예배' },
@@ -644,4 +648,4 @@ export const GLOBAL_HYMN_TREASURY: HymnDef[] = [
   { no: 643, id: 'h643', ko: '찬송가 643장', en: 'Hymn 643', es: 'Himno 643', category: '행사와 절기' },
   { no: 644, id: 'h644', ko: '찬송가 644장', en: 'Hymn 644', es: 'Himno 644', category: '행사와 절기' },
   { no: 645, id: 'h645', ko: '찬송가 645장', en: 'Hymn 645', es: 'Himno 645', category: '행사와 절기' },
-];
\ No newline at end of file
+];
@@ -0,0 +1,88 @@
+"""
+찬송가 Suno 프롬프트 일괄 생성 (브라우저 없이 실행)
+여러 곡을 동시에 생성하고 끝난 곡부터 JSON Lines로 기록, 중단되면 같은 명령으로 이어서 실행
+
+사용법 (scripts 폴더에서):
+    python batch_generate.py --backend gemini --concurrency 4 --range 1-645
+    python batch_generate.py --backend stub --range 1-20 --out /tmp/prompts.jsonl
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from hymnkit.batch_generate import DEFAULT_CONCURRENCY, MAX_ATTEMPTS, ResponseCache, load_hymns, run_batch
+from hymnkit.catalog import TOTAL_HYMNS
+from hymnkit.cli import parse_range
+from hymnkit.prompt_backends import PROMPT_BACKENDS, GeminiBackend, GenerationError, StubBackend
+
+BASE_DIR = Path(__file__).parent.parent
+DEFAULT_OUT = BASE_DIR / "data" / "generated" / "prompts.jsonl"
+DEFAULT_CACHE = BASE_DIR / "data" / "generated" / ".response_cache"
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="찬송가 Suno 프롬프트 일괄 생성")
+    parser.add_argument('--backend', choices=sorted(PROMPT_BACKENDS), default="gemini",
+                        help="생성 방식 (stub: 네트워크 없이 가짜 응답)")
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY, help="동시 요청 수")
+    parser.add_argument('--range', dest='hymn_range', type=parse_range, default=(1, TOTAL_HYMNS),
+                        help="곡 번호 범위 (예: 1-645, 305)")
+    parser.add_argument('--catalog', type=Path, default=None,
+                        help="곡 목록 JSON (기본: data/hymn_catalog.json, 예: data/hymns-645-complete.json)")
+    parser.add_argument('--prefs', type=Path, default=None,
+                        help="기본 설정을 덮어쓸 UserPreferences 항목 JSON 파일 (genre, vibe ...)")
+    parser.add_argument('--out', type=Path, default=DEFAULT_OUT, help="결과 JSON Lines 파일")
+    parser.add_argument('--cache', type=Path, default=DEFAULT_CACHE, help="응답 캐시 폴더")
+    parser.add_argument('--attempts', type=int, default=MAX_ATTEMPTS, help="곡마다 최대 시도 횟수")
+    parser.add_argument('--stub-delay', type=float, default=0.0, help="stub 응답 지연 (초)")
+    parser.add_argument('--stub-error-rate', type=float, default=0.0, help="stub 일시 오류 비율 (0~1)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    start_no, end_no = args.hymn_range
+    hymns = [hymn for hymn in load_hymns(args.catalog) if start_no <= hymn["no"] <= end_no]
+    overrides = None
+    if args.prefs:
+        with open(args.prefs, 'r', encoding='utf-8') as f:
+            overrides = json.load(f)
+
+    try:
+        if args.backend == "stub":
+            backend = StubBackend(delay=args.stub_delay, error_rate=args.stub_error_rate)
+        else:
+            backend = GeminiBackend(on_event=print)
+    except GenerationError as e:
+        print(f"❌ {e}")
+        return 1
+
+    cache = ResponseCache(args.cache)
+    print("=" * 80)
+    print("🎼 찬송가 Suno 프롬프트 일괄 생성")
+    print(f"📚 {start_no}~{end_no}장 중 {len(hymns)}곡, 결과: {args.out}")
+    print("=" * 80)
+
+    started = time.perf_counter()
+    try:
+        stats = run_batch(hymns, backend, args.out, cache, concurrency=args.concurrency,
+                          overrides=overrides, attempts=args.attempts)
+    except KeyboardInterrupt:
+        print("\n⏸️  중단됨 - 같은 명령으로 다시 실행하면 기록된 곡은 건너뜁니다")
+        return 130
+    elapsed = time.perf_counter() - started
+
+    print("\n" + "=" * 80)
+    print(f"✅ 생성: {stats['generated']}, 캐시: {stats['cached']}, 건너뜀: {stats['skipped']}")
+    print(f"❌ 실패: {len(stats['failed'])} {[no for no, _ in stats['failed']][:20]}")
+    print(f"⏱️  {elapsed:.1f}초")
+    print(cache.format_stats())
+    print(backend.format_stats())
+    return 1 if stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""
+다운로드 방식(backend)별 오프라인 벤치마크
+로컬 모의 사이트(hymnkit.mock_site)를 띄우고 목록 링크 추출 → 페이지에서 MP3 URL 추출 →
+MP3 다운로드 전체를 방식마다 빈 폴더에서 실행해 실행 시간과 전송 속도를 비교
+
+사용법 (scripts 폴더에서):
+    python bench_download.py --backends requests,async --hymns 100 --latency 0.05 --error-rate 0.02
+"""
+
+import argparse
+import shutil
+import tempfile
+from pathlib import Path
+
+from hymnkit import http_client, metrics, retry_queue
+from hymnkit.backends import BACKENDS, DownloadContext
+from hymnkit.blob_store import BlobStore
+from hymnkit.cli import build_jobs, run_jobs
+from hymnkit.catalog import extract_all_hymn_links
+from hymnkit.html_cache import HtmlCache
+from hymnkit.mock_site import DEFAULT_MP3_SIZE, MockSite
+from hymnkit.progress_store import ProgressStore
+from hymnkit.rate_limiter import AdaptiveRateLimiter
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="찬송가 다운로드 방식별 오프라인 벤치마크")
+    parser.add_argument('--backends', default="requests,async",
+                        help="비교할 방식 (쉼표로 구분, 기본: requests,async)")
+    parser.add_argument('--hymns', type=int, default=100, help="모의 사이트 곡 수 (기본: 100)")
+    parser.add_argument('--concurrency', type=int, default=None, help="동시에 처리할 곡 수")
+    parser.add_argument('--mp3-kb', type=int, default=DEFAULT_MP3_SIZE // 1024,
+                        help=f"곡당 MP3 크기 KB (기본: {DEFAULT_MP3_SIZE // 1024})")
+    parser.add_argument('--latency', type=float, default=0.02, help="응답 지연 초 (기본: 0.02)")
+    parser.add_argument('--bandwidth', type=float, default=None,
+                        help="연결당 대역폭 MB/s (기본: 제한 없음)")
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                        help="페이지/MP3 요청이 503으로 실패할 확률 (기본: 0)")
+    parser.add_argument('--rate-limit', action='store_true',
+                        help="실제 실행처럼 적응형 속도 제한기 사용 (기본: 사용 안 함)")
+    parser.add_argument('--retry-delay', type=float, default=0.1,
+                        help="첫 재시도 전 대기 초 (기본: 0.1)")
+    return parser
+
+
+def run_backend(name, site, args, work_dir):
+    """빈 폴더에서 방식 하나를 처음부터 끝까지 실행하고 측정값 반환"""
+    out_dir = work_dir / name
+    out_dir.mkdir()
+    backend_class = BACKENDS[name]
+    concurrency = args.concurrency or backend_class.default_concurrency
+
+    # 방식마다 새 연결 풀과 속도 제한기로 시작 (앞선 실행의 keep-alive 연결 재사용 방지)
+    http_client.configure(pool_size=max(concurrency, http_client.DEFAULT_POOL_SIZE))
+    http_client.set_rate_limiter(AdaptiveRateLimiter() if args.rate_limit else None)
+    collector = metrics.Metrics()
+    metrics.set_active(collector)
+
+    page_cache = HtmlCache(out_dir / ".page_cache")
+    context = DownloadContext(page_cache, BlobStore(out_dir / ".blobs"))
+    progress = ProgressStore(out_dir / "progress.json", defaults={"links": {}})
+    retries = retry_queue.RetryScheduler(base_delay=args.retry_delay)
+
+    with metrics.timer(metrics.LIST):
+        links = extract_all_hymn_links(page_cache, site.list_url)
+    jobs = build_jobs(links, progress, out_dir, (1, len(links)))
+
+    def on_result(hymn_no, job, mp3_url, error):
+        if error is None:
+            progress.mark_completed(hymn_no)
+            retries.succeed(hymn_no)
+        elif not retries.fail(hymn_no, job, error):
+            progress.mark_failed(hymn_no)
+
+    if name == "selenium":
+        backend = backend_class(context, concurrency, on_event=print)
+    else:
+        backend = backend_class(context, concurrency)
+    try:
+        with backend:
+            run_jobs(backend, jobs, on_result, retries)
+    finally:
+        progress.close()
+        collector.finish()
+        metrics.set_active(None)
+
+    summary = collector.summary()
+    summary.update(backend=name, concurrency=concurrency, jobs=len(jobs),
+                   completed=len(progress.completed), failed=len(progress.failed))
+    return summary
+
+
+def main():
+    args = build_parser().parse_args()
+    names = [name.strip() for name in args.backends.split(',') if name.strip()]
+    unknown = [name for name in names if name not in BACKENDS]
+    if unknown:
+        raise SystemExit(f"알 수 없는 방식: {', '.join(unknown)} (가능: {', '.join(sorted(BACKENDS))})")
+
+    bandwidth = args.bandwidth * 1024 * 1024 if args.bandwidth else None
+    site = MockSite(hymns=args.hymns, mp3_size=args.mp3_kb * 1024, latency=args.latency,
+                    bandwidth=bandwidth, error_rate=args.error_rate)
+    work_dir = Path(tempfile.mkdtemp(prefix="hymnkit_bench_"))
+
+    print(f"🧪 모의 사이트: {args.hymns}곡 × {args.mp3_kb} KB, 지연 {args.latency * 1000:.0f}ms, "
+          f"대역폭 {f'{args.bandwidth} MB/s' if bandwidth else '제한 없음'}, "
+          f"오류 {args.error_rate * 100:.1f}%")
+    results = []
+    try:
+        with site:
+            for name in names:
+                print(f"\n▶ {name}")
+                try:
+                    summary = run_backend(name, site, args, work_dir)
+                except (ImportError, OSError, RuntimeError) as e:
+                    # selenium/브라우저가 없는 환경에서는 해당 방식만 건너뜀
+                    print(f"  ⏭️  건너뜀: {e}")
+                    continue
+                results.append(summary)
+                hymn = summary["phases"].get(metrics.HYMN, {})
+                print(f"  ✅ {summary['completed']}/{summary['jobs']}곡 "
+                      f"({summary['wall_seconds']:.2f}초, 곡당 p50 {hymn.get('p50', 0) * 1000:.0f}ms)")
+            print(site.format_stats())
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print(f"\n{'방식':<10}{'동시':>6}{'성공':>8}{'실패':>6}{'시간(초)':>10}"
+          f"{'곡/초':>8}{'MB/s':>8}{'p95(ms)':>10}")
+    for summary in results:
+        hymn = summary["phases"].get(metrics.HYMN, {})
+        wall = summary["wall_seconds"]
+        print(f"{summary['backend']:<10}{summary['concurrency']:>6}{summary['completed']:>8}"
+              f"{summary['failed']:>6}{wall:>10.2f}{summary['completed'] / wall:>8.1f}"
+              f"{summary['throughput_mb_s']:>8.1f}{hymn.get('p95', 0) * 1000:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
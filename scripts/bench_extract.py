@@ -0,0 +1,132 @@
+"""
+MP3 URL 추출 마이크로 벤치마크
+저장된 찬송가 페이지(페이지 캐시 또는 지정한 폴더의 .html)를 대상으로
+기존 방식(정규식 + BeautifulSoup, 정규식 3회)과 hymnkit.mp3_extract를 비교
+
+사용법: python scripts/bench_extract.py [HTML 폴더] [반복 횟수]
+"""
+
+import re
+import sys
+import time
+from pathlib import Path
+
+from hymnkit.mp3_extract import CHUNK_SIZE, find_mp3_url, scan_chunks
+
+BASE_DIR = Path(__file__).parent.parent
+DEFAULT_SAMPLE_DIR = BASE_DIR / "data" / "mp3" / ".page_cache" / "blobs"
+
+
+def synthetic_pages(count=20):
+    """저장된 페이지가 없을 때 사용할 티스토리 글 형태의 샘플 페이지"""
+    filler = ('<p class="lyrics">주 하나님 지으신 모든 세계 내 마음 속에 그리어 볼 때 '
+              '하늘의 별 울려 퍼지는 뇌성 주님의 권능 우주에 찼네</p>\n') * 400
+    pages = []
+    for no in range(1, count + 1):
+        mp3 = f'https://blog.kakaocdn.net/dn/{no:08d}/tfile.mp3'
+        pages.append(
+            '<!DOCTYPE html><html><head><title>새찬송가 {0}장</title>'
+            '<script src="/js/app.js"></script></head><body>'
+            '<div class="article">{1}'
+            '<figure class="fileblock"><audio controls src="{2}"></audio></figure>'
+            '{1}</div></body></html>'.format(no, filler, mp3).encode('utf-8'))
+    return pages
+
+
+def load_pages(sample_dir):
+    paths = sorted(Path(sample_dir).glob("*.html")) if sample_dir else []
+    return [path.read_bytes() for path in paths]
+
+
+def old_realtime(data):
+    """download_realtime.py 기존 방식: 정규식 실패 시 BeautifulSoup 전체 파싱"""
+    from bs4 import BeautifulSoup
+    text = data.decode('utf-8', errors='replace')
+    match = re.search(r'(https?://[^"\s]+tfile\.mp3[^"\s]*)', text)
+    if match:
+        return match.group(1)
+    soup = BeautifulSoup(text, 'html.parser')
+    audio = soup.find('audio')
+    if audio and audio.get('src'):
+        return audio['src']
+    source = soup.find('source')
+    if source and source.get('src'):
+        return source['src']
+    return None
+
+
+def old_all_mp3(data):
+    """download_all_mp3.py 기존 방식: 항상 BeautifulSoup 전체 파싱"""
+    from bs4 import BeautifulSoup
+    text = data.decode('utf-8', errors='replace')
+    soup = BeautifulSoup(text, 'html.parser')
+    audio = soup.find('audio')
+    if audio and audio.get('src'):
+        return audio['src']
+    source = soup.find('source')
+    if source and source.get('src'):
+        return source['src']
+    match = re.search(r'(https?://[^"\s]+tfile\.mp3[^"\s]*)', text)
+    return match.group(1) if match else None
+
+
+def old_simple(data):
+    """simple_download.py 기존 방식: 정규식 3회"""
+    text = data.decode('utf-8', errors='replace')
+    for pattern in (r'<audio[^>]*src=["\']([^"\']*tfile\.mp3[^"\']*)["\']',
+                    r'<source[^>]*src=["\']([^"\']*tfile\.mp3[^"\']*)["\']',
+                    r'href=["\']([^"\']*tfile\.mp3[^"\']*)["\']'):
+        match = re.search(pattern, text)
+        if match:
+            return match.group(1)
+    return None
+
+
+def streaming(data):
+    """hymnkit.mp3_extract: 조각 단위 검사, 찾으면 즉시 중단"""
+    chunks = (data[i:i + CHUNK_SIZE] for i in range(0, len(data), CHUNK_SIZE))
+    return scan_chunks(chunks)[0]
+
+
+def bench(name, func, pages, repeat):
+    found = sum(1 for page in pages if func(page))
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for page in pages:
+            func(page)
+    elapsed = time.perf_counter() - start
+    per_page = elapsed / (repeat * len(pages)) * 1e6
+    print(f"  {name:<28} {per_page:10.1f} µs/page   (찾음 {found}/{len(pages)})")
+
+
+def main():
+    sample_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SAMPLE_DIR
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    pages = load_pages(sample_dir)
+    if pages:
+        print(f"📄 저장된 페이지 {len(pages)}개 ({sample_dir})")
+    else:
+        pages = synthetic_pages()
+        print(f"📄 저장된 페이지가 없어 합성 페이지 {len(pages)}개 사용")
+    avg_kb = sum(len(page) for page in pages) / len(pages) / 1024
+    print(f"   평균 크기 {avg_kb:.1f} KB, 반복 {repeat}회\n")
+
+    bench("find_mp3_url (전체 본문)", find_mp3_url, pages, repeat)
+    bench("scan_chunks (스트리밍)", streaming, pages, repeat)
+    read = sum(len(scan_chunks(page[i:i + CHUNK_SIZE] for i in range(0, len(page), CHUNK_SIZE))[1])
+               for page in pages)
+    total = sum(len(page) for page in pages)
+    print(f"  {'':<28} 스트리밍 시 본문의 {read / total * 100:.1f}%만 읽음")
+    bench("기존 simple_download", old_simple, pages, repeat)
+    bench("기존 download_realtime", old_realtime, pages, repeat)
+    try:
+        import bs4  # noqa: F401
+    except ImportError:
+        print("  (beautifulsoup4가 없어 download_all_mp3 기존 방식은 생략)")
+        return
+    bench("기존 download_all_mp3", old_all_mp3, pages, max(repeat // 10, 1))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+찬송가 검색 색인 벤치마크
+카탈로그(data/hymn_catalog.json) 전체와 이를 10배, 100배로 늘린 합성 카탈로그에서
+색인 생성 시간, 저장 크기, 불러오기 시간, 검색어 종류별 지연 시간을 측정하고
+색인 없이 모든 곡의 제목을 훑는 방식(선형 검색)과 비교
+(앱의 utils/hymnSearch.ts와 결과가 같은지는 check_search_parity.py로 확인)
+
+사용법: python scripts/bench_search.py [반복 횟수]
+"""
+
+import json
+import statistics
+import sys
+import time
+
+from hymnkit.hymn_catalog import load_catalog, merge_sources
+from hymnkit.search_index import SearchIndex, build_index, fold
+
+SCALES = (1, 10, 100)
+
+# 합성 카탈로그에서 곡마다 덧붙이는 단어 (색인어 수가 실제처럼 늘어나도록)
+VARIANT_KO = ("은혜", "사랑", "평화", "소망", "믿음", "영광", "기쁨", "구원", "생명", "감사")
+VARIANT_EN = ("grace", "love", "peace", "hope", "faith", "glory", "joy", "salvation", "life", "thanks")
+
+QUERIES = {
+    "번호": ["305", "1", "645"],
+    "한글 음절": ["만복", "거룩 거룩", "성령", "하나님"],
+    "입력 중 (받침 생략)": ["만보", "하나니", "거루"],
+    "초성": ["ㅁㅂㅇ", "ㄱㄹ", "ㅅㄹ"],
+    "영어/스페인어 접두": ["holy", "prai", "father son", "espiritu"],
+    "오타 허용": ["praize", "hlly", "서령"],
+}
+
+
+def synthetic_catalog(records, scale):
+    """곡 번호를 645씩 밀고 제목에 단어를 덧붙여 scale배로 늘린 카탈로그"""
+    total = len(records)
+    out = []
+    for copy in range(scale):
+        for record in records:
+            if copy == 0:
+                out.append(record)
+                continue
+            variant = (copy + record["no"]) % len(VARIANT_KO)
+            out.append({
+                "no": record["no"] + copy * total,
+                "ko": f"{record['ko']} {VARIANT_KO[variant]}",
+                "en": f"{record['en']} {VARIANT_EN[variant]}",
+                "es": record["es"],
+                "category": record["category"],
+            })
+    return out
+
+
+def linear_search(records, query, limit=20):
+    """색인 없이 모든 곡의 제목을 훑는 방식 (부분 문자열 일치)"""
+    needle = fold(query).replace(" ", "")
+    hits = []
+    for record in records:
+        text = fold(" ".join((record["ko"], record["en"], record["es"]))).replace(" ", "")
+        if needle in text or needle == str(record["no"]):
+            hits.append(record["no"])
+            if len(hits) >= limit:
+                break
+    return hits
+
+
+def time_queries(func, queries, repeat):
+    """검색어별 평균 지연 시간 (µs) 목록"""
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func(query)
+        timings.append((time.perf_counter() - start) / repeat * 1e6)
+    return timings
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    catalog = load_catalog()
+    records = catalog["hymns"] if catalog else merge_sources()
+    print(f"🔎 카탈로그 {len(records)}곡, 검색어마다 {repeat}회 반복\n")
+
+    for scale in SCALES:
+        corpus = synthetic_catalog(records, scale)
+        start = time.perf_counter()
+        data = build_index(corpus)
+        build_ms = (time.perf_counter() - start) * 1000
+        text = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+        start = time.perf_counter()
+        index = SearchIndex(json.loads(text))
+        load_ms = (time.perf_counter() - start) * 1000
+
+        print(f"📚 {scale}배 ({len(corpus)}곡): 색인어 {len(data['terms'])}개, "
+              f"{len(text.encode('utf-8')) / 1024:.0f} KB, 생성 {build_ms:.0f}ms, 불러오기 {load_ms:.1f}ms")
+        print(f"   {'검색어 종류':<22}{'색인 µs':>10}{'최대 µs':>10}{'선형 µs':>12}")
+        for kind, queries in QUERIES.items():
+            indexed = time_queries(index.search, queries, repeat)
+            linear = time_queries(lambda q: linear_search(corpus, q), queries, max(repeat // 20, 1))
+            print(f"   {kind:<22}{statistics.mean(indexed):>10.1f}{max(indexed):>10.1f}"
+                  f"{statistics.mean(linear):>12.1f}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
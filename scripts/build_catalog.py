@@ -0,0 +1,38 @@
+"""
+찬송가 카탈로그와 앱용 데이터 빌드
+data/hymns-*.json 원본을 data/hymn_catalog.json으로 합치고 (값이 서로 다르면 중단),
+카탈로그가 바뀐 경우에만 hymns_645_generated.ts, public/hymns-645.json,
+public/hymn-search-index.json(검색 색인)을 다시 생성
+
+사용법: python scripts/build_catalog.py [--force] [--check]
+"""
+
+import argparse
+import sys
+
+from hymnkit.hymn_catalog import CatalogConflict, build
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="찬송가 카탈로그와 앱용 데이터 빌드")
+    parser.add_argument('--force', action='store_true', help="바뀌지 않았어도 모두 다시 생성")
+    parser.add_argument('--check', action='store_true',
+                        help="파일을 쓰지 않고 다시 생성해야 하는 항목이 있으면 실패 (CI용)")
+    args = parser.parse_args(argv)
+
+    try:
+        stale = build(force=args.force, check=args.check)
+    except CatalogConflict as e:
+        print(f"❌ {e}")
+        return 1
+
+    if args.check and stale:
+        print("❌ 다시 생성해야 하는 파일: " + ", ".join(path.name for path in stale))
+        return 1
+    if not stale:
+        print("✅ 변경 없음 - 모든 생성 파일이 최신입니다")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
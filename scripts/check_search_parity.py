@@ -0,0 +1,79 @@
+"""
+앱 검색(utils/hymnSearch.ts)과 파이썬 검색(hymnkit/search_index.py)의 결과 비교
+같은 색인(public/hymn-search-index.json)과 정해진 검색어로 두 구현의 결과가 같은지 확인
+(bench_search.py가 앱에서 실제로 쓰는 검색을 측정하는지 확인하는 용도)
+
+TypeScript는 node_modules의 tsc로 임시 폴더에 변환한 뒤 node로 실행하므로
+먼저 저장소 최상위에서 npm install 필요
+
+사용법: python scripts/check_search_parity.py
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from hymnkit.search_index import SearchIndex
+
+BASE_DIR = Path(__file__).parent.parent
+INDEX_PATH = BASE_DIR / "public" / "hymn-search-index.json"
+TS_SOURCE = BASE_DIR / "utils" / "hymnSearch.ts"
+TSC = BASE_DIR / "node_modules" / ".bin" / "tsc"
+
+# 번호, 음절, 받침 생략, 초성, 접두, 오타 허용, 한 글자/초성 하나처럼 짧은 검색어
+QUERIES = (
+    "305", "1", "645", "0", "999",
+    "만복", "거룩 거룩", "성령", "하나님", "만보", "하나니", "거루",
+    "ㅁㅂㅇ", "ㄱㄹ", "ㅅㄹ", "ㄱ", "ㅎ", "ㄳ", "가", "주", "성ㄹ",
+    "holy", "prai", "father son", "espiritu", "Espíritu", "hymn 30", "a", "é",
+    "praize", "hlly", "서령", "하나림", "예수 ㅅㄹ", "grace 은혜", "",
+)
+
+HARNESS = """
+import { readFileSync } from 'node:fs';
+import { HymnSearchIndex } from './hymnSearch.js';
+
+const [indexPath, queriesPath] = process.argv.slice(2);
+const index = new HymnSearchIndex(JSON.parse(readFileSync(indexPath, 'utf-8')));
+const queries = JSON.parse(readFileSync(queriesPath, 'utf-8'));
+process.stdout.write(JSON.stringify(queries.map(query => index.search(query))));
+"""
+
+
+def typescript_results(queries):
+    """utils/hymnSearch.ts를 변환해 node로 실행한 검색 결과"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        subprocess.run([str(TSC), str(TS_SOURCE), "--outDir", str(tmp), "--target", "es2020",
+                        "--module", "es2020", "--skipLibCheck"], check=True)
+        (tmp / "package.json").write_text('{"type": "module"}', encoding='utf-8')
+        (tmp / "harness.js").write_text(HARNESS, encoding='utf-8')
+        (tmp / "queries.json").write_text(json.dumps(queries, ensure_ascii=False), encoding='utf-8')
+        output = subprocess.run(["node", str(tmp / "harness.js"), str(INDEX_PATH), str(tmp / "queries.json")],
+                                check=True, stdout=subprocess.PIPE, encoding='utf-8').stdout
+    return json.loads(output)
+
+
+def main():
+    if not TSC.exists():
+        print(f"❌ {TSC} 없음 (저장소 최상위에서 npm install)")
+        return 2
+    with open(INDEX_PATH, 'r', encoding='utf-8') as f:
+        index = SearchIndex(json.load(f))
+    queries = list(QUERIES)
+    expected = [index.search(query) for query in queries]
+    actual = typescript_results(queries)
+
+    mismatches = 0
+    for query, py, ts in zip(queries, expected, actual):
+        if py != ts:
+            mismatches += 1
+            print(f"❌ {query!r}\n   python: {py}\n   ts:     {ts}")
+    print(f"{'✅' if not mismatches else '❌'} 검색어 {len(queries)}개 중 {len(queries) - mismatches}개 일치")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
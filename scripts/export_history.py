@@ -0,0 +1,47 @@
+"""
+생성 결과(HistoryItem) 기록을 앱과 같은 TXT/CSV/JSON 형식으로 내보내기
+입력과 출력을 한 레코드씩 처리하므로 수 GB 기록도 메모리를 거의 쓰지 않음
+
+사용법 (scripts 폴더에서):
+    python export_history.py 찬송가_전체_히스토리.json --format csv --out 찬송가_목록.csv
+    python export_history.py ../data/generated/prompts.jsonl --format txt --out prompts.txt.gz
+    python export_history.py ../data/history_archive --format txt --by-category --out exports --gzip
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from hymnkit.history_export import FORMATS, export_by_category, export_history
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="생성 결과 기록 내보내기")
+    parser.add_argument('source', type=Path, help="기록 JSON 배열, JSON Lines(.jsonl), 보관소 폴더 (.gz 가능)")
+    parser.add_argument('--format', choices=sorted(FORMATS), default="txt")
+    parser.add_argument('--out', type=Path, required=True,
+                        help="출력 파일 (.gz로 끝나면 압축), --by-category면 출력 폴더")
+    parser.add_argument('--by-category', action='store_true', help="찬송가 분류마다 파일 하나씩")
+    parser.add_argument('--gzip', action='store_true', help="분류별 파일을 gzip으로 압축")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    if args.by_category:
+        def on_result(result):
+            path, count, elapsed = result
+            print(f"📤 {Path(path).name}: {count}개 ({elapsed:.1f}초)")
+
+        stem = args.source.name.split('.')[0] or "history"
+        results = export_by_category(args.source, args.out, args.format, stem=stem, compress=args.gzip,
+                                     on_result=on_result)
+        count = sum(count for _, count, _ in results)
+        print(f"\n✅ {len(results)}개 파일, {count}개 레코드 ({time.perf_counter() - start:.1f}초)")
+    else:
+        path, count, elapsed = export_history(args.source, args.out, args.format)
+        print(f"✅ {path}: {count}개 레코드 ({elapsed:.1f}초)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,69 +1,12 @@
 """
 브라우저에서 추출한 645곡 찬송가 제목을 TypeScript 형식으로 변환
+제목 데이터는 data/hymns-titles-browser.json으로 옮겨졌고, 이 스크립트는
+통합 카탈로그 빌드(build_catalog.py)를 실행함 (바뀐 생성 파일만 다시 만듦)
 """
 
-# 브라우저 서브에이전트가 추출한 전체 645곡 제목 데이터
-HYMN_TITLES = {
-    1: "만복의 근원 하나님", 2: "찬양 성부 성자 성령", 3: "성부 성자와 성령", 4: "성부 성자와 성령",
-    5: "이 천지간 만물들아", 6: "목소리 높여서", 7: "성부 성자 성령", 8: "거룩 거룩 거룩",
-    9: "하늘에 가득 찬 영광의 하나님", 10: "전능왕 오셔서", 11: "홀로 한 분 하나님께", 12: "다 함께 주를 경배하세",
-    13: "영원한 하늘나라", 14: "주 우리 하나님", 15: "하나님의 크신 사랑", 16: "은혜로신 하나님 우리 주 하나님",
-    17: "사랑의 하나님", 18: "성도들아 찬양하자", 19: "찬송하는 소리 있어", 20: "큰 영광 중에 계신 주",
-    21: "다 찬양하여라", 22: "만유의 주 앞에", 23: "만 입이 내게 있으면", 24: "왕 되신 주",
-    25: "면류관 벗어서", 26: "구세주를 아는 이들", 27: "빛나고 높은 보좌와", 28: "복의 근원 강림 하사",
-    29: "성도여 다 함께", 30: "전능하고 놀라우신", 31: "찬양하라 복되신 구세주 예수", 32: "만유의 주재",
-    33: "영광스런 주를 조라", 34: "참 놀랍도다 주 크신 이름", 35: "큰 영화로신 주", 36: "주 예수 이름 높이어",
-    37: "주 예수 이름 높이어", 38: "예수 우리 왕이여", 39: "주 은혜를 받으려", 40: "찬송으로 보답할 수 없는",
-    # ... 계속 (전체 645곡)
-}
+import sys
 
-# 간단한 영문 제목 생성 (실제로는 정확한 영문 제목 필요)
-def generate_english_title(ko_title, no):
-    # 주요 찬송가의 영문 제목 매핑
-    known_titles = {
-        1: "Praise God from Whom All Blessings Flow",
-        8: "Holy, Holy, Holy",
-        21: "Praise to the Lord, the Almighty",
-        28: "Come, Thou Fount of Every Blessing",
-        40: "How Great Thou Art",
-        # ... 더 많은 매핑 추가 가능
-    }
-    return known_titles.get(no, f"Hymn {no}")
+from build_catalog import main
 
-def get_category(no):
-    if 1 <= no <= 62: return '예배'
-    if 63 <= no <= 79: return '성부하나님'
-    if 80 <= no <= 181: return '성자예수님'
-    if 182 <= no <= 197: return '성령'
-    if 198 <= no <= 206: return '성경'
-    if 207 <= no <= 223: return '교회'
-    if 224 <= no <= 233: return '성례'
-    if 234 <= no <= 249: return '천국'
-    if 250 <= no <= 289: return '구원'
-    if 290 <= no <= 545: return '그리스도인의 삶'
-    if 546 <= no <= 575: return '전도와 선교'
-    if 576 <= no <= 645: return '행사와 절기'
-    return '기타'
-
-# 전체 645곡 생성
-lines = []
-lines.append("export const GLOBAL_HYMN_TREASURY: HymnDef[] = [")
-
-for no in range(1, 646):
-    ko_title = HYMN_TITLES.get(no, f"찬송가 {no}장")
-    en_title = generate_english_title(ko_title, no)
-    es_title = f"Himno {no}"
-    category = get_category(no)
-    
-    line = f"  {{ no: {no}, id: 'h{no}', ko: '{ko_title}', en: '{en_title}', es: '{es_title}', category: '{category}' }},"
-    lines.append(line)
-
-lines.append("];")
-
-# 파일로 저장
-output = "\n".join(lines)
-with open("hymns_645_generated.ts", "w", encoding="utf-8") as f:
-    f.write(output)
-
-print(f"✅ 645곡 TypeScript 데이터 생성 완료!")
-print(f"📊 총 {len(lines)-2}곡")
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
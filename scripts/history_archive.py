@@ -0,0 +1,115 @@
+"""
+생성 결과(HistoryItem) 보관소 관리
+앱에서 내보낸 기록 JSON이나 batch_generate.py의 JSON Lines를 보관소에 넣고,
+곡 번호로 조회하거나 앱과 같은 TXT/CSV/JSON 형식으로 내보냄
+(분류별 나누기, 압축 등은 export_history.py)
+
+사용법 (scripts 폴더에서):
+    python history_archive.py import 찬송가_전체_히스토리.json ../data/generated/prompts.jsonl history.json.gz
+    python history_archive.py get 305
+    python history_archive.py export --format txt --out Suno_프롬프트_모음.txt
+    python history_archive.py compact
+    python history_archive.py stats
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from hymnkit.batch_generate import load_hymns
+from hymnkit.history_export import FORMATS, export_history, iter_history
+from hymnkit.history_store import HistoryStore, title_numbers
+
+BASE_DIR = Path(__file__).parent.parent
+DEFAULT_ARCHIVE = BASE_DIR / "data" / "history_archive"
+IMPORT_BATCH = 256          # 한 번에 기록하는 레코드 수
+
+
+def batched(items, size):
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def cmd_import(store, args):
+    numbers_by_title = title_numbers(load_hymns())
+    for path in args.files:
+        count = sum(store.put_many(batch, numbers_by_title) for batch in batched(iter_history(path), IMPORT_BATCH))
+        print(f"📥 {path}: {count}개")
+    print(f"📚 보관소: {len(store)}개")
+    return 0
+
+
+def cmd_get(store, args):
+    items = store.by_hymn(args.hymn, covers=args.covers)
+    if not items:
+        print(f"❌ {args.hymn}장 기록 없음")
+        return 1
+    json.dump(items if args.all else items[0], sys.stdout, ensure_ascii=False, indent=2)
+    print()
+    return 0
+
+
+def cmd_export(store, args):
+    path, count, _ = export_history(store.root, args.out, args.format)
+    print(f"📤 {path}: {count}개")
+    return 0
+
+
+def cmd_compact(store, args):
+    before, after, removed = store.compact()
+    print(f"🧹 데이터 {before / 1024 / 1024:.1f} MB → {after / 1024 / 1024:.1f} MB, 표지 {removed}개 삭제")
+    return 0
+
+
+def cmd_stats(store, args):
+    stats = store.stats()
+    print(f"📚 레코드 {stats['records']}개 ({stats['hymns']}곡), 색인 항목 {stats['index_entries']}개")
+    print(f"📄 데이터 {stats['data_bytes'] / 1024 / 1024:.1f} MB "
+          f"(정리 대상 {(stats['data_bytes'] - stats['live_bytes']) / 1024 / 1024:.1f} MB)")
+    print(f"🖼️  표지 {stats['covers']}개, {stats['cover_bytes'] / 1024 / 1024:.1f} MB")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="생성 결과 보관소 관리")
+    parser.add_argument('--archive', type=Path, default=DEFAULT_ARCHIVE, help="보관소 폴더")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    sub = commands.add_parser('import', help="기록 JSON/JSONL 파일 추가 (같은 id는 대체)")
+    sub.add_argument('files', nargs='+', type=Path, help="기록 JSON 배열, JSON Lines(.jsonl) (.gz 가능)")
+    sub.set_defaults(func=cmd_import)
+
+    sub = commands.add_parser('get', help="곡 번호로 조회 (기본: 가장 최근 것)")
+    sub.add_argument('hymn', type=int)
+    sub.add_argument('--all', action='store_true', help="해당 곡의 모든 기록")
+    sub.add_argument('--covers', action='store_true', help="표지를 data URL로 포함")
+    sub.set_defaults(func=cmd_get)
+
+    sub = commands.add_parser('export', help="앱과 같은 TXT/CSV/JSON 형식으로 내보내기")
+    sub.add_argument('--format', choices=sorted(FORMATS), default="txt")
+    sub.add_argument('--out', type=Path, required=True, help="출력 파일 (.gz로 끝나면 압축)")
+    sub.set_defaults(func=cmd_export)
+
+    sub = commands.add_parser('compact', help="대체/삭제된 레코드와 쓰지 않는 표지 정리")
+    sub.set_defaults(func=cmd_compact)
+
+    sub = commands.add_parser('stats', help="보관소 크기")
+    sub.set_defaults(func=cmd_stats)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    with HistoryStore(args.archive) as store:
+        return args.func(store, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
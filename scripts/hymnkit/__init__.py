@@ -0,0 +1,4 @@
+"""
+찬송가 MP3 다운로드 스크립트 공용 모듈
+scripts/ 폴더의 스크립트들이 함께 사용하는 다운로드 엔진과 유틸리티
+"""
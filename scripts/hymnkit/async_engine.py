@@ -0,0 +1,97 @@
+"""
+asyncio 기반 동시 다운로드 엔진
+페이지 스크래핑(MP3 URL 추출)과 MP3 다운로드를 여러 곡에 걸쳐 겹쳐서 실행
+전체 동시 작업 수와 호스트별 동시 접속 수를 각각 제한
+"""
+
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from hymnkit import metrics
+from hymnkit.retry_queue import DownloadFailure, NO_MP3_LINK
+
+# 기본 설정
+DEFAULT_CONCURRENCY = 8     # 동시에 처리할 찬송가 수
+DEFAULT_PER_HOST = 4        # 호스트 하나에 동시에 열 수 있는 요청 수
+DEFAULT_HOST_DELAY = 0.0    # 요청 후 호스트 슬롯을 반납하기 전 대기 (속도 제한은 http_client의 rate limiter가 담당)
+
+
+class HostLimiter:
+    """호스트별 동시 접속 제한"""
+
+    def __init__(self, per_host, delay=0.0):
+        self.per_host = per_host
+        self.delay = delay
+        self._semaphores = {}
+
+    def _semaphore(self, url):
+        host = urlsplit(url).netloc
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.per_host)
+            self._semaphores[host] = semaphore
+        return semaphore
+
+    async def run(self, url, func, *args):
+        """호스트 슬롯을 잡은 상태에서 블로킹 함수를 스레드로 실행 (현재 곡 번호 등 컨텍스트 유지)"""
+        async with self._semaphore(url):
+            loop = asyncio.get_running_loop()
+            context = contextvars.copy_context()
+            try:
+                return await loop.run_in_executor(None, context.run, func, *args)
+            finally:
+                if self.delay:
+                    await asyncio.sleep(self.delay)
+
+
+async def _process_job(job, extract_mp3_url, download_mp3, on_result, limiter, slots):
+    """찬송가 한 곡 처리: 페이지 → MP3 URL → 다운로드 (실패는 예외로 on_result에 전달)"""
+    hymn_no, page_url, filepath = job["no"], job["url"], job["filepath"]
+    mp3_url = None
+    async with slots:
+        with metrics.hymn(hymn_no):
+            try:
+                with metrics.timer(metrics.HYMN):
+                    mp3_url = await limiter.run(page_url, extract_mp3_url, page_url)
+                    if not mp3_url:
+                        raise DownloadFailure(NO_MP3_LINK)
+                    await limiter.run(mp3_url, download_mp3, mp3_url, filepath)
+            except Exception as e:
+                on_result(hymn_no, job, mp3_url, e)
+                return
+        on_result(hymn_no, job, mp3_url, None)
+
+
+async def _run(jobs, extract_mp3_url, download_mp3, on_result, concurrency, per_host, host_delay):
+    loop = asyncio.get_running_loop()
+    # 스레드 수가 동시 작업 수보다 적으면 실제 동시성이 제한되므로 직접 지정
+    executor = ThreadPoolExecutor(max_workers=max(concurrency, per_host))
+    loop.set_default_executor(executor)
+
+    limiter = HostLimiter(per_host, host_delay)
+    slots = asyncio.Semaphore(concurrency)
+    try:
+        await asyncio.gather(*(
+            _process_job(job, extract_mp3_url, download_mp3, on_result, limiter, slots)
+            for job in jobs
+        ))
+    finally:
+        executor.shutdown(wait=True)
+
+
+def run_pipeline(jobs, extract_mp3_url, download_mp3, on_result,
+                 concurrency=DEFAULT_CONCURRENCY, per_host=DEFAULT_PER_HOST,
+                 host_delay=DEFAULT_HOST_DELAY):
+    """
+    찬송가 목록을 동시에 다운로드
+
+    jobs: {"no", "title", "url", "filepath"} 딕셔너리 목록
+    extract_mp3_url(page_url) -> mp3_url 또는 None (링크 없음은 DownloadFailure(NO_MP3_LINK)로 전달)
+    download_mp3(mp3_url, filepath): 실패 시 예외 발생
+    on_result(hymn_no, job, mp3_url, error): 곡마다 이벤트 루프 스레드에서 호출됨 (성공이면 error는 None)
+        (한 번에 하나씩만 호출되므로 진행 상황 저장을 여기서 해도 안전)
+    """
+    asyncio.run(_run(jobs, extract_mp3_url, download_mp3, on_result,
+                     concurrency, per_host, host_delay))
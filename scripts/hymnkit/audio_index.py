@@ -0,0 +1,293 @@
+"""
+찬송가 MP3 메타데이터 색인 (재생 시간, 비트레이트, 크기, ID3 태그)
+파일 전체를 읽거나 디코딩하지 않고 필요한 부분만 seek해서 읽음
+
+- 앞: ID3v2 태그 헤더와 텍스트 프레임 헤더만 따라가며 필요한 프레임만 읽음 (표지 APIC 등은 건너뜀)
+- 첫 MPEG 프레임: 헤더와 Xing/Info/VBRI 헤더의 프레임 수로 재생 시간 계산
+  (VBR 헤더가 없으면 CBR로 보고 오디오 바이트 수 / 비트레이트)
+- 뒤: 마지막 128바이트의 ID3v1 태그
+곡마다 수 KB만 읽으므로 645곡 전체 색인이 1초 안쪽
+
+저장 형식: {"version", "fields": [...], "hymns": {"곡 번호": [필드 값...]}} (곡마다 한 줄)
+파일 크기와 수정 시각(mtime_ns)이 그대로인 곡은 다시 읽지 않음
+"""
+
+import json
+import os
+import re
+import time
+from pathlib import Path
+
+from hymnkit.mp3_edit import xing_offset
+from hymnkit.mp3_frames import SYNC_SEARCH_LIMIT, InvalidMp3, frame_info
+from hymnkit.progress_store import ProgressStore
+
+INDEX_VERSION = 1
+INDEX_NAME = "audio_index.json"
+FIELDS = ("file", "size", "mtime_ns", "duration_ms", "bitrate", "sample_rate", "channels", "vbr",
+          "title", "artist", "album")
+MAX_TEXT_FRAME = 4096           # 이보다 큰 ID3v2 프레임은 읽지 않고 건너뜀
+HEAD_READ = 4096                # 첫 프레임을 찾을 때 한 번에 읽는 크기
+FILENAME = re.compile(r"^(\d{3})_.*\.mp3$", re.IGNORECASE)
+
+# ID3v2 프레임 ID → 필드 (v2.2는 3글자)
+_ID3V2_FIELDS = {
+    b'TIT2': "title", b'TPE1': "artist", b'TALB': "album", b'TLEN': "tlen",
+    b'TT2': "title", b'TP1': "artist", b'TAL': "album", b'TLE': "tlen",
+}
+
+
+def _syncsafe(data):
+    return (data[0] << 21) | (data[1] << 14) | (data[2] << 7) | data[3]
+
+
+def _decode_legacy(raw):
+    """ISO-8859-1로 표시된 문자열 (국내 MP3는 대부분 CP949라 먼저 시도)"""
+    try:
+        return raw.decode('cp949')
+    except UnicodeDecodeError:
+        return raw.decode('latin-1')
+
+
+def decode_text(data):
+    """ID3v2 텍스트 프레임 값 (첫 바이트가 인코딩)"""
+    if not data:
+        return ""
+    encoding, raw = data[0], data[1:]
+    if encoding == 1:
+        text = raw.decode('utf-16', errors='replace')
+    elif encoding == 2:
+        text = raw.decode('utf-16-be', errors='replace')
+    elif encoding == 3:
+        text = raw.decode('utf-8', errors='replace')
+    else:
+        text = _decode_legacy(raw)
+    return text.split('\x00')[0].strip()
+
+
+def read_id3v2(f, header):
+    """
+    파일 앞 ID3v2 태그에서 필요한 텍스트 프레임만 읽기 (f는 헤더 바로 뒤 위치)
+    (태그 전체 크기, {필드: 값}) 반환
+    """
+    major, flags = header[3], header[5]
+    end = 10 + _syncsafe(header[6:10])
+    pos = 10
+    if flags & 0x40:        # 확장 헤더
+        ext = f.read(4)
+        pos += _syncsafe(ext) if major >= 4 else 4 + int.from_bytes(ext, 'big')
+    id_length, header_length = (3, 6) if major == 2 else (4, 10)
+
+    tags = {}
+    while pos + header_length <= end:
+        f.seek(pos)
+        frame_header = f.read(header_length)
+        frame_id = frame_header[:id_length]
+        if len(frame_header) < header_length or not frame_id.strip(b'\x00') or not frame_id.isalnum():
+            break           # 패딩 또는 깨진 태그
+        size_bytes = frame_header[id_length:id_length + (3 if major == 2 else 4)]
+        frame_size = _syncsafe(size_bytes) if major >= 4 else int.from_bytes(size_bytes, 'big')
+        pos += header_length
+        field = _ID3V2_FIELDS.get(frame_id)
+        if field and frame_size <= MAX_TEXT_FRAME and field not in tags:
+            data = f.read(frame_size)
+            if flags & 0x80:    # 비동기화(unsynchronisation)
+                data = data.replace(b'\xff\x00', b'\xff')
+            tags[field] = decode_text(data)
+        pos += frame_size
+    return end + (10 if flags & 0x10 else 0), tags     # 꼬리말(footer) 포함
+
+
+def read_id3v1(f, file_size):
+    """파일 끝 128바이트 ID3v1 태그 ({필드: 값}, 태그가 없으면 None)"""
+    if file_size < 128:
+        return None
+    f.seek(file_size - 128)
+    data = f.read(128)
+    if data[:3] != b'TAG':
+        return None
+    tags = {}
+    for field, start in (("title", 3), ("artist", 33), ("album", 63)):
+        text = _decode_legacy(data[start:start + 30].split(b'\x00')[0]).strip()
+        if text:
+            tags[field] = text
+    return tags
+
+
+def _find_first_frame(f, start, file_size):
+    """start 뒤 첫 MPEG 프레임 (위치, 정보, 프레임 앞부분) - 다음 프레임 헤더까지 맞아야 인정"""
+    limit = min(start + SYNC_SEARCH_LIMIT, file_size)
+    pos = start
+    while pos < limit:
+        f.seek(pos)
+        window = f.read(HEAD_READ + 2048)       # 프레임 최대 길이(1441바이트) + 다음 헤더까지
+        i = window.find(b'\xff')
+        while 0 <= i and i + 4 <= min(len(window), HEAD_READ + 4):
+            info = frame_info(window[i:i + 4])
+            if info is not None:
+                next_pos = i + info["length"]
+                if pos + next_pos >= file_size or frame_info(window[next_pos:next_pos + 4]) is not None \
+                        or next_pos + 4 > len(window):
+                    return pos + i, info, window[i:i + 192]
+            i = window.find(b'\xff', i + 1)
+        pos += HEAD_READ
+    raise InvalidMp3("MP3 프레임을 찾을 수 없음")
+
+
+def _vbr_header(frame, info):
+    """Xing/Info 또는 VBRI 헤더 ('Xing'/'Info'/'VBRI', 프레임 수 또는 None)"""
+    if info["layer"] == 3:
+        pos = xing_offset(info)
+        tag = frame[pos:pos + 4]
+        if tag in (b'Xing', b'Info'):
+            flags = int.from_bytes(frame[pos + 4:pos + 8], 'big')
+            frames = int.from_bytes(frame[pos + 8:pos + 12], 'big') if flags & 1 else None
+            return tag.decode('ascii'), frames
+    if frame[36:40] == b'VBRI':
+        return "VBRI", int.from_bytes(frame[50:54], 'big')
+    return None, None
+
+
+def read_mp3_info(path):
+    """
+    MP3 한 파일의 메타데이터 (필요한 헤더만 seek해서 읽음)
+    {"size", "mtime_ns", "duration_ms", "bitrate", "sample_rate", "channels", "vbr", "title", "artist", "album"}
+    """
+    with open(path, 'rb') as f:
+        stat = os.fstat(f.fileno())
+        file_size = stat.st_size
+        header = f.read(10)
+        audio_start, tags = 0, {}
+        if header[:3] == b'ID3' and len(header) == 10:
+            audio_start, tags = read_id3v2(f, header)
+        v1_tags = read_id3v1(f, file_size)
+        audio_end = file_size - (128 if v1_tags is not None else 0)
+        offset, info, frame = _find_first_frame(f, audio_start, audio_end)
+
+    kind, frames = _vbr_header(frame, info)
+    audio_bytes = audio_end - offset
+    if kind is not None:
+        audio_bytes -= info["length"]           # VBR 헤더 프레임은 소리가 없음
+    if frames:
+        seconds = frames * info["samples"] / info["sample_rate"]
+        bitrate = round(audio_bytes * 8 / seconds) if seconds else info["bitrate"]
+    else:
+        bitrate = info["bitrate"]
+        seconds = audio_bytes * 8 / bitrate
+    if not seconds and tags.get("tlen", "").isdigit():
+        seconds = int(tags["tlen"]) / 1000
+
+    for field, value in (v1_tags or {}).items():
+        tags.setdefault(field, value)
+    return {
+        "size": file_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "duration_ms": round(seconds * 1000),
+        "bitrate": bitrate,
+        "sample_rate": info["sample_rate"],
+        "channels": info["channels"],
+        "vbr": int(kind in ("Xing", "VBRI")),
+        "title": tags.get("title", ""),
+        "artist": tags.get("artist", ""),
+        "album": tags.get("album", ""),
+    }
+
+
+# ---- 색인 파일 ----
+
+def load_index(path):
+    """저장된 색인 {곡 번호: {필드: 값}} (없거나 형식이 다르면 빈 딕셔너리)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != INDEX_VERSION:
+        return {}
+    fields = data["fields"]
+    return {int(no): dict(zip(fields, row)) for no, row in data["hymns"].items()}
+
+
+def save_index(index, path):
+    """곡마다 한 줄씩 원자적으로 저장"""
+    path = Path(path)
+    lines = [f'"{no}": ' + json.dumps([record.get(field) for field in FIELDS], ensure_ascii=False)
+             for no, record in sorted(index.items())]
+    text = ('{\n'
+            f'"version": {INDEX_VERSION},\n'
+            f'"fields": {json.dumps(FIELDS)},\n'
+            '"hymns": {\n' + ',\n'.join(lines) + '\n}\n}\n')
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def scan_mp3_files(mp3_dir):
+    """{곡 번호: 파일 경로} (catalog.hymn_filename 형식 "001_제목.mp3")"""
+    files = {}
+    with os.scandir(mp3_dir) as entries:
+        for entry in entries:
+            match = FILENAME.match(entry.name)
+            if match and entry.is_file():
+                files[int(match.group(1))] = Path(entry.path)
+    return files
+
+
+def completed_hymns(mp3_dir):
+    """progress.json(과 저널)의 완료 곡 번호 (진행 상황 파일이 없으면 None)"""
+    path = Path(mp3_dir) / "progress.json"
+    if not path.exists() and not path.with_suffix('.journal').exists():
+        return None
+    return ProgressStore(path, read_only=True).completed
+
+
+def update_index(mp3_dir, index_path=None, force=False, on_event=None):
+    """
+    바뀐 곡만 다시 읽어 색인 갱신
+    progress.json이 있으면 완료된 곡만 대상 (다운로드 중인 파일은 건너뜀)
+    읽지 못한 곡은 이전 색인 항목을 그대로 유지 (다른 파일이 바뀌었는지와 관계없이 같은 결과)
+    {"index", "updated": [...], "removed": [...], "failed": {곡 번호: 오류}, "seconds"} 반환
+    """
+    mp3_dir = Path(mp3_dir)
+    index_path = Path(index_path) if index_path else mp3_dir / INDEX_NAME
+    start = time.perf_counter()
+    old_index = {} if force else load_index(index_path)
+    files = scan_mp3_files(mp3_dir)
+    completed = completed_hymns(mp3_dir)
+    if completed is not None:
+        files = {no: path for no, path in files.items() if no in completed}
+
+    index, updated, failed = {}, [], {}
+    for no, path in sorted(files.items()):
+        old = old_index.get(no)
+        try:
+            stat = path.stat()
+            if old and old["file"] == path.name and old["size"] == stat.st_size \
+                    and old["mtime_ns"] == stat.st_mtime_ns:
+                index[no] = old
+                continue
+            record = read_mp3_info(path)
+        except (OSError, InvalidMp3) as e:
+            failed[no] = str(e)
+            if old:
+                index[no] = old
+            if on_event:
+                on_event("failed", no, str(e))
+            continue
+        record["file"] = path.name
+        index[no] = record
+        updated.append(no)
+        if on_event:
+            on_event("updated", no, record)
+
+    removed = sorted(set(old_index) - set(index))
+    if updated or removed or not index_path.exists():
+        save_index(index, index_path)
+    return {"index": index, "updated": updated, "removed": removed, "failed": failed,
+            "seconds": time.perf_counter() - start}
+
+
+def join_catalog(hymns, index):
+    """카탈로그 곡 목록(hymns-645-complete.json 등, "no" 필드)에 오디오 메타데이터를 "audio"로 붙임 (없으면 None)"""
+    return [dict(hymn, audio=index.get(hymn["no"])) for hymn in hymns]
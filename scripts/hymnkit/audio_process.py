@@ -0,0 +1,304 @@
+"""
+다운로드한 MP3 후처리 (음량 맞춤, 앞뒤 무음 제거, 미리듣기 생성)
+새로 받았거나 내용이 바뀐 파일만 프로세스 풀에서 처리하고 결과를 manifest.json에 기록
+
+출력 폴더:
+- full/<파일명>:    음량을 맞추고 앞뒤 무음을 뺀 전체 곡
+- preview/<파일명>: 미리듣기 (앞부분 PREVIEW_SECONDS초)
+- manifest.json:    파일마다 원본 SHA-256, 처리 방식, 결과 크기, 걸린 시간
+
+처리 방식:
+- ffmpeg: 설치되어 있으면 silenceremove + loudnorm(EBU R128)으로 다시 인코딩,
+  미리듣기는 모노 저음질(PREVIEW_BITRATE)로 변환
+- frames: 없으면 hymnkit.mp3_edit로 프레임 단위 편집 (다시 인코딩하지 않음)
+  음량은 폴더 전체 곡의 global_gain 중앙값에 맞추고 (manifest에 기준값을 저장해 이후 실행도 같은 기준),
+  미리듣기는 원본 비트레이트 그대로 길이만 자름
+
+파일이 바뀌었는지는 크기/수정 시각이 같으면 그대로 보고, 다르면 SHA-256으로 확인
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from hymnkit import mp3_edit
+from hymnkit.mp3_download import file_sha256
+from hymnkit.mp3_frames import InvalidMp3
+
+MANIFEST_VERSION = 1
+DEFAULT_WORKERS = os.cpu_count() or 4
+SAVE_EVERY = 20                 # manifest를 이 개수마다 저장 (중단되어도 처리한 결과 유지)
+
+TARGET_LUFS = -16.0
+TRUE_PEAK = -1.5
+FULL_BITRATE = "192k"
+PREVIEW_START = 0.0             # 미리듣기 시작 (초, 무음 제거 후 기준)
+PREVIEW_SECONDS = 30.0
+PREVIEW_BITRATE = "64k"
+SILENCE_THRESHOLD = "-50dB"
+MAX_BOOST_STEPS = 4             # frames 방식에서 올릴 수 있는 최대 단계 (6 dB, 클리핑 방지)
+MAX_CUT_STEPS = 16
+
+FFMPEG_ENV = "HYMNKIT_FFMPEG"   # ffmpeg 경로 지정 (비워 두면 PATH에서 찾음, "none"이면 사용 안 함)
+
+
+def find_ffmpeg():
+    """사용할 ffmpeg 경로 (없으면 None)"""
+    configured = os.environ.get(FFMPEG_ENV)
+    if configured:
+        return None if configured.lower() == "none" else configured
+    return shutil.which("ffmpeg")
+
+
+def settings_key(method):
+    """출력에 영향을 주는 설정의 해시 (바뀌면 모든 파일을 다시 처리)"""
+    settings = [method, TARGET_LUFS, TRUE_PEAK, FULL_BITRATE, PREVIEW_START, PREVIEW_SECONDS,
+                PREVIEW_BITRATE, SILENCE_THRESHOLD, mp3_edit.SILENT_BITS, mp3_edit.KEEP_SILENCE,
+                MAX_BOOST_STEPS, MAX_CUT_STEPS]
+    return hashlib.sha256(json.dumps(settings).encode('ascii')).hexdigest()[:16]
+
+
+def load_manifest(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    if manifest.get("version") != MANIFEST_VERSION:
+        manifest = {"version": MANIFEST_VERSION, "files": {}}
+    return manifest
+
+
+def save_manifest(path, manifest):
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+# ----- 파일 하나 처리 (작업자 프로세스) -----
+
+def _run_ffmpeg(ffmpeg, args):
+    result = subprocess.run([ffmpeg, '-hide_banner', '-loglevel', 'error', '-nostdin', '-y', *args],
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg 실패: {result.stderr.strip()[-300:]}")
+
+
+def _process_ffmpeg(ffmpeg, src, full_tmp, preview_tmp):
+    trim = f"silenceremove=start_periods=1:start_threshold={SILENCE_THRESHOLD}:start_silence=0.2"
+    loudnorm = f"loudnorm=I={TARGET_LUFS}:TP={TRUE_PEAK}:LRA=11"
+    # 뒤쪽 무음은 뒤집어서 앞쪽처럼 제거
+    _run_ffmpeg(ffmpeg, ['-i', str(src), '-map_metadata', '0',
+                         '-af', f"{trim},areverse,{trim},areverse,{loudnorm}",
+                         '-ar', '44100', '-codec:a', 'libmp3lame', '-b:a', FULL_BITRATE, '-f', 'mp3',
+                         str(full_tmp)])
+    fade_out = max(PREVIEW_SECONDS - 2, 0)
+    _run_ffmpeg(ffmpeg, ['-ss', str(PREVIEW_START), '-i', str(full_tmp), '-t', str(PREVIEW_SECONDS),
+                         '-af', f"afade=t=in:d=0.5,afade=t=out:st={fade_out}:d=2",
+                         '-ac', '1', '-codec:a', 'libmp3lame', '-b:a', PREVIEW_BITRATE, '-f', 'mp3',
+                         str(preview_tmp)])
+    return {}
+
+
+def _process_frames(src, full_tmp, preview_tmp, gain_target):
+    data = Path(src).read_bytes()
+    head, frames, tail = mp3_edit.read_frames(data)
+    start, end = mp3_edit.trim_range(data, frames)
+    kept = frames[start:end]
+    steps = 0
+    median = mp3_edit.median_gain(data, kept)
+    if median is not None and gain_target is not None:
+        steps = min(max(round(gain_target - median), -MAX_CUT_STEPS), MAX_BOOST_STEPS)
+    full_tmp.write_bytes(mp3_edit.build(data, kept, head, tail, steps))
+    preview = mp3_edit.clip(kept, PREVIEW_START, PREVIEW_SECONDS)
+    preview_tmp.write_bytes(mp3_edit.build(data, preview, steps=steps))
+    per_frame = mp3_edit.frame_seconds(frames[0][1])
+    return {"gain_db": steps * mp3_edit.GAIN_STEP_DB,
+            "trimmed_seconds": round((len(frames) - len(kept)) * per_frame, 2)}
+
+
+def process_file(task):
+    """
+    작업 하나 처리: {"src", "full", "preview", "method", "ffmpeg", "gain_target"}
+    반환: {"src", "ok", "seconds", "bytes_in", "full_bytes", "preview_bytes", "error", ...}
+    """
+    start = time.perf_counter()
+    src, full, preview = Path(task["src"]), Path(task["full"]), Path(task["preview"])
+    result = {"src": str(src), "ok": False, "bytes_in": 0, "error": None}
+    full_tmp = full.with_name(full.name + '.tmp')
+    preview_tmp = preview.with_name(preview.name + '.tmp')
+    try:
+        result["bytes_in"] = src.stat().st_size      # 그 사이 원본이 지워지거나 바뀌어도 실패로만 기록
+        if task["method"] == "ffmpeg":
+            result.update(_process_ffmpeg(task["ffmpeg"], src, full_tmp, preview_tmp))
+        else:
+            result.update(_process_frames(src, full_tmp, preview_tmp, task["gain_target"]))
+        os.replace(full_tmp, full)
+        os.replace(preview_tmp, preview)
+    except (OSError, RuntimeError, InvalidMp3) as e:
+        result["error"] = str(e)
+        for path in (full_tmp, preview_tmp):
+            if path.exists():
+                os.remove(path)
+    else:
+        result.update(ok=True, full_bytes=full.stat().st_size, preview_bytes=preview.stat().st_size)
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def analyze_gain(src):
+    """frames 방식 기준값 계산용: (경로, 무음을 뺀 global_gain 중앙값 또는 None)"""
+    try:
+        data = Path(src).read_bytes()
+        _, frames, _ = mp3_edit.read_frames(data)
+    except (OSError, InvalidMp3):
+        return str(src), None
+    start, end = mp3_edit.trim_range(data, frames)
+    return str(src), mp3_edit.median_gain(data, frames[start:end])
+
+
+# ----- 폴더 전체 -----
+
+def changed_files(src_dir, manifest, settings, out_dir):
+    """
+    다시 처리해야 하는 파일 목록 [(경로, SHA-256)]
+    크기/수정 시각이 manifest와 같고 출력이 있으면 해시 계산 없이 건너뜀
+    """
+    todo = []
+    for path in sorted(Path(src_dir).glob("*.mp3")):
+        entry = manifest["files"].get(path.name)
+        outputs_exist = (out_dir / "full" / path.name).exists() and (out_dir / "preview" / path.name).exists()
+        try:
+            stat = path.stat()
+            if entry and entry.get("settings") == settings and outputs_exist:
+                if entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+                    continue
+                digest = file_sha256(path).hexdigest()
+                if digest == entry.get("sha256"):
+                    entry.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)     # 내용은 같고 시각만 바뀜
+                    continue
+            else:
+                digest = file_sha256(path).hexdigest()
+        except OSError:
+            continue        # 목록을 만든 뒤 지워진 파일 (다음 실행에서 정리)
+        todo.append((path, digest))
+    return todo
+
+
+def remove_stale(src_dir, out_dir, manifest):
+    """원본이 없어진 파일의 출력(full/, preview/)과 manifest 항목 삭제, 삭제한 파일 이름 목록 반환"""
+    sources = {path.name for path in Path(src_dir).glob("*.mp3")}
+    stale = {name for name in manifest["files"] if name not in sources}
+    for kind in ("full", "preview"):
+        stale.update(path.name for path in (out_dir / kind).glob("*.mp3") if path.name not in sources)
+    for name in stale:
+        manifest["files"].pop(name, None)
+        for kind in ("full", "preview"):
+            path = out_dir / kind / name
+            if path.exists():
+                os.remove(path)
+    return sorted(stale)
+
+
+def process_mirror(src_dir, out_dir, workers=DEFAULT_WORKERS, use_ffmpeg=True, on_result=None):
+    """
+    src_dir의 새/변경 MP3를 처리
+    반환: {"method", "processed", "failed", "skipped", "removed", "bytes_in", "seconds", "results"}
+    on_result(result): 파일 하나가 끝날 때마다 호출
+    """
+    src_dir, out_dir = Path(src_dir), Path(out_dir)
+    (out_dir / "full").mkdir(parents=True, exist_ok=True)
+    (out_dir / "preview").mkdir(parents=True, exist_ok=True)
+    manifest_path = out_dir / "manifest.json"
+    manifest = load_manifest(manifest_path)
+
+    ffmpeg = find_ffmpeg() if use_ffmpeg else None
+    method = "ffmpeg" if ffmpeg else "frames"
+    settings = settings_key(method)
+    started = time.perf_counter()
+    removed = remove_stale(src_dir, out_dir, manifest)
+    todo = changed_files(src_dir, manifest, settings, out_dir)
+    total_files = len(list(src_dir.glob("*.mp3")))
+    summary = {"method": method, "processed": 0, "failed": 0, "skipped": max(total_files - len(todo), 0),
+               "removed": len(removed), "bytes_in": 0, "results": []}
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        if method == "frames" and todo and manifest.get("gain_target") is None:
+            # 첫 실행: 폴더 전체 곡의 중앙값을 기준으로 정함
+            medians = [median for _, median in pool.map(analyze_gain, sorted(src_dir.glob("*.mp3")), chunksize=8)
+                       if median is not None]
+            if medians:
+                medians.sort()
+                manifest["gain_target"] = medians[len(medians) // 2]
+
+        # 같은 내용(하드링크 포함)은 한 번만 처리하고 나머지 이름에는 결과를 연결
+        by_digest = {}
+        for path, digest in todo:
+            by_digest.setdefault(digest, []).append(path)
+        futures = {}
+        for digest, paths in by_digest.items():
+            task = {"src": str(paths[0]), "full": str(out_dir / "full" / paths[0].name),
+                    "preview": str(out_dir / "preview" / paths[0].name), "method": method,
+                    "ffmpeg": ffmpeg, "gain_target": manifest.get("gain_target")}
+            futures[pool.submit(process_file, task)] = (digest, paths)
+
+        try:
+            for finished, future in enumerate(as_completed(futures), 1):
+                digest, paths = futures[future]
+                result = _collect(future, paths, digest, out_dir, manifest, settings, method)
+                summary["results"].append(result)
+                summary["bytes_in"] += result["bytes_in"]
+                summary["processed" if result["ok"] else "failed"] += 1
+                if on_result:
+                    on_result(result)
+                if finished % SAVE_EVERY == 0:
+                    save_manifest(manifest_path, manifest)
+        finally:
+            save_manifest(manifest_path, manifest)     # 중단되어도 끝난 파일의 기록은 남김
+
+    summary["seconds"] = time.perf_counter() - started
+    return summary
+
+
+def _collect(future, paths, digest, out_dir, manifest, settings, method):
+    """작업 결과를 manifest에 반영 (작업자 오류나 그 사이 지워진 원본은 실패 결과로 바꿈)"""
+    try:
+        result = future.result()
+        if result["ok"]:
+            entries = {}
+            for path in paths:
+                if path != paths[0]:
+                    for kind in ("full", "preview"):
+                        _link(out_dir / kind / paths[0].name, out_dir / kind / path.name)
+                stat = path.stat()
+                entries[path.name] = {
+                    "sha256": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns,
+                    "settings": settings, "method": method, "seconds": round(result["seconds"], 3),
+                    "full_bytes": result["full_bytes"], "preview_bytes": result["preview_bytes"],
+                    **{key: result[key] for key in ("gain_db", "trimmed_seconds") if key in result},
+                }
+            manifest["files"].update(entries)
+            return result
+    except Exception as e:      # 작업자 프로세스 비정상 종료(BrokenProcessPool) 포함
+        result = {"src": str(paths[0]), "ok": False, "bytes_in": 0, "seconds": 0.0,
+                  "error": f"{type(e).__name__}: {e}"}
+    for path in paths:
+        manifest["files"].pop(path.name, None)
+    return result
+
+
+def _link(src, dst):
+    tmp_path = dst.with_name(dst.name + '.link')
+    if tmp_path.exists():
+        os.remove(tmp_path)
+    try:
+        os.link(src, tmp_path)
+    except OSError:
+        shutil.copyfile(src, tmp_path)
+    os.replace(tmp_path, dst)
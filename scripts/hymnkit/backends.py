@@ -0,0 +1,127 @@
+"""
+다운로드 방식(backend)
+모든 방식이 같은 작업 목록과 결과 콜백을 사용하므로
+진행 상황 저장, 재시도, 캐시, 중복 제거는 hymnkit.cli의 공용 스케줄러가 한 번만 처리
+
+- requests: 한 곡씩 순서대로 (공유 Session, 페이지 캐시, 스트리밍 추출)
+- async: asyncio 엔진으로 페이지 추출과 MP3 다운로드를 여러 곡에 걸쳐 동시에 실행
+- selenium: 브라우저 작업자 프로세스 풀 (JS로 그려지는 페이지용)
+
+작업: {"no", "title", "url", "filepath"} 딕셔너리
+on_result(hymn_no, job, mp3_url, error): 곡마다 호출 (성공이면 error는 None)
+"""
+
+from hymnkit import metrics
+from hymnkit.async_engine import DEFAULT_PER_HOST, run_pipeline
+from hymnkit.mp3_download import fetch_mp3
+from hymnkit.mp3_extract import fetch_mp3_url
+from hymnkit.retry_queue import DownloadFailure, NO_MP3_LINK
+
+
+class DownloadContext:
+    """모든 방식이 함께 쓰는 페이지 캐시와 MP3 저장소"""
+
+    def __init__(self, page_cache, blob_store):
+        self.page_cache = page_cache
+        self.blob_store = blob_store
+
+    def extract_mp3_url(self, page_url):
+        """페이지에서 MP3 URL 추출 (MP3 링크를 찾으면 나머지 본문은 받지 않음)"""
+        with metrics.timer(metrics.PAGE):
+            return fetch_mp3_url(page_url, cache=self.page_cache, timeout=30)
+
+    def download_mp3(self, mp3_url, filepath):
+        """MP3 다운로드 (조건부 요청, 이어받기, 중복 음원 연결, 실패 시 예외)"""
+        with metrics.timer(metrics.TRANSFER):
+            return fetch_mp3(mp3_url, filepath, store=self.blob_store)
+
+
+class RequestsBackend:
+    """한 곡씩 순서대로 처리"""
+
+    name = "requests"
+    default_concurrency = 1
+
+    def __init__(self, context, concurrency=None):
+        self.context = context
+
+    def run(self, jobs, on_result):
+        for job in jobs:
+            mp3_url = None
+            with metrics.hymn(job["no"]):
+                try:
+                    with metrics.timer(metrics.HYMN):
+                        mp3_url = self.context.extract_mp3_url(job["url"])
+                        if not mp3_url:
+                            raise DownloadFailure(NO_MP3_LINK)
+                        self.context.download_mp3(mp3_url, job["filepath"])
+                except Exception as e:
+                    on_result(job["no"], job, mp3_url, e)
+                    continue
+            on_result(job["no"], job, mp3_url, None)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+class AsyncBackend(RequestsBackend):
+    """asyncio 엔진으로 여러 곡을 동시에 처리"""
+
+    name = "async"
+    default_concurrency = 8
+
+    def __init__(self, context, concurrency=None, per_host=DEFAULT_PER_HOST):
+        super().__init__(context)
+        self.concurrency = concurrency or self.default_concurrency
+        self.per_host = per_host
+
+    def run(self, jobs, on_result):
+        run_pipeline(jobs, self.context.extract_mp3_url, self.context.download_mp3, on_result,
+                     concurrency=self.concurrency, per_host=self.per_host)
+
+
+class SeleniumBackend(RequestsBackend):
+    """브라우저 작업자 프로세스 풀 (재시도 사이에도 브라우저를 유지)"""
+
+    name = "selenium"
+    default_concurrency = 4
+
+    def __init__(self, context, concurrency=None, on_event=None):
+        super().__init__(context)
+        self.concurrency = concurrency or self.default_concurrency
+        self.on_event = on_event
+        self._pool = None
+
+    def __enter__(self):
+        # selenium은 이 방식을 쓸 때만 필요
+        from hymnkit.browser_pool import BrowserPool
+        store_dir = self.context.blob_store.root if self.context.blob_store else None
+        self._pool = BrowserPool(self.concurrency, on_event=self.on_event, store_dir=store_dir)
+        self._pool.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._pool.close()
+
+    def run(self, jobs, on_result):
+        jobs_by_no = {job["no"]: job for job in jobs}
+        for job in jobs:
+            self._pool.submit(job)
+        while self._pool.outstanding:
+            result = self._pool.next_result()
+            # 작업자 프로세스에서 잰 시간 반영 (연결/TTFB는 곡 단위 합계로 전달됨)
+            with metrics.hymn(result["no"]):
+                for phase, seconds in result["timings"].items():
+                    metrics.record(phase, seconds)
+            metrics.add_bytes(result["bytes"])
+            error = result["error"]
+            if error is not None:
+                # 작업자 프로세스에서 판단한 분류와 일시적 실패 여부를 그대로 사용
+                error = DownloadFailure(error["kind"], error["message"], transient=error["transient"])
+            on_result(result["no"], jobs_by_no[result["no"]], result["mp3_url"], error)
+
+
+BACKENDS = {backend.name: backend for backend in (RequestsBackend, AsyncBackend, SeleniumBackend)}
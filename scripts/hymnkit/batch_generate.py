@@ -0,0 +1,199 @@
+"""
+찬송가 Suno 프롬프트 일괄 생성 (브라우저 없이 실행)
+components/BatchGenerator.tsx의 곡마다 순서대로 기다리는 방식 대신
+여러 곡을 동시에 요청하고, 끝난 곡부터 JSON Lines 파일에 한 줄씩 바로 기록
+
+- 응답 캐시: 곡 번호 + 설정 해시(prefs_hash)마다 파일 하나 (같은 설정으로 다시 돌리면 요청하지 않음)
+- 출력: 한 줄에 HistoryItem 하나 (앱의 기록에 그대로 넣을 수 있는 형식 + hymnNo, prefsHash)
+- 이어하기: 출력 파일에 같은 곡, 같은 설정 해시가 이미 있으면 건너뜀
+  (기록 중에 중단되어 마지막 줄이 잘렸으면 그 줄은 버리고 이어서 기록)
+"""
+
+import hashlib
+import json
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from hymnkit.hymn_catalog import load_catalog, merge_sources
+from hymnkit.prompt_backends import DEFAULT_PREFERENCES, GenerationError
+
+DEFAULT_CONCURRENCY = 4
+MAX_ATTEMPTS = 3
+RETRY_DELAY = 2.0           # 첫 재시도 대기 (초, 이후 2배씩)
+
+
+def preferences_hash(prefs, backend_key):
+    """곡 설정 + 생성 방식/모델의 SHA-256 (앞 16자리)"""
+    data = json.dumps({"backend": backend_key, "prefs": prefs}, ensure_ascii=False,
+                      sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()[:16]
+
+
+def hymn_preferences(hymn, overrides=None):
+    """BatchGenerator와 같은 곡별 설정 (hymnTheme = 한국어 제목)"""
+    prefs = dict(DEFAULT_PREFERENCES, **(overrides or {}))
+    prefs["hymnTheme"] = hymn["ko"]
+    return prefs
+
+
+def load_hymns(path=None):
+    """
+    곡 레코드 목록 (번호순)
+    path가 없으면 통합 카탈로그(data/hymn_catalog.json, 없으면 원본을 합쳐서 사용)
+    path는 카탈로그 형식 {"hymns": [...]}과 data/hymns-*.json 같은 레코드 배열 모두 가능
+    """
+    if path is None:
+        catalog = load_catalog()
+        records = catalog["hymns"] if catalog else merge_sources()
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        records = data["hymns"] if isinstance(data, dict) else data
+    return sorted(({**record, "no": int(record["no"])} for record in records), key=lambda r: r["no"])
+
+
+class ResponseCache:
+    """생성 응답을 곡 번호 + 설정 해시별 JSON 파일로 보관"""
+
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, no, prefs_hash):
+        return self.cache_dir / f"{no:03d}-{prefs_hash}.json"
+
+    def get(self, no, prefs_hash):
+        try:
+            with open(self._path(no, prefs_hash), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return data
+
+    def put(self, no, prefs_hash, data):
+        """임시 파일에 쓴 뒤 교체 (여러 스레드에서 동시에 호출 가능)"""
+        path = self._path(no, prefs_hash)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{id(data)}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def format_stats(self):
+        return f"🗃️  응답 캐시: 적중 {self.hits}, 새로 요청 {self.misses}"
+
+
+def completed_entries(out_path):
+    """
+    출력 파일에 이미 있는 (곡 번호, 설정 해시) 집합
+    마지막 줄이 잘려 있으면 파일을 마지막 완전한 줄까지 자름
+    """
+    out_path = Path(out_path)
+    done = set()
+    if not out_path.exists():
+        return done
+    with open(out_path, 'rb+') as f:
+        valid_end = 0
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            valid_end += len(line)
+            try:
+                item = json.loads(line)
+            except ValueError:
+                continue
+            done.add((item.get("hymnNo"), item.get("prefsHash")))
+        f.truncate(valid_end)
+    return done
+
+
+def history_item(no, prefs_hash, data):
+    """응답 → 앱 기록(HistoryItem) 형식"""
+    timestamp = int(time.time() * 1000)
+    return {
+        **data,
+        "lyrics": data.get("multiLyrics", {}).get("en"),
+        "multiCovers": {"ko": None, "en": None, "es": None},
+        "id": f"batch-{timestamp}-{no}",
+        "timestamp": timestamp,
+        "hymnNo": no,
+        "prefsHash": prefs_hash,
+    }
+
+
+def _generate_with_retry(backend, prefs, attempts, retry_delay):
+    """재시도할 만한 오류면 지수 백오프 + 지터 후 다시 요청"""
+    for attempt in range(1, attempts + 1):
+        try:
+            return backend.generate(prefs), attempt
+        except GenerationError as e:
+            if not e.retryable or attempt == attempts:
+                raise
+            delay = retry_delay * 2 ** (attempt - 1)
+            time.sleep(random.uniform(delay / 2, delay))
+
+
+def run_batch(hymns, backend, out_path, cache, concurrency=DEFAULT_CONCURRENCY, overrides=None,
+              attempts=MAX_ATTEMPTS, retry_delay=RETRY_DELAY, on_event=print):
+    """
+    곡마다 프롬프트를 생성해 out_path에 JSON Lines로 추가
+    반환: {"generated", "cached", "skipped", "failed": [(곡 번호, 오류)]}
+    """
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    done = completed_entries(out_path)
+    stats = {"generated": 0, "cached": 0, "skipped": 0, "failed": []}
+
+    pending = []
+    with open(out_path, 'a', encoding='utf-8', newline='\n') as out:
+        def write(no, prefs_hash, data):
+            out.write(json.dumps(history_item(no, prefs_hash, data), ensure_ascii=False) + '\n')
+            out.flush()
+
+        for hymn in hymns:
+            prefs = hymn_preferences(hymn, overrides)
+            prefs_hash = preferences_hash(prefs, backend.cache_key)
+            if (hymn["no"], prefs_hash) in done:
+                stats["skipped"] += 1
+                continue
+            cached = cache.get(hymn["no"], prefs_hash)
+            if cached is not None:
+                write(hymn["no"], prefs_hash, cached)
+                stats["cached"] += 1
+                continue
+            pending.append((hymn["no"], prefs, prefs_hash))
+
+        if stats["skipped"] or stats["cached"]:
+            on_event(f"⏭️  이미 기록됨 {stats['skipped']}곡, 캐시에서 기록 {stats['cached']}곡")
+        if not pending:
+            return stats
+        on_event(f"🚀 {len(pending)}곡 생성 시작 (동시 {concurrency}개, {backend.name})")
+
+        pool = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            futures = {pool.submit(_generate_with_retry, backend, prefs, attempts, retry_delay): (no, prefs_hash)
+                       for no, prefs, prefs_hash in pending}
+            for finished, future in enumerate(as_completed(futures), 1):
+                no, prefs_hash = futures[future]
+                progress = f"[{finished}/{len(pending)}]"
+                try:
+                    data, attempt = future.result()
+                except Exception as e:
+                    stats["failed"].append((no, e))
+                    on_event(f"{progress} ❌ {no}장: {e}")
+                    continue
+                cache.put(no, prefs_hash, data)
+                write(no, prefs_hash, data)
+                stats["generated"] += 1
+                retried = f" (시도 {attempt}회)" if attempt > 1 else ""
+                on_event(f"{progress} ✅ {no}장: {data.get('title')}{retried}")
+        finally:
+            # 중단(Ctrl+C)되면 시작하지 않은 요청은 취소하고 이미 기록한 줄은 유지
+            pool.shutdown(wait=True, cancel_futures=True)
+    return stats
@@ -0,0 +1,129 @@
+"""
+MP3 내용 주소(SHA-256) 기반 저장소
+같은 음원은 blobs/<해시 앞 2자리>/<해시>.mp3에 한 번만 저장하고
+{번호:03d}_{제목}.mp3 파일은 그 blob을 가리키는 하드링크로 만듦
+(하드링크를 만들 수 없는 파일 시스템이면 복사)
+
+- index.jsonl: URL, ETag, 파일 이름 → 해시 기록 (추가 전용, 여러 프로세스가 함께 써도 줄 단위로 안전)
+- 이미 해시를 아는 URL은 다운로드하지 않고 blob을 바로 연결
+"""
+
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+
+
+class BlobStore:
+    """내용 해시 기준 MP3 저장소"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.blobs_dir = self.root / "blobs"
+        self.index_path = self.root / "index.jsonl"
+        self.blobs_dir.mkdir(parents=True, exist_ok=True)
+        self.linked = 0             # 다운로드 없이 연결한 파일 수
+        self.deduplicated = 0       # 받은 뒤 기존 blob과 같아서 합친 파일 수
+        self.bytes_saved = 0
+        self._by_url = {}
+        self._by_name = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        if not self.index_path.exists():
+            return
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if entry.get("url"):
+                    self._by_url[entry["url"]] = entry
+                if entry.get("name"):
+                    self._by_name[entry["name"]] = entry["sha256"]
+
+    def _record(self, entry):
+        with open(self.index_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def blob_path(self, digest):
+        return self.blobs_dir / digest[:2] / f"{digest}.mp3"
+
+    def lookup(self, url):
+        """URL의 blob 정보 반환 (모르는 URL이거나 blob이 없으면 None)"""
+        entry = self._by_url.get(url)
+        if entry and self.blob_path(entry["sha256"]).exists():
+            return entry
+        return None
+
+    def _materialize(self, digest, filepath):
+        """blob을 filepath에 하드링크(안 되면 복사)로 만들고 제자리로 교체"""
+        tmp_path = filepath.with_name(filepath.name + '.link')
+        if tmp_path.exists():
+            os.remove(tmp_path)
+        try:
+            os.link(self.blob_path(digest), tmp_path)
+        except OSError:
+            shutil.copyfile(self.blob_path(digest), tmp_path)
+        os.replace(tmp_path, filepath)
+
+    def link(self, url, filepath):
+        """이미 받은 URL이면 다운로드 없이 filepath에 연결하고 blob 정보 반환 (모르면 None)"""
+        filepath = Path(filepath)
+        with self._lock:
+            entry = self.lookup(url)
+            if entry is None:
+                return None
+            self._materialize(entry["sha256"], filepath)
+            self.linked += 1
+            if self._by_name.get(filepath.name) != entry["sha256"]:
+                self._by_name[filepath.name] = entry["sha256"]
+                self._record({"name": filepath.name, "sha256": entry["sha256"]})
+        return entry
+
+    def add(self, filepath, digest, url=None, meta=None):
+        """
+        받은 파일을 저장소에 등록
+        같은 해시의 blob이 이미 있으면 filepath를 그 blob의 링크로 바꿔 공간 절약
+        meta: blob 정보와 함께 기록할 ETag/Last-Modified/Content-Length
+        """
+        filepath = Path(filepath)
+        blob = self.blob_path(digest)
+        with self._lock:
+            if blob.exists():
+                if not os.path.samefile(blob, filepath):
+                    size = filepath.stat().st_size
+                    self._materialize(digest, filepath)
+                    self.deduplicated += 1
+                    self.bytes_saved += size
+            else:
+                blob.parent.mkdir(exist_ok=True)
+                try:
+                    os.link(filepath, blob)
+                except FileExistsError:
+                    # 다른 프로세스가 방금 같은 blob을 만듦
+                    self._materialize(digest, filepath)
+                except OSError:
+                    tmp_path = blob.with_name(f"{blob.name}.{os.getpid()}.tmp")
+                    shutil.copyfile(filepath, tmp_path)
+                    os.replace(tmp_path, blob)
+
+            entry = {"name": filepath.name, "sha256": digest}
+            if url and self._by_url.get(url, {}).get("sha256") != digest:
+                entry["url"] = url
+                for key in ("etag", "last_modified", "content_length"):
+                    if meta and meta.get(key) is not None:
+                        entry[key] = meta[key]
+                self._by_url[url] = entry
+            elif self._by_name.get(filepath.name) == digest:
+                return
+            self._by_name[filepath.name] = digest
+            self._record(entry)
+
+    def format_stats(self):
+        """실행 종료 시 출력할 중복 제거 통계 문자열"""
+        return (f"🧬 중복 음원: 다운로드 생략 {self.linked}곡, 받은 뒤 합침 {self.deduplicated}곡 "
+                f"({self.bytes_saved / (1024 * 1024):.1f} MB 절약)")
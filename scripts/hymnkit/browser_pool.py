@@ -0,0 +1,265 @@
+"""
+Selenium 브라우저 작업자 풀
+JS로 그려지는 찬송가 페이지를 여러 headless Chrome에서 동시에 처리
+작업자마다 별도 프로세스에서 브라우저 하나를 띄우고, 공유 작업 큐에서 찬송가를 하나씩 가져감
+
+- 고정 sleep 대신 <audio> src가 생길 때까지만 대기 (WebDriverWait)
+- 이미지, 폰트, CSS 요청은 차단하여 페이지 로딩 시간 단축
+- 예외 객체는 프로세스 간에 그대로 넘기기 어려우므로 실패 분류 문자열로 결과 전달
+- 작업자는 곡을 시작할 때 공유 메모리의 자기 칸에 작업 번호를 적어 두므로, 작업자 프로세스가 죽으면
+  처리 중이던 곡을 일시적 실패 결과로 돌려줌 (재시도는 호출하는 쪽의 재시도 큐에서)
+- store_dir를 주면 작업자마다 같은 폴더의 BlobStore를 열어 중복 음원을 한 번만 저장
+"""
+
+import collections
+import multiprocessing
+import queue
+import time
+from urllib.parse import urljoin
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.support.ui import WebDriverWait
+
+from hymnkit import http_client, metrics
+from hymnkit.blob_store import BlobStore
+from hymnkit.mp3_download import fetch_mp3
+from hymnkit.rate_limiter import AdaptiveRateLimiter, DEFAULT_RATE, MAX_RATE
+from hymnkit.retry_queue import (DownloadFailure, NETWORK_TIMEOUT, NO_MP3_LINK, OTHER,
+                                 classify, is_transient)
+
+# 기본 설정
+DEFAULT_WORKERS = 4         # 동시에 띄울 브라우저 수
+PAGE_LOAD_TIMEOUT = 30      # driver.get 제한 시간 (초)
+AUDIO_WAIT_TIMEOUT = 15     # <audio> src가 나타날 때까지 기다릴 최대 시간 (초)
+RESULT_POLL = 1.0           # 결과 대기 중 작업자 생존 여부를 확인하는 간격 (초)
+
+# 페이지 로딩에 필요 없는 리소스 (CDP Network.setBlockedURLs 패턴)
+BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.css", "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+]
+
+_AUDIO_SRC_SCRIPT = """
+    const audio = document.querySelector('audio');
+    if (audio && audio.src) return audio.src;
+    const source = document.querySelector('audio source');
+    if (source && source.src) return source.src;
+    return null;
+"""
+
+
+def create_driver():
+    """리소스 차단 설정을 한 headless Chrome 생성"""
+    options = Options()
+    options.add_argument('--headless')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    # DOMContentLoaded까지만 기다리고 나머지는 WebDriverWait로 확인
+    options.page_load_strategy = 'eager'
+    options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.managed_default_content_settings.fonts': 2,
+    })
+
+    driver = webdriver.Chrome(options=options)
+    driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URLS})
+    except WebDriverException:
+        # CDP를 지원하지 않는 드라이버면 이미지 차단 설정만 적용
+        pass
+    return driver
+
+
+def find_mp3_url(driver, page_url, wait_timeout=AUDIO_WAIT_TIMEOUT):
+    """페이지를 열고 <audio> src가 생길 때까지 기다려 MP3 URL 반환 (실패 시 DownloadFailure)"""
+    try:
+        driver.get(page_url)
+    except TimeoutException:
+        raise DownloadFailure(NETWORK_TIMEOUT, f"페이지 로딩 {PAGE_LOAD_TIMEOUT}초 초과")
+
+    try:
+        mp3_url = WebDriverWait(driver, wait_timeout, poll_frequency=0.2).until(
+            lambda d: d.execute_script(_AUDIO_SRC_SCRIPT))
+    except TimeoutException:
+        raise DownloadFailure(NO_MP3_LINK)
+    return urljoin(page_url, mp3_url)
+
+
+def _process(driver, job, store=None):
+    """찬송가 한 곡 처리 후 결과 딕셔너리 반환 (단계별 소요 시간과 받은 바이트 수 포함)"""
+    result = {"no": job["no"], "mp3_url": None, "error": None, "timings": {}, "bytes": 0}
+    timings = result["timings"]
+    collector = metrics.Metrics()
+    metrics.set_active(collector)
+    start = time.perf_counter()
+    try:
+        result["mp3_url"] = find_mp3_url(driver, job["url"])
+        timings[metrics.PAGE] = time.perf_counter() - start
+        transfer_start = time.perf_counter()
+        try:
+            result["status"] = fetch_mp3(result["mp3_url"], job["filepath"], store=store)
+        finally:
+            timings[metrics.TRANSFER] = time.perf_counter() - transfer_start
+    except Exception as e:
+        result["error"] = {"kind": classify(e), "transient": is_transient(e), "message": str(e)}
+    finally:
+        metrics.set_active(None)
+    timings[metrics.HYMN] = time.perf_counter() - start
+    # 작업자 안에서 잰 연결/TTFB/추출 시간도 곡 단위 합계로 전달
+    for phase, stats in collector.summary()["phases"].items():
+        timings.setdefault(phase, stats["sum"])
+    result["bytes"] = collector.bytes
+    return result
+
+
+def _quit(driver):
+    try:
+        driver.quit()
+    except WebDriverException:
+        pass        # 이미 죽은 브라우저
+
+
+def _worker_main(worker_id, workers, tasks, results, current, store_dir=None):
+    """작업자 프로세스: 브라우저 하나로 큐가 빌 때까지(None을 받을 때까지) 처리"""
+    # 프로세스마다 속도 제한기가 따로 있으므로 전체 속도를 작업자 수로 나눔
+    http_client.set_rate_limiter(AdaptiveRateLimiter(rate=DEFAULT_RATE / workers,
+                                                     max_rate=MAX_RATE / workers))
+    store = BlobStore(store_dir) if store_dir else None
+    driver = None
+    try:
+        driver = create_driver()
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            seq, job = task
+            current[worker_id] = seq    # 결과 큐와 달리 바로 반영되므로 프로세스가 죽어도 풀이 알 수 있음
+            result = _process(driver, job, store)
+            result["seq"] = seq
+            results.put(result)
+            if result["error"] and result["error"]["kind"] not in (NETWORK_TIMEOUT, NO_MP3_LINK):
+                # 브라우저가 죽었을 수 있으므로 상태 확인 후 필요하면 다시 띄움
+                try:
+                    driver.current_url
+                except WebDriverException:
+                    _quit(driver)
+                    driver = None
+                    driver = create_driver()
+    except Exception as e:
+        # 브라우저 시작/재시작 실패 등: 풀이 이 작업자를 빼고 계속하도록 알림
+        results.put({"worker": worker_id, "fatal": str(e)})
+    finally:
+        if driver is not None:
+            _quit(driver)
+
+
+class BrowserPool:
+    """
+    브라우저 작업자 프로세스 풀
+
+    submit(job): {"no", "title", "url", "filepath"} 작업 추가
+    next_result(): 끝난 곡 하나의 결과를 기다려 반환
+        {"no", "mp3_url", "status", "error", "timings", "bytes"}
+        error는 None 또는 {"kind", "transient", "message"}, timings는 {단계: 초}
+    """
+
+    def __init__(self, workers=DEFAULT_WORKERS, on_event=None, store_dir=None):
+        self.workers = workers
+        self.store_dir = store_dir
+        self.on_event = on_event or (lambda message: None)
+        self.outstanding = 0
+        self._tasks = multiprocessing.Queue()
+        self._results = multiprocessing.Queue()
+        self._processes = []
+        self._alive = 0
+        self._current = multiprocessing.Array('q', workers, lock=False)    # 작업자마다 마지막으로 시작한 작업 번호
+        self._pending = {}          # 결과를 받지 않은 작업 번호 → 곡 번호
+        self._seq = 0
+        self._lost = collections.deque()    # 죽은 작업자의 곡 (실패 결과로 돌려줄 것)
+        self._stopped = set()       # 종료를 처리한 작업자 번호
+
+    def start(self):
+        for worker_id in range(self.workers):
+            process = multiprocessing.Process(
+                target=_worker_main,
+                args=(worker_id, self.workers, self._tasks, self._results, self._current, self.store_dir),
+                daemon=True)
+            process.start()
+            self._processes.append(process)
+        self._alive = self.workers
+        return self
+
+    def submit(self, job):
+        self._seq += 1
+        self._pending[self._seq] = job["no"]
+        self._tasks.put((self._seq, job))
+        self.outstanding += 1
+
+    def next_result(self):
+        while True:
+            try:
+                result = self._results.get(timeout=RESULT_POLL)
+            except queue.Empty:
+                self._check_workers()
+                if self._lost:
+                    self.outstanding -= 1
+                    return self._lost.popleft()
+                if self._alive == 0:
+                    raise RuntimeError("브라우저 작업자가 모두 종료되었습니다")
+                continue
+
+            if "fatal" in result:
+                self.on_event(f"  ⚠️  작업자 {result['worker']} 브라우저 시작 실패: {result['fatal']}")
+                self._stop_worker(result["worker"])
+                continue
+
+            if self._pending.pop(result.pop("seq"), None) is None:
+                continue        # 작업자가 죽은 것으로 보고 이미 실패로 돌려준 작업
+            self.outstanding -= 1
+            return result
+
+    def _stop_worker(self, worker):
+        if worker not in self._stopped:
+            self._stopped.add(worker)
+            self._alive -= 1
+
+    def _check_workers(self):
+        """
+        죽은 작업자 정리: 그 작업자가 가져간 뒤 결과가 오지 않은 곡을 일시적 실패 결과로 _lost에 추가
+        (결과를 큐에 넣은 직후 죽으면 전송되지 않은 이전 결과도 잃을 수 있으므로,
+         죽은 작업자가 마지막으로 시작한 작업 이하 중 살아 있는 작업자가 처리 중이 아닌 것은 모두 잃은 것으로 봄)
+        """
+        dead = [worker for worker, process in enumerate(self._processes)
+                if worker not in self._stopped and not process.is_alive()]
+        if not dead:
+            return
+        for worker in dead:
+            self.on_event(f"  ⚠️  작업자 {worker} 프로세스 종료 (exit code {self._processes[worker].exitcode})")
+            self._stop_worker(worker)
+        last = max(self._current[worker] for worker in dead)
+        running = {self._current[worker] for worker in range(self.workers) if worker not in self._stopped}
+        for seq in sorted(seq for seq in self._pending if seq <= last and seq not in running):
+            self._lost.append({"no": self._pending.pop(seq), "mp3_url": None, "timings": {}, "bytes": 0,
+                               "error": {"kind": OTHER, "transient": True,
+                                         "message": "브라우저 작업자 프로세스가 종료됨"}})
+
+    def close(self):
+        """작업자에게 종료 신호를 보내고 프로세스 정리"""
+        for _ in self._processes:
+            self._tasks.put(None)
+        for process in self._processes:
+            process.join(timeout=30)
+            if process.is_alive():
+                process.terminate()
+        self._processes = []
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
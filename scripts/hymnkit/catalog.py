@@ -0,0 +1,99 @@
+"""
+찬송가 목록과 파일 이름
+라이즌 사이트 목록 페이지에서 찬송가 링크를 추출하고,
+모든 다운로드 방식이 같은 규칙({번호:03d}_{제목}.mp3)으로 파일 이름을 정함
+저장된 링크가 있으면 목록 페이지를 조건부 요청으로 확인해 바뀐 경우에만 다시 추출하고
+새로 생기거나 주소가 바뀐 곡만 알려줌
+"""
+
+import re
+from urllib.parse import unquote, urljoin
+
+SITE_URL = "https://risen.runean.com"
+LIST_URL = f"{SITE_URL}/entry/찬송가-목록"
+TOTAL_HYMNS = 645
+
+
+def sanitize_filename(filename):
+    """파일명에서 특수문자 제거"""
+    invalid_chars = '<>:"/\\|?*'
+    for char in invalid_chars:
+        filename = filename.replace(char, '_')
+    return filename.strip()
+
+
+def hymn_filename(hymn_no, title):
+    return f"{hymn_no:03d}_{sanitize_filename(title)}.mp3"
+
+
+def guess_page_url(hymn_no):
+    """목록에서 링크를 찾지 못한 곡의 페이지 URL 추정"""
+    return f"{SITE_URL}/entry/찬송가-{hymn_no}장"
+
+
+def parse_hymn_links(html, base_url=SITE_URL):
+    """목록 페이지 HTML에서 {번호: {"no", "title", "url"}} 추출 (상대 링크는 base_url 기준)"""
+    # bs4는 목록 페이지를 읽을 때만 필요 (데이터 생성 스크립트는 번호 규칙만 사용)
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+    hymn_links = {}
+
+    for link in soup.find_all('a'):
+        text = link.get_text().strip()
+        href = link.get('href', '')
+
+        # "찬송가 X장 바로가기" 패턴 찾기
+        if '찬송가' in text and '장' in text and '바로가기' in text:
+            match = re.search(r'찬송가\s+(\d+)장', text)
+            if not match:
+                continue
+            hymn_no = int(match.group(1))
+
+            # 제목 추출 (URL에서, 퍼센트 인코딩된 링크도 처리)
+            title_match = re.search(r'장-(.*?)-가사', unquote(href))
+            if title_match:
+                title = title_match.group(1).replace('-', ' ')
+            else:
+                title = f"찬송가 {hymn_no}장"
+
+            hymn_links[hymn_no] = {
+                "no": hymn_no,
+                "title": title,
+                "url": urljoin(base_url, href),
+            }
+    return hymn_links
+
+
+def extract_all_hymn_links(cache, list_url=LIST_URL):
+    """목록 페이지(HtmlCache로 캐시)에서 모든 찬송가 링크 추출"""
+    return parse_hymn_links(cache.fetch(list_url, timeout=30), base_url=list_url)
+
+
+def refresh_hymn_links(cache, saved_links, list_url=LIST_URL, force=False):
+    """
+    목록 페이지를 조건부 요청으로 확인하고 바뀐 경우에만 다시 추출
+    (링크, diff_links() 결과) 반환 - 목록에서 사라진 곡은 저장된 링크를 그대로 유지
+    """
+    saved_links = normalize_links(saved_links)
+    text, changed = cache.revalidate(list_url, timeout=30, force=force)
+    if saved_links and not changed:
+        return saved_links, diff_links(saved_links, saved_links)
+
+    found = parse_hymn_links(text, base_url=list_url)
+    diff = diff_links(saved_links, found)
+    return normalize_links({**saved_links, **found}), diff
+
+
+def diff_links(old, new):
+    """{"added", "changed", "removed"}: 새로 생긴 곡, 페이지 주소가 바뀐 곡, 목록에서 빠진 곡 번호"""
+    return {
+        "added": sorted(no for no in new if no not in old),
+        "changed": sorted(no for no in new if no in old and new[no]["url"] != old[no]["url"]),
+        "removed": sorted(no for no in old if no not in new),
+    }
+
+
+def normalize_links(links):
+    """JSON으로 저장했다 읽으면 문자열이 되는 번호 키를 정수로 복원 (번호 순서로 정렬)"""
+    return dict(sorted(((int(no), data) for no, data in (links or {}).items()), key=lambda item: item[0]))
@@ -0,0 +1,219 @@
+"""
+찬송가 MP3 다운로드 통합 CLI
+다운로드 방식(backend)만 바꿔 끼우고 진행 상황 저장, 재시도, 속도 제한,
+페이지 캐시, 중복 음원 저장소는 모든 방식이 함께 사용
+
+사용법 (scripts 폴더에서):
+    python -m hymnkit --backend async --concurrency 8 --range 1-645 --out ../data/mp3
+"""
+
+import argparse
+from pathlib import Path
+
+from hymnkit import http_client, metrics
+from hymnkit.backends import BACKENDS, DownloadContext
+from hymnkit.blob_store import BlobStore
+from hymnkit.catalog import (LIST_URL, TOTAL_HYMNS, guess_page_url, hymn_filename, normalize_links,
+                             refresh_hymn_links)
+from hymnkit.html_cache import HtmlCache
+from hymnkit.log_writer import BackgroundLog
+from hymnkit.progress_store import ProgressStore
+from hymnkit.rate_limiter import AdaptiveRateLimiter
+from hymnkit.retry_queue import FAILURE_LABELS, RetryScheduler, classify
+
+DEFAULT_OUT = Path(__file__).resolve().parent.parent.parent / "data" / "mp3"
+
+
+def parse_range(text):
+    """'1-645' 또는 '7' 형식의 곡 번호 범위"""
+    try:
+        if '-' in text:
+            start, end = (int(part) for part in text.split('-', 1))
+        else:
+            start = end = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"잘못된 범위: {text} (예: 1-645)")
+    if not 1 <= start <= end <= TOTAL_HYMNS:
+        raise argparse.ArgumentTypeError(f"범위는 1-{TOTAL_HYMNS} 안이어야 합니다: {text}")
+    return start, end
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="hymnkit", description="찬송가 MP3 다운로드")
+    parser.add_argument('--backend', choices=sorted(BACKENDS), default="async",
+                        help="다운로드 방식 (기본: async)")
+    parser.add_argument('--concurrency', type=int, default=None,
+                        help="동시에 처리할 곡 수 (async 기본 8, selenium 기본 4, requests는 1)")
+    parser.add_argument('--range', dest='hymn_range', type=parse_range, default=(1, TOTAL_HYMNS),
+                        help=f"곡 번호 범위 (기본: 1-{TOTAL_HYMNS})")
+    parser.add_argument('--out', type=Path, default=DEFAULT_OUT,
+                        help=f"저장 경로 (기본: {DEFAULT_OUT})")
+    parser.add_argument('--refresh-links', action='store_true',
+                        help="목록 페이지 변경 여부와 관계없이 링크를 처음부터 다시 추출")
+    parser.add_argument('--list-url', default=LIST_URL,
+                        help="찬송가 목록 페이지 주소 (테스트용 로컬 서버 등)")
+    parser.add_argument('--metrics', type=Path, default=None,
+                        help="단계별 소요 시간 저장 파일 (.json 또는 .prom, 기본: <out>/metrics.json)")
+    return parser
+
+
+def load_links(progress, page_cache, log, refresh=False, list_url=LIST_URL):
+    """
+    저장된 찬송가 링크를 목록 페이지와 비교해 갱신 (바뀌지 않았으면 조건부 요청 한 번으로 끝남)
+    페이지 주소가 바뀐 곡은 완료 기록을 지워 이번 실행에서 다시 받음
+    """
+    saved = normalize_links(progress.get("links"))
+    log("📋 찬송가 목록 페이지 확인 중..." if saved and not refresh
+        else "📋 찬송가 목록 페이지에서 링크 추출 중...", phase="list")
+    try:
+        with metrics.timer(metrics.LIST):
+            links, diff = refresh_hymn_links(page_cache, saved, list_url, force=refresh)
+    except Exception as e:
+        if saved:
+            log(f"⚠️  목록 확인 실패, 저장된 링크 사용: {len(saved)}곡 ({str(e)})", phase="list")
+        else:
+            log(f"❌ 링크 추출 실패: {str(e)}", phase="list")
+        return saved
+
+    if saved and not any(diff.values()):
+        log(f"📋 목록 변경 없음, 저장된 링크 사용: {len(links)}곡", phase="list")
+        return links
+
+    if saved:
+        log(f"✅ 목록 변경: 새 곡 {len(diff['added'])}, 주소 변경 {len(diff['changed'])}, "
+            f"목록에서 빠짐 {len(diff['removed'])}", phase="list")
+        if diff["removed"]:
+            log(f"   목록에서 빠진 곡은 저장된 링크 유지: {diff['removed'][:20]}", phase="list")
+        for hymn_no in diff["changed"]:
+            progress.mark_pending(hymn_no)
+    else:
+        log(f"✅ {len(links)}곡 링크 추출 완료", phase="list")
+    progress.set("links", links)
+    return links
+
+
+def build_jobs(links, progress, out_dir, hymn_range):
+    """범위 안에서 아직 완료되지 않은 곡의 작업 목록"""
+    start, end = hymn_range
+    jobs = []
+    for hymn_no in range(start, end + 1):
+        if progress.is_completed(hymn_no):
+            continue
+        data = links.get(hymn_no) or {"title": f"찬송가 {hymn_no}장", "url": guess_page_url(hymn_no)}
+        jobs.append({
+            "no": hymn_no,
+            "title": data["title"],
+            "url": data["url"],
+            "filepath": out_dir / hymn_filename(hymn_no, data["title"]),
+        })
+    return jobs
+
+
+def run_jobs(backend, jobs, on_result, retries, log=None):
+    """작업을 실행하고 재시도 대기열이 빌 때까지 백오프 후 다시 실행"""
+    backend.run(jobs, on_result)
+    while retries.pending():
+        if log is not None:
+            log(f"\n🔁 재시도 대기: {retries.pending()}곡", phase="retry")
+        backend.run(retries.next_batch(), on_result)
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.out.mkdir(parents=True, exist_ok=True)
+    # 파일 기록은 백그라운드 스레드가 모아서 처리 (종료 시 남은 로그까지 기록)
+    with BackgroundLog(args.out / "download_log.jsonl") as log:
+        run(args, log)
+
+
+def run(args, log):
+    out_dir = args.out
+    collector = metrics.Metrics()
+    metrics.set_active(collector)
+
+    backend_class = BACKENDS[args.backend]
+    concurrency = args.concurrency or backend_class.default_concurrency
+    start, end = args.hymn_range
+
+    log("=" * 80)
+    log(f"🎵 찬송가 MP3 자동 다운로드 ({args.backend}, 동시 {concurrency}곡)")
+    log(f"📁 저장 경로: {out_dir}")
+    log("=" * 80)
+
+    # 동시 다운로드 수만큼 커넥션 풀 확보, 서버 상태에 맞춰 요청 속도 조절
+    http_client.configure(pool_size=max(concurrency, http_client.DEFAULT_POOL_SIZE))
+    rate_limiter = AdaptiveRateLimiter(on_event=log)
+    http_client.set_rate_limiter(rate_limiter)
+
+    page_cache = HtmlCache(out_dir / ".page_cache")
+    blob_store = BlobStore(out_dir / ".blobs")
+    context = DownloadContext(page_cache, blob_store)
+
+    progress = ProgressStore(out_dir / "progress.json", defaults={"links": {}})
+    links = load_links(progress, page_cache, log, refresh=args.refresh_links,
+                       list_url=args.list_url)
+    jobs = build_jobs(links, progress, out_dir, args.hymn_range)
+    total = end - start + 1
+    log(f"\n🎵 {start}-{end}장 중 {len(jobs)}곡 다운로드 시작\n")
+
+    # 일시적 실패(타임아웃, 5xx, 잘린 파일)는 실행 마지막에 다시 시도
+    retries = RetryScheduler()
+
+    def on_result(hymn_no, job, mp3_url, error):
+        """곡 하나가 끝날 때마다 호출 (한 번에 하나씩 호출됨)"""
+        log(f"[{hymn_no}/{TOTAL_HYMNS}] {job['title']}", hymn=hymn_no, phase="start")
+
+        if error is None:
+            file_size = job["filepath"].stat().st_size / (1024 * 1024)
+            log(f"  ✅ 완료 ({file_size:.2f} MB)", hymn=hymn_no, phase="done")
+            progress.mark_completed(hymn_no)
+            retries.succeed(hymn_no)
+        elif retries.fail(hymn_no, job, error):
+            log(f"  🔁 {FAILURE_LABELS[classify(error)]} - 나중에 다시 시도 ({error})",
+                hymn=hymn_no, phase="retry")
+        else:
+            log(f"  ❌ {FAILURE_LABELS[classify(error)]} ({error})", hymn=hymn_no, phase="failed")
+            progress.mark_failed(hymn_no)
+
+        # 진행률 표시
+        done = len(progress.completed) + len(progress.failed)
+        if done % 10 == 0:
+            log(f"\n📊 진행률: {len(progress.completed)}/{TOTAL_HYMNS} "
+                f"({len(progress.completed)/TOTAL_HYMNS*100:.1f}%)", phase="progress")
+            log(f"   ✅ 성공: {len(progress.completed)} | ❌ 실패: {len(progress.failed)}",
+                phase="progress")
+            log(f"   {rate_limiter.format_stats()}\n", phase="progress")
+
+    if args.backend == "selenium":
+        backend = backend_class(context, concurrency, on_event=log)
+    else:
+        backend = backend_class(context, concurrency)
+
+    try:
+        with backend:
+            run_jobs(backend, jobs, on_result, retries, log)
+    finally:
+        progress.close()
+        collector.finish()
+        metrics_path = args.metrics or out_dir / "metrics.json"
+        collector.export(metrics_path)
+
+    # 최종 결과
+    in_range = range(start, end + 1)
+    completed = sum(1 for no in in_range if no in progress.completed)
+    failed = sorted(no for no in in_range if no in progress.failed)
+    log("\n" + "=" * 80)
+    log("🎉 다운로드 완료!")
+    log(f"✅ 성공: {completed}/{total}")
+    log(f"❌ 실패: {len(failed)}/{total}")
+    if failed:
+        log(f"\n실패한 곡 번호 (처음 20개): {failed[:20]}")
+    for line in retries.summary_lines():
+        log(line)
+    log(http_client.format_stats())
+    log(rate_limiter.format_stats())
+    log(page_cache.format_stats())
+    log(blob_store.format_stats())
+    for line in collector.report_lines():
+        log(line)
+    log(f"📈 측정값 저장: {metrics_path}")
@@ -0,0 +1,161 @@
+"""
+앱용 찬송가 데이터(HymnDef[]) 생성
+곡마다 f-string을 만들어 합치는 대신 레코드를 한 줄씩 파일에 바로 쓰고(스트리밍),
+같은 내용을 앱이 코드 대신 JSON.parse로 읽을 수 있는 열(column) 단위 JSON으로도 저장
+
+- 분류: 곡 번호를 인덱스로 하는 미리 계산된 배열에서 바로 조회 (범위 목록을 곡마다 훑지 않음)
+- 문자열: 따옴표, 역슬래시, 줄바꿈을 이스케이프해 제목에 ' 가 있어도 올바른 TypeScript 생성
+- JSON: {"version", "count", "categories", "category", "ko", "en", "es", "inputs"}
+  category는 categories의 인덱스, 제목이 기본값("찬송가 N장", "Hymn N", "Himno N")이면 null
+- inputs: 생성에 쓴 입력의 해시 (hymn_catalog가 다시 생성할지 판단할 때 사용)
+"""
+
+import json
+import os
+from pathlib import Path
+
+from hymnkit.catalog import TOTAL_HYMNS
+
+FORMAT_VERSION = 1
+OTHER_CATEGORY = "기타"
+
+# (시작, 끝, 분류) - 새찬송가 주제별 분류
+CATEGORY_RANGES = (
+    (1, 62, "예배"),
+    (63, 79, "성부하나님"),
+    (80, 181, "성자예수님"),
+    (182, 197, "성령"),
+    (198, 206, "성경"),
+    (207, 223, "교회"),
+    (224, 233, "성례"),
+    (234, 249, "천국"),
+    (250, 289, "구원"),
+    (290, 545, "그리스도인의 삶"),
+    (546, 575, "전도와 선교"),
+    (576, 645, "행사와 절기"),
+)
+CATEGORIES = tuple(name for _, _, name in CATEGORY_RANGES) + (OTHER_CATEGORY,)
+
+
+def build_category_table(total=TOTAL_HYMNS):
+    """곡 번호 → 분류 인덱스 배열 (0번은 사용하지 않음, 범위 밖은 '기타')"""
+    other = CATEGORIES.index(OTHER_CATEGORY)
+    table = bytearray([other]) * (total + 1)
+    for index, (start, end, _) in enumerate(CATEGORY_RANGES):
+        table[start:min(end, total) + 1] = bytes([index]) * (min(end, total) + 1 - start)
+    return table
+
+
+CATEGORY_TABLE = build_category_table()
+
+
+def get_category(hymn_no):
+    if 0 < hymn_no < len(CATEGORY_TABLE):
+        return CATEGORIES[CATEGORY_TABLE[hymn_no]]
+    return OTHER_CATEGORY
+
+
+def default_titles(hymn_no):
+    return {"ko": f"찬송가 {hymn_no}장", "en": f"Hymn {hymn_no}", "es": f"Himno {hymn_no}"}
+
+
+def hymn_records(ko_titles, en_titles=None, es_titles=None, total=TOTAL_HYMNS):
+    """1~total장 HymnDef 레코드를 차례로 생성 (없는 제목은 기본값)"""
+    en_titles = en_titles or {}
+    es_titles = es_titles or {}
+    for no in range(1, total + 1):
+        defaults = default_titles(no)
+        yield {
+            "no": no,
+            "id": f"h{no}",
+            "ko": ko_titles.get(no) or defaults["ko"],
+            "en": en_titles.get(no) or defaults["en"],
+            "es": es_titles.get(no) or defaults["es"],
+            "category": get_category(no),
+        }
+
+
+def ts_string(text):
+    """작은따옴표 TypeScript 문자열 리터럴 (JSON 이스케이프 규칙 사용)"""
+    body = json.dumps(text, ensure_ascii=False)[1:-1]
+    return "'" + body.replace('\\"', '"').replace("'", "\\'") + "'"
+
+
+def _ts_line(record):
+    return (f"  {{ no: {record['no']}, id: {ts_string(record['id'])}, ko: {ts_string(record['ko'])}, "
+            f"en: {ts_string(record['en'])}, es: {ts_string(record['es'])}, "
+            f"category: {ts_string(record['category'])} }},\n")
+
+
+INPUTS_PREFIX = "// inputs: "
+
+
+def read_inputs_digest(path):
+    """생성된 파일에 기록된 입력 해시 (없거나 읽을 수 없으면 None)"""
+    path = Path(path)
+    try:
+        if path.suffix == '.json':
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f).get("inputs")
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.startswith("//"):
+                    return None
+                if line.startswith(INPUTS_PREFIX):
+                    return line[len(INPUTS_PREFIX):].strip()
+    except (OSError, ValueError, AttributeError):
+        return None
+    return None
+
+
+def write_dataset(records, ts_path=None, json_path=None, source=None, inputs=None):
+    """
+    레코드(1장부터 번호 순서대로)를 TypeScript 파일에 한 줄씩 쓰면서 JSON 열을 모으고, 끝나면 JSON도 저장
+    inputs(입력 해시)를 주면 두 파일에 기록해 다음 빌드에서 다시 만들지 판단할 수 있게 함
+    두 파일 모두 임시 파일에 쓴 뒤 교체하므로 중간에 실패해도 기존 파일이 남음
+    반환: 레코드 수
+    """
+    columns = {"category": [], "ko": [], "en": [], "es": []}
+    category_index = {name: index for index, name in enumerate(CATEGORIES)}
+    count = 0
+
+    ts_file = tmp_path = None
+    if ts_path is not None:
+        ts_path = Path(ts_path)
+        tmp_path = ts_path.with_name(ts_path.name + '.tmp')
+        ts_file = open(tmp_path, 'w', encoding='utf-8', newline='\r\n')     # 저장소의 기존 파일과 같은 CRLF
+        ts_file.write(f"// 자동 생성 파일 - 직접 수정하지 마세요 ({source or 'scripts/hymnkit/dataset.py'})\n")
+        if inputs:
+            ts_file.write(f"{INPUTS_PREFIX}{inputs}\n")
+        ts_file.write("import type { HymnDef } from './constants';\n\n")
+        ts_file.write("export const GLOBAL_HYMN_TREASURY: HymnDef[] = [\n")
+    try:
+        for record in records:
+            count += 1
+            if ts_file is not None:
+                ts_file.write(_ts_line(record))
+            if json_path is not None:
+                defaults = default_titles(record["no"])
+                for lang in ("ko", "en", "es"):
+                    value = record[lang]
+                    columns[lang].append(None if value == defaults[lang] else value)
+                columns["category"].append(category_index.get(record["category"],
+                                                              category_index[OTHER_CATEGORY]))
+        if ts_file is not None:
+            ts_file.write("];\n")
+    finally:
+        if ts_file is not None:
+            ts_file.close()
+    if ts_file is not None:
+        os.replace(tmp_path, ts_path)
+
+    if json_path is not None:
+        json_path = Path(json_path)
+        data = {"version": FORMAT_VERSION, "count": count, "categories": list(CATEGORIES), **columns}
+        if inputs:
+            data["inputs"] = inputs
+        tmp_path = json_path.with_name(json_path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8', newline='\n') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, json_path)
+    return count
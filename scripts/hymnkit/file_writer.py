@@ -0,0 +1,99 @@
+"""
+쓰기 지연(write-behind) 파일 기록기
+네트워크에서 받은 조각을 큰 버퍼로 모은 뒤 별도 스레드에서 디스크에 기록하여
+네트워크 읽기와 디스크 쓰기를 겹쳐서 실행 (NAS처럼 쓰기 지연이 큰 저장소용)
+
+- Content-Length를 알면 파일 크기를 미리 확보(preallocate)
+- close() 시 실제로 기록된 크기로 잘라내고 fsync (미리 확보한 빈 공간이 남지 않도록,
+  쓰기 오류가 나도 .part 파일 크기는 기록에 성공한 바이트 수와 같음 → 이어받기 가능)
+"""
+
+import os
+import queue
+import threading
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024   # 한 번에 디스크에 쓸 크기
+DEFAULT_QUEUE_DEPTH = 4             # 쓰기 스레드에 대기시킬 버퍼 수 (메모리 상한 = 버퍼 × 깊이)
+
+
+def preallocate(f, size):
+    """파일 공간을 미리 확보 (지원하지 않는 파일 시스템이면 크기만 늘림)"""
+    if size <= f.tell():
+        return
+    try:
+        os.posix_fallocate(f.fileno(), f.tell(), size - f.tell())
+    except (AttributeError, OSError):
+        f.truncate(size)
+
+
+class WriteBehindWriter:
+    """버퍼에 모은 데이터를 백그라운드 스레드가 순서대로 기록"""
+
+    def __init__(self, path, offset=0, total=None,
+                 buffer_size=DEFAULT_BUFFER_SIZE, queue_depth=DEFAULT_QUEUE_DEPTH):
+        self.path = path
+        self.buffer_size = buffer_size
+        self.written = offset       # write()로 받은 바이트 (버퍼 포함)
+        self._flushed = offset      # 디스크에 기록된 바이트
+        # 버퍼를 직접 관리하므로 파이썬 파일 버퍼는 사용하지 않음
+        self._file = open(path, 'r+b' if offset else 'wb', buffering=0)
+        self._file.seek(offset)
+        if total:
+            preallocate(self._file, total)
+            self._file.seek(offset)
+        self._buffer = bytearray()
+        self._queue = queue.Queue(maxsize=queue_depth)
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name=f"writer-{path.name}", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            block = self._queue.get()
+            if block is None:
+                return
+            if self._error is not None:
+                continue
+            try:
+                view = memoryview(block)
+                while view:
+                    count = self._file.write(view)
+                    self._flushed += count
+                    view = view[count:]
+            except OSError as e:
+                self._error = e
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise self._error
+
+    def write(self, data):
+        """버퍼에 추가하고, 버퍼가 차면 쓰기 스레드로 넘김 (큐가 가득 차면 대기)"""
+        self._raise_error()
+        self._buffer += data
+        self.written += len(data)
+        if len(self._buffer) >= self.buffer_size:
+            self._queue.put(bytes(self._buffer))
+            self._buffer.clear()
+
+    def close(self):
+        """남은 버퍼를 기록하고 스레드 종료 후 기록된 크기로 잘라서 닫기"""
+        if self._file.closed:
+            return
+        try:
+            if self._buffer:
+                self._queue.put(bytes(self._buffer))
+                self._buffer.clear()
+            self._queue.put(None)
+            self._thread.join()
+            self._file.truncate(self._flushed)
+            os.fsync(self._file.fileno())
+        finally:
+            self._file.close()
+        self._raise_error()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,292 @@
+"""
+생성 결과(HistoryItem) 내보내기
+utils/storageManager.ts의 exportSunoPrompts(TXT), exportToCSV(CSV), exportAllHistory(JSON)와 같은 형식을
+전체 문자열을 만들지 않고 레코드마다 바로 파일에 기록 (입력도 한 레코드씩 읽으므로 메모리 사용량 일정)
+
+- 입력: 앱의 기록 JSON 배열, JSON Lines, history_archive.py 보관소 폴더 (.gz 압축 파일도 가능)
+- 출력: 경로가 .gz로 끝나면 gzip 압축
+- 분류별 나누기: get_category 범위마다 파일 하나씩 (입력은 한 번만 읽고 레코드마다 분류 파일로 나눔)
+"""
+
+import gzip
+import json
+import os
+import re
+import time
+from pathlib import Path
+
+from hymnkit.batch_generate import load_hymns
+from hymnkit.dataset import CATEGORIES, get_category
+from hymnkit.history_store import HistoryStore, resolve_hymn_no, title_numbers
+
+READ_CHUNK = 1024 * 1024        # JSON 배열을 읽는 단위 (문자)
+MAX_ELEMENT = 256 * 1024 * 1024  # JSON 배열 원소 하나의 최대 길이 (문자, 표지 이미지 포함)
+PARTIAL_TOKEN = 6               # 조각 끝에서 잘릴 수 있는 토큰의 최대 길이 ("\\uXXXX")
+GZIP_LEVEL = 6
+
+_SKIP = re.compile(r'[\s,]*')
+
+CSV_HEADERS = ('번호', '한글제목', '영문제목', '장르', 'BPM', 'Key', '분위기', '생성일시')
+TXT_SEPARATOR = '\n\n'
+
+SUNO_PROMPT_TEMPLATE = """
+===========================================
+찬송가 {number}: {title_ko}
+===========================================
+
+[Style Prompt]
+{style_prompt}
+
+[Lyrics - Korean]
+{lyrics_ko}
+
+[Lyrics - English]
+{lyrics_en}
+
+[Lyrics - Spanish]
+{lyrics_es}
+
+[Structure]
+{structure}
+
+[Tags]
+Genre: {genre}
+BPM: {bpm}
+Key: {key}
+Vibe: {vibe}
+
+[Suno Parameters]
+Style Influence: {style_influence}
+Weirdness: {weirdness}
+Vocal Gender: {vocal_gender}
+Model: {model}
+
+"""
+
+
+def js_string(value):
+    """JavaScript 템플릿 문자열에 넣었을 때와 같은 표기 (null, true, 1.0 → 1)"""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def ko_datetime(timestamp_ms):
+    """new Date(ms).toLocaleString('ko-KR') 형식 ("2025. 1. 5. 오후 3:04:05")"""
+    t = time.localtime(timestamp_ms / 1000)
+    period = "오전" if t.tm_hour < 12 else "오후"
+    hour = t.tm_hour % 12 or 12
+    return f"{t.tm_year}. {t.tm_mon}. {t.tm_mday}. {period} {hour}:{t.tm_min:02d}:{t.tm_sec:02d}"
+
+
+def suno_prompt_text(item, number):
+    """레코드 하나의 Suno 프롬프트 블록 (number는 1부터)"""
+    lyrics = item.get("multiLyrics") or {}
+    tags = item.get("tags") or {}
+    params = item.get("sunoParameters") or {}
+    return SUNO_PROMPT_TEMPLATE.format(
+        number=number,
+        title_ko=js_string((item.get("titles") or {}).get("ko")),
+        style_prompt=js_string(item.get("stylePrompt")),
+        lyrics_ko=js_string(lyrics.get("ko")),
+        lyrics_en=js_string(lyrics.get("en")),
+        lyrics_es=js_string(lyrics.get("es")),
+        structure=' → '.join(item.get("structure") or []),
+        genre=js_string(tags.get("genre")),
+        bpm=js_string(tags.get("bpm")),
+        key=js_string(tags.get("key")),
+        vibe=js_string(tags.get("vibe")),
+        style_influence=js_string(params.get("styleInfluence")),
+        weirdness=js_string(params.get("weirdness")),
+        vocal_gender=js_string(params.get("vocalGender")),
+        model=js_string(params.get("recommendedModel")),
+    )
+
+
+def csv_row(item, number):
+    """레코드 하나의 CSV 줄 (모든 칸을 큰따옴표로 감쌈, 줄바꿈 없음)"""
+    titles = item.get("titles") or {}
+    tags = item.get("tags") or {}
+    cells = (number, titles.get("ko"), titles.get("en"), tags.get("genre"), tags.get("bpm"),
+             tags.get("key"), tags.get("vibe"), ko_datetime(item.get("timestamp") or 0))
+    return ','.join('"' + js_string(cell).replace('"', '""') + '"' for cell in cells)
+
+
+class HistoryWriter:
+    """레코드를 형식에 맞춰 하나씩 기록 (번호는 1부터, finish()가 기록한 개수 반환)"""
+
+    def __init__(self, f, fmt):
+        if fmt not in FORMATS:
+            raise ValueError(f"지원하지 않는 형식: {fmt}")
+        self.f = f
+        self.fmt = fmt
+        self.count = 0
+        if fmt == "csv":
+            f.write('\ufeff' + ','.join(CSV_HEADERS))     # UTF-8 BOM (엑셀용)
+
+    def write(self, item):
+        self.count += 1
+        if self.fmt == "txt":
+            if self.count > 1:
+                self.f.write(TXT_SEPARATOR)
+            self.f.write(suno_prompt_text(item, self.count))
+        elif self.fmt == "csv":
+            self.f.write('\n' + csv_row(item, self.count))
+        else:
+            # JSON.stringify(history, null, 2)와 같은 들여쓰기
+            text = json.dumps(item, ensure_ascii=False, indent=2).replace('\n', '\n  ')
+            self.f.write(('[\n  ' if self.count == 1 else ',\n  ') + text)
+
+    def finish(self):
+        if self.fmt == "json":
+            self.f.write('\n]' if self.count else '[]')
+        return self.count
+
+
+# 형식 → 확장자
+FORMATS = {"txt": ".txt", "csv": ".csv", "json": ".json"}
+
+
+def write_history(items, f, fmt):
+    """레코드를 모두 기록하고 개수 반환"""
+    writer = HistoryWriter(f, fmt)
+    for item in items:
+        writer.write(item)
+    return writer.finish()
+
+
+def _open_text(path, mode):
+    path = Path(path)
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + 't', encoding='utf-8', newline='\n', compresslevel=GZIP_LEVEL)
+    return open(path, mode, encoding='utf-8', newline='\n')
+
+
+def _incomplete(error, buf):
+    """
+    읽은 부분이 끝나서 난 해석 오류인지
+    문자열이 이어지거나, 오류 위치가 버퍼 끝의 잘린 토큰 안 ("fals", "\\u00", "1." 등)
+    """
+    return error.msg.startswith("Unterminated string") or error.pos >= len(buf) - PARTIAL_TOKEN
+
+
+def iter_json_array(f, chunk_size=READ_CHUNK, max_element=MAX_ELEMENT):
+    """큰 JSON 배열을 조금씩 읽으면서 원소를 하나씩 반환 (문법 오류는 파일 내 위치와 함께 바로 보고)"""
+    decoder = json.JSONDecoder()
+    buf, pos = "", 0
+    offset = 0          # buf[0]의 입력 내 위치 (문자)
+    started = False
+    while True:
+        pos = _SKIP.match(buf, pos).end()
+        if pos < len(buf):
+            if not started:
+                if buf[pos] != '[':
+                    raise ValueError("JSON 배열이 아닙니다")
+                started, pos = True, pos + 1
+                continue
+            if buf[pos] == ']':
+                return
+            try:
+                item, pos = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError as e:
+                if not _incomplete(e, buf):
+                    raise ValueError(f"JSON 문법 오류 ({offset + e.pos}번째 문자): {e.msg}") from None
+                if len(buf) - pos > max_element:
+                    raise ValueError(f"JSON 원소가 너무 큼 ({offset + pos}번째 문자부터 {max_element}자 초과)") from None
+            else:
+                yield item
+                continue
+        more = f.read(chunk_size)
+        if not more:
+            raise ValueError("JSON 배열이 중간에 끝났습니다")
+        offset += pos
+        buf, pos = buf[pos:] + more, 0
+
+
+def iter_history(source):
+    """
+    입력의 레코드를 하나씩 반환
+    source: 기록 JSON 배열, JSON Lines(.jsonl), 보관소 폴더 (파일은 .gz 가능)
+    """
+    source = Path(source)
+    if source.is_dir():
+        with HistoryStore(source) as store:
+            yield from store.items()
+        return
+
+    suffixes = source.suffixes[-2:] if source.suffix == ".gz" else source.suffixes[-1:]
+    opener = gzip.open if source.suffix == ".gz" else open
+    if suffixes[0] == ".jsonl":
+        with opener(source, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        with opener(source, 'rt', encoding='utf-8') as f:
+            yield from iter_json_array(f)
+
+
+def _tmp_path(path):
+    return path.with_name(path.name + '.tmp' + (".gz" if path.suffix == ".gz" else ""))
+
+
+def export_history(source, out_path, fmt):
+    """입력 → out_path 한 파일 (경로가 .gz로 끝나면 압축), (경로, 개수, 걸린 초) 반환"""
+    start = time.perf_counter()
+    out_path = Path(out_path)
+    tmp_path = _tmp_path(out_path)
+    with _open_text(tmp_path, 'w') as f:
+        count = write_history(iter_history(source), f, fmt)
+    os.replace(tmp_path, out_path)
+    return str(out_path), count, time.perf_counter() - start
+
+
+def category_path(out_dir, stem, fmt, category, compress=False):
+    """분류별 출력 파일 경로 ({이름}-{분류 순서:02d}-{분류}.{확장자}[.gz])"""
+    suffix = FORMATS[fmt] + (".gz" if compress else "")
+    name = category.replace(' ', '_')
+    return Path(out_dir) / f"{stem}-{CATEGORIES.index(category) + 1:02d}-{name}{suffix}"
+
+
+def export_by_category(source, out_dir, fmt, stem="history", compress=False, on_result=None):
+    """
+    분류마다 파일 하나씩 생성 (레코드가 없는 분류는 만들지 않음)
+    입력은 한 번만 읽고 해석하며, 레코드마다 곡 번호의 분류 파일로 나눠 기록
+    반환: [(경로, 개수, 걸린 초)] - 분류 순서
+    on_result(결과): 분류 파일마다 호출
+    """
+    start = time.perf_counter()
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    paths = {category: category_path(out_dir, stem, fmt, category, compress) for category in CATEGORIES}
+    numbers_by_title = None if Path(source).is_dir() else title_numbers(load_hymns())
+    outputs = {}    # 분류 → (파일, HistoryWriter)
+    completed = False
+    try:
+        for item in iter_history(source):
+            category = get_category(resolve_hymn_no(item, numbers_by_title))
+            if category not in outputs:
+                f = _open_text(_tmp_path(paths[category]), 'w')
+                outputs[category] = (f, HistoryWriter(f, fmt))
+            outputs[category][1].write(item)
+        completed = True
+    finally:
+        counts = {}
+        for category, (f, writer) in outputs.items():
+            counts[category] = writer.finish()
+            f.close()
+            if not completed:
+                os.remove(_tmp_path(paths[category]))
+    elapsed = time.perf_counter() - start
+    results = []
+    for category in CATEGORIES:
+        if category in counts:
+            os.replace(_tmp_path(paths[category]), paths[category])
+            results.append((str(paths[category]), counts[category], elapsed))
+            if on_result:
+                on_result(results[-1])
+    return results
@@ -0,0 +1,386 @@
+"""
+생성 결과(HistoryItem) 보관소
+앱 기록 전체를 JSON.stringify 한 번으로 다루는 대신, 추가 전용 데이터 파일 + 고정 길이 색인으로 저장하고
+읽을 때는 데이터 파일을 mmap으로 열어 필요한 레코드만 해석
+
+폴더 구성:
+- history.jsonl: 레코드를 한 줄에 하나씩 추가만 함 (표지 이미지는 빼고 참조만 남김)
+- history.idx:   레코드마다 32바이트 (id 해시, 곡 번호, 길이, 위치, timestamp) - 길이 0은 삭제 표시
+- covers/<해시 앞 2자리>/<해시>.<확장자>: coverArt, multiCovers의 base64 이미지를 풀어 내용 해시로 한 번만 저장
+
+- 같은 id를 다시 넣으면 새 레코드가 이전 것을 대체 (이전 레코드는 compact() 때 정리)
+- 기록 도중 중단되어 색인과 데이터 파일이 어긋나면 열 때 데이터 파일 기준으로 맞춤
+- compact()는 새 파일 두 개를 다 쓴 뒤 compact.pending 표시를 남기고 교체하므로,
+  교체 도중 중단되면 열 때 표시를 보고 나머지 교체를 마침 (표시가 없으면 쓰다 만 새 파일을 버림)
+- 한 번에 한 프로세스만 기록 (읽기는 여러 스레드에서 가능)
+"""
+
+import base64
+import binascii
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import threading
+from pathlib import Path
+
+DATA_NAME = "history.jsonl"
+INDEX_NAME = "history.idx"
+COVERS_NAME = "covers"
+PENDING_NAME = "compact.pending"    # compact()의 새 파일을 다 썼고 교체 중이라는 표시
+
+# id 해시(u64), 곡 번호(u32), 길이(u32, 줄바꿈 제외), 위치(u64), timestamp(i64, ms)
+INDEX_ENTRY = struct.Struct('<QIIQq')
+
+DATA_URL = re.compile(r'data:(image/[\w.+-]+);base64,', re.ASCII)
+COVER_PREFIX = "cover:"
+MIME_EXTENSIONS = {"image/png": "png", "image/jpeg": "jpg", "image/webp": "webp", "image/gif": "gif"}
+BATCH_ID = re.compile(r'^batch-\d+-(\d+)$')
+
+
+def id_hash(item_id):
+    return int.from_bytes(hashlib.blake2b(str(item_id).encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def title_numbers(hymns):
+    """한국어 제목 → 곡 번호 (같은 제목이 여러 곡이면 번호를 정할 수 없으므로 제외)"""
+    numbers = {}
+    for hymn in hymns:
+        numbers[hymn["ko"]] = None if hymn["ko"] in numbers else hymn["no"]
+    return {title: no for title, no in numbers.items() if no is not None}
+
+
+def resolve_hymn_no(item, numbers_by_title=None):
+    """
+    레코드의 곡 번호 (모르면 0)
+    hymnNo 항목 → 일괄 생성 id("batch-<시각>-<번호>") → 한국어 제목 순서로 확인
+    """
+    if item.get("hymnNo"):
+        return int(item["hymnNo"])
+    match = BATCH_ID.match(str(item.get("id", "")))
+    if match:
+        return int(match.group(1))
+    if numbers_by_title:
+        return numbers_by_title.get((item.get("titles") or {}).get("ko") or item.get("title"), 0)
+    return 0
+
+
+def _sync_dir(path):
+    """파일 교체(rename)를 디스크에 반영 (디렉터리를 열 수 없는 Windows에서는 생략)"""
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class HistoryStore:
+    """추가 전용 HistoryItem 보관소"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.data_path = self.root / DATA_NAME
+        self.index_path = self.root / INDEX_NAME
+        self.covers_dir = self.root / COVERS_NAME
+        self.pending_path = self.root / PENDING_NAME
+        self.covers_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._map = None
+        self._mapped_size = 0
+        self._entries = []      # 색인 항목 (id 해시, 곡 번호, 길이, 위치, timestamp)
+        self._live = {}         # id 해시 → self._entries 위치 (가장 최근 것)
+        self._load()
+        self._data = open(self.data_path, 'ab')
+        self._index = open(self.index_path, 'ab')
+
+    # ----- 열기와 복구 -----
+
+    def _tmp_paths(self):
+        return self.data_path.with_name(DATA_NAME + '.tmp'), self.index_path.with_name(INDEX_NAME + '.tmp')
+
+    def _finish_compaction(self):
+        """중단된 compact() 정리: 표시가 있으면 남은 교체를 마치고, 없으면 쓰다 만 새 파일 삭제"""
+        data_tmp, index_tmp = self._tmp_paths()
+        if self.pending_path.exists():
+            if data_tmp.exists():
+                os.replace(data_tmp, self.data_path)
+            if index_tmp.exists():
+                os.replace(index_tmp, self.index_path)
+            _sync_dir(self.root)
+            self.pending_path.unlink()
+        else:
+            for path in (data_tmp, index_tmp):
+                if path.exists():
+                    path.unlink()
+
+    def _load(self):
+        self._finish_compaction()
+        self.data_path.touch()
+        self.index_path.touch()
+        data_size = self.data_path.stat().st_size
+        with open(self.index_path, 'rb') as f:
+            raw = f.read()
+        usable = len(raw) - len(raw) % INDEX_ENTRY.size
+        end = 0
+        for entry in INDEX_ENTRY.iter_unpack(raw[:usable]):
+            if entry[2] and entry[3] + entry[2] + 1 > data_size:
+                break   # 데이터를 다 쓰기 전에 중단됨
+            self._add_entry(entry)
+            if entry[2]:
+                end = entry[3] + entry[2] + 1
+        if len(self._entries) * INDEX_ENTRY.size != len(raw):
+            with open(self.index_path, 'r+b') as f:
+                f.truncate(len(self._entries) * INDEX_ENTRY.size)
+        if end < data_size:
+            self._recover_tail(end)
+
+    def _recover_tail(self, end):
+        """색인에 없는 데이터 파일 끝부분: 완전한 줄은 색인에 추가, 잘린 줄은 버림"""
+        with open(self.data_path, 'r+b') as f, open(self.index_path, 'ab') as index:
+            f.seek(end)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    item = json.loads(line)
+                except ValueError:
+                    break
+                entry = (id_hash(item.get("id")), resolve_hymn_no(item), len(line) - 1, end,
+                         int(item.get("timestamp") or 0))
+                index.write(INDEX_ENTRY.pack(*entry))
+                self._add_entry(entry)
+                end += len(line)
+            f.truncate(end)
+
+    def _add_entry(self, entry):
+        position = len(self._entries)
+        self._entries.append(entry)
+        if entry[2]:
+            self._live[entry[0]] = position
+        else:
+            self._live.pop(entry[0], None)
+
+    # ----- 표지 이미지 -----
+
+    def _store_cover(self, value):
+        """base64 data URL이면 covers/에 저장하고 "cover:<해시>.<확장자>" 참조 반환"""
+        if not isinstance(value, str):
+            return value
+        match = DATA_URL.match(value)
+        if not match:
+            return value
+        try:
+            data = base64.b64decode(value[match.end():], validate=True)
+        except binascii.Error:
+            return value
+        name = f"{hashlib.sha256(data).hexdigest()}.{MIME_EXTENSIONS.get(match.group(1), 'img')}"
+        path = self.cover_path(COVER_PREFIX + name)
+        if not path.exists():
+            path.parent.mkdir(exist_ok=True)
+            tmp_path = path.with_name(f"{name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        return COVER_PREFIX + name
+
+    def cover_path(self, ref):
+        """"cover:..." 참조의 이미지 파일 경로"""
+        name = ref[len(COVER_PREFIX):]
+        return self.covers_dir / name[:2] / name
+
+    def _inline_cover(self, value):
+        if not (isinstance(value, str) and value.startswith(COVER_PREFIX)):
+            return value
+        path = self.cover_path(value)
+        mime = next((mime for mime, ext in MIME_EXTENSIONS.items() if path.suffix == "." + ext), "image/png")
+        return f"data:{mime};base64," + base64.b64encode(path.read_bytes()).decode('ascii')
+
+    def _map_covers(self, item, convert):
+        if item.get("coverArt"):
+            item["coverArt"] = convert(item["coverArt"])
+        covers = item.get("multiCovers")
+        if isinstance(covers, dict):
+            item["multiCovers"] = {lang: convert(value) for lang, value in covers.items()}
+        return item
+
+    # ----- 기록 -----
+
+    def put_many(self, items, numbers_by_title=None):
+        """레코드를 추가하고 (같은 id는 대체) 추가한 개수 반환"""
+        count = 0
+        with self._lock:
+            offset = self._data.tell()
+            index_buf = bytearray()
+            for item in items:
+                item = self._map_covers(dict(item), self._store_cover)
+                no = resolve_hymn_no(item, numbers_by_title)
+                if no:
+                    item["hymnNo"] = no     # 색인을 데이터 파일만으로 다시 만들 수 있도록
+                line = json.dumps(item, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+                self._data.write(line + b'\n')
+                entry = (id_hash(item.get("id")), no, len(line), offset, int(item.get("timestamp") or 0))
+                index_buf += INDEX_ENTRY.pack(*entry)
+                self._add_entry(entry)
+                offset += len(line) + 1
+                count += 1
+            # 데이터를 먼저 내려쓴 뒤 색인 기록 (중단되면 열 때 데이터 기준으로 복구)
+            self._data.flush()
+            self._index.write(index_buf)
+            self._index.flush()
+        return count
+
+    def put(self, item, numbers_by_title=None):
+        self.put_many([item], numbers_by_title)
+
+    def delete(self, item_id):
+        """삭제 표시 (데이터는 compact() 때 정리), 없던 id면 False"""
+        key = id_hash(item_id)
+        with self._lock:
+            if key not in self._live:
+                return False
+            entry = (key, self._entries[self._live[key]][1], 0, 0, 0)
+            self._index.write(INDEX_ENTRY.pack(*entry))
+            self._index.flush()
+            self._add_entry(entry)
+        return True
+
+    # ----- 읽기 -----
+
+    def _view(self):
+        """데이터 파일의 mmap (파일이 커졌으면 다시 매핑)"""
+        size = self.data_path.stat().st_size
+        if self._map is None or size > self._mapped_size:
+            if self._map is not None:
+                self._map.close()
+            self._map = None
+            if size:
+                with open(self.data_path, 'rb') as f:
+                    self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._mapped_size = size
+        return self._map
+
+    def _read(self, position, covers=False):
+        _, _, length, offset, _ = self._entries[position]
+        item = json.loads(self._view()[offset:offset + length])
+        return self._map_covers(item, self._inline_cover) if covers else item
+
+    def get(self, item_id, covers=False):
+        """id로 레코드 조회 (covers=True면 표지 참조를 data URL로 되돌림)"""
+        position = self._live.get(id_hash(item_id))
+        return None if position is None else self._read(position, covers)
+
+    def _positions(self):
+        """살아 있는 레코드의 색인 위치 (데이터 파일 순서)"""
+        return sorted(self._live.values())
+
+    def by_hymn(self, no, covers=False):
+        """곡 번호의 레코드 목록 (최근 생성 순)"""
+        positions = [p for p in self._positions() if self._entries[p][1] == no]
+        positions.sort(key=lambda p: self._entries[p][4], reverse=True)
+        return [self._read(p, covers) for p in positions]
+
+    def hymn_counts(self):
+        """곡 번호별 레코드 수"""
+        counts = {}
+        for position in self._live.values():
+            no = self._entries[position][1]
+            counts[no] = counts.get(no, 0) + 1
+        return dict(sorted(counts.items()))
+
+    def items(self, covers=False):
+        """레코드를 하나씩 읽어서 반환"""
+        for position in self._positions():
+            yield self._read(position, covers)
+
+    def __iter__(self):
+        return self.items()
+
+    def __len__(self):
+        return len(self._live)
+
+    # ----- 정리 -----
+
+    def stats(self):
+        live_bytes = sum(self._entries[p][2] + 1 for p in self._live.values())
+        cover_files = [path for path in self.covers_dir.glob("*/*") if not path.name.endswith(".tmp")]
+        return {
+            "records": len(self._live),
+            "hymns": len({self._entries[p][1] for p in self._live.values()}),
+            "data_bytes": self.data_path.stat().st_size,
+            "live_bytes": live_bytes,
+            "index_entries": len(self._entries),
+            "covers": len(cover_files),
+            "cover_bytes": sum(path.stat().st_size for path in cover_files),
+        }
+
+    def compact(self):
+        """
+        살아 있는 레코드만 새 파일에 옮겨 쓰고 교체, 참조가 없는 표지 삭제
+        반환: (정리 전 데이터 크기, 정리 후 데이터 크기, 삭제한 표지 수)
+        """
+        with self._lock:
+            before = self.data_path.stat().st_size
+            data_tmp, index_tmp = self._tmp_paths()
+            view = self._view()
+            entries = []
+            used_covers = set()
+            with open(data_tmp, 'wb') as data, open(index_tmp, 'wb') as index:
+                for position in self._positions():
+                    key, no, length, offset, timestamp = self._entries[position]
+                    line = view[offset:offset + length]
+                    if COVER_PREFIX.encode() in line:
+                        self._map_covers(json.loads(line), lambda v: used_covers.add(v) or v)
+                    entry = (key, no, length, data.tell(), timestamp)
+                    data.write(line + b'\n')
+                    index.write(INDEX_ENTRY.pack(*entry))
+                    entries.append(entry)
+                for f in (data, index):
+                    f.flush()
+                    os.fsync(f.fileno())
+
+            # 새 파일을 모두 쓴 뒤에 표시를 남기고 교체 (중간에 중단되면 다음에 열 때 _finish_compaction)
+            with open(self.pending_path, 'wb') as f:
+                os.fsync(f.fileno())
+            _sync_dir(self.root)
+            self._data.close()
+            self._index.close()
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            os.replace(data_tmp, self.data_path)
+            os.replace(index_tmp, self.index_path)
+            _sync_dir(self.root)
+            self.pending_path.unlink()
+            self._entries = []
+            self._live = {}
+            for entry in entries:
+                self._add_entry(entry)
+            self._data = open(self.data_path, 'ab')
+            self._index = open(self.index_path, 'ab')
+
+            removed = 0
+            used_paths = {self.cover_path(ref) for ref in used_covers if isinstance(ref, str)
+                          and ref.startswith(COVER_PREFIX)}
+            for path in self.covers_dir.glob("*/*"):
+                if path not in used_paths:
+                    path.unlink()
+                    removed += 1
+        return before, self.data_path.stat().st_size, removed
+
+    def close(self):
+        with self._lock:
+            self._data.close()
+            self._index.close()
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
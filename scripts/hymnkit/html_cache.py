@@ -0,0 +1,192 @@
+"""
+스크래핑용 HTML 디스크 캐시
+목록 페이지와 찬송가 페이지를 내용 해시(SHA-256) 기준으로 저장하여
+재실행이나 실패한 곡 재시도 시 페이지 요청을 생략
+
+- entries/<URL 해시>.json: URL → 본문 해시, 받은 시각, ETag/Last-Modified (파일 mtime = 마지막 사용 시각)
+- blobs/<본문 해시>.html: 페이지 본문 (같은 내용은 한 번만 저장)
+TTL이 지난 항목은 다시 받고, 전체 크기가 상한을 넘으면 오래 안 쓴 항목부터 삭제(LRU)
+자주 바뀌는 목록 페이지는 revalidate()로 조건부 요청을 보내 바뀐 경우에만 본문을 받음
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from hymnkit import http_client
+
+DEFAULT_TTL = 7 * 24 * 3600             # 7일
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024   # 200 MB
+
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _atomic_write(path, data):
+    tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class HtmlCache:
+    """TTL과 크기 상한(LRU)을 가진 내용 주소 기반 HTML 캐시"""
+
+    def __init__(self, cache_dir, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.entries_dir = self.cache_dir / "entries"
+        self.blobs_dir = self.cache_dir / "blobs"
+        self.entries_dir.mkdir(parents=True, exist_ok=True)
+        self.blobs_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._total_bytes = sum(p.stat().st_size for p in self.blobs_dir.glob("*.html"))
+
+    def _entry_path(self, url):
+        return self.entries_dir / f"{_sha256(url.encode('utf-8'))}.json"
+
+    def _blob_path(self, digest):
+        return self.blobs_dir / f"{digest}.html"
+
+    def _read_entry(self, url):
+        try:
+            with open(self._entry_path(url), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def get(self, url):
+        """캐시된 본문 반환 (없거나 TTL이 지났으면 None)"""
+        entry_path = self._entry_path(url)
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            if time.time() - entry["fetched_at"] > self.ttl:
+                return None
+            data = self._blob_path(entry["sha256"]).read_bytes()
+        except (OSError, ValueError, KeyError):
+            return None
+        # 마지막 사용 시각 갱신 (LRU 기준)
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        return data.decode('utf-8')
+
+    def put(self, url, text, etag=None, last_modified=None):
+        """본문 저장 후 크기 상한 확인 (검증자가 있으면 다음 revalidate()에 사용)"""
+        data = text.encode('utf-8')
+        digest = _sha256(data)
+        blob_path = self._blob_path(digest)
+        entry = {"url": url, "sha256": digest, "fetched_at": time.time(), "size": len(data),
+                 "etag": etag, "last_modified": last_modified}
+        with self._lock:
+            if not blob_path.exists():
+                _atomic_write(blob_path, data)
+                self._total_bytes += len(data)
+            _atomic_write(self._entry_path(url),
+                          json.dumps(entry, ensure_ascii=False).encode('utf-8'))
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def fetch(self, url, timeout=30):
+        """캐시에 있으면 캐시에서, 없으면 공유 세션으로 받아서 저장"""
+        text = self.get(url)
+        if text is not None:
+            self.hits += 1
+            return text
+        self.misses += 1
+        response = http_client.get(url, timeout=timeout)
+        response.raise_for_status()
+        text = response.text
+        self.put(url, text)
+        return text
+
+    def revalidate(self, url, timeout=30, force=False):
+        """
+        조건부 요청(If-None-Match / If-Modified-Since)으로 변경 여부 확인
+        (본문, 바뀌었는지 여부) 반환 - 304이거나 받은 본문이 캐시와 같으면 바뀌지 않은 것
+        force=True면 검증자 없이 새로 받음 (TTL과 관계없이 항상 서버에 확인)
+        """
+        entry = None if force else self._read_entry(url)
+        headers = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers['If-None-Match'] = entry["etag"]
+            if entry.get("last_modified"):
+                headers['If-Modified-Since'] = entry["last_modified"]
+
+        response = http_client.get(url, timeout=timeout, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            try:
+                data = self._blob_path(entry["sha256"]).read_bytes()
+            except (OSError, KeyError):
+                # 본문이 정리(LRU)로 지워졌으면 검증자 없이 다시 받음
+                return self.revalidate(url, timeout=timeout, force=True)
+            self.hits += 1
+            entry["fetched_at"] = time.time()
+            with self._lock:
+                _atomic_write(self._entry_path(url),
+                              json.dumps(entry, ensure_ascii=False).encode('utf-8'))
+            return data.decode('utf-8'), False
+
+        response.raise_for_status()
+        self.misses += 1
+        text = response.text
+        changed = entry is None or entry.get("sha256") != _sha256(text.encode('utf-8'))
+        self.put(url, text, etag=response.headers.get('ETag'),
+                 last_modified=response.headers.get('Last-Modified'))
+        return text, changed
+
+    def invalidate(self, url):
+        """URL 항목 삭제 (본문은 다음 정리 때 삭제)"""
+        try:
+            os.remove(self._entry_path(url))
+        except OSError:
+            pass
+
+    def _evict(self):
+        """오래 안 쓴 항목부터 지워 전체 크기를 상한의 90% 이하로 줄임"""
+        entries = []
+        for path in self.entries_dir.glob("*.json"):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    entries.append((path.stat().st_mtime, path, json.load(f)["sha256"]))
+            except (OSError, ValueError, KeyError):
+                continue
+        entries.sort()
+
+        referenced = {}
+        for _, _, digest in entries:
+            referenced[digest] = referenced.get(digest, 0) + 1
+
+        target = self.max_bytes * 0.9
+        for _, path, digest in entries:
+            if self._total_bytes <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            referenced[digest] -= 1
+            if referenced[digest] == 0:
+                blob_path = self._blob_path(digest)
+                try:
+                    size = blob_path.stat().st_size
+                    os.remove(blob_path)
+                    self._total_bytes -= size
+                except OSError:
+                    pass
+
+    def format_stats(self):
+        """실행 종료 시 출력할 캐시 통계 문자열"""
+        total = self.hits + self.misses
+        rate = self.hits / total if total else 0.0
+        return f"🗂️  페이지 캐시 적중 {self.hits}/{total}회 ({rate*100:.1f}%)"
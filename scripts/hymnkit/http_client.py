@@ -0,0 +1,141 @@
+"""
+다운로드 스크립트 공용 HTTP 클라이언트
+keep-alive 커넥션 풀을 가진 Session 하나를 공유하여
+찬송가 페이지와 MP3마다 TCP/TLS 연결을 새로 맺지 않도록 함
+새 연결에 걸린 시간(DNS+TCP+TLS), 첫 바이트까지 시간, 속도 제한 대기는 hymnkit.metrics에 기록
+"""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from hymnkit import metrics
+
+# 기본 설정
+DEFAULT_POOL_SIZE = 16          # 호스트당 유지할 커넥션 수
+DEFAULT_POOL_HOSTS = 10         # 풀을 유지할 호스트 수
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Connection': 'keep-alive',
+}
+
+_lock = threading.Lock()
+_session = None
+_pool_size = DEFAULT_POOL_SIZE
+_rate_limiter = None
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    def connect(self):
+        with metrics.timer(metrics.CONNECT):
+            super().connect()
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        with metrics.timer(metrics.CONNECT):
+            super().connect()
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+def configure(pool_size=DEFAULT_POOL_SIZE):
+    """커넥션 풀 크기 설정 (동시 다운로드 수 이상으로 지정)
+
+    이미 만들어진 세션이 있으면 닫고 다음 요청 때 새 크기로 다시 생성
+    """
+    global _pool_size, _session
+    with _lock:
+        _pool_size = pool_size
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def set_rate_limiter(limiter):
+    """모든 요청 전후에 사용할 속도 제한기 지정 (None이면 제한 없음)"""
+    global _rate_limiter
+    _rate_limiter = limiter
+
+
+def get_session():
+    """공유 Session 반환 (처음 호출 시 생성)"""
+    global _session
+    with _lock:
+        if _session is None:
+            session = requests.Session()
+            session.headers.update(DEFAULT_HEADERS)
+            adapter = HTTPAdapter(pool_connections=DEFAULT_POOL_HOSTS,
+                                  pool_maxsize=_pool_size,
+                                  pool_block=False)
+            # 새 연결 시간 측정용 커넥션 클래스 사용
+            adapter.poolmanager.pool_classes_by_scheme = {
+                'http': _TimedHTTPConnectionPool,
+                'https': _TimedHTTPSConnectionPool,
+            }
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _session = session
+        return _session
+
+
+def _get(url, **kwargs):
+    response = get_session().get(url, **kwargs)
+    # elapsed: 요청을 보낸 후 응답 헤더를 받을 때까지 (stream=True면 본문 제외)
+    metrics.record(metrics.TTFB, response.elapsed.total_seconds())
+    return response
+
+
+def get(url, **kwargs):
+    """공유 Session으로 GET 요청 (속도 제한기가 있으면 허용될 때까지 대기 후 결과 보고)"""
+    limiter = _rate_limiter
+    if limiter is None:
+        return _get(url, **kwargs)
+
+    with metrics.timer(metrics.WAIT):
+        limiter.acquire(url)
+    try:
+        response = _get(url, **kwargs)
+    except (requests.Timeout, requests.ConnectionError) as e:
+        limiter.record(url, error=e)
+        raise
+    limiter.record(url, status=response.status_code,
+                   latency=response.elapsed.total_seconds(),
+                   retry_after=response.headers.get('Retry-After'))
+    return response
+
+
+def connection_stats():
+    """요청 수, 새로 맺은 연결 수, 연결 재사용률 반환"""
+    with _lock:
+        session = _session
+    requests_count = connections = 0
+    if session is not None:
+        for adapter in set(session.adapters.values()):
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                requests_count += pool.num_requests
+                connections += pool.num_connections
+    reused = max(requests_count - connections, 0)
+    rate = reused / requests_count if requests_count else 0.0
+    return {"requests": requests_count, "connections": connections,
+            "reused": reused, "reuse_rate": rate}
+
+
+def format_stats():
+    """실행 종료 시 출력할 연결 재사용 통계 문자열"""
+    stats = connection_stats()
+    return (f"🔌 HTTP 요청 {stats['requests']}회 / 새 연결 {stats['connections']}회 "
+            f"(재사용률 {stats['reuse_rate']*100:.1f}%)")
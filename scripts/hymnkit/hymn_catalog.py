@@ -0,0 +1,195 @@
+"""
+찬송가 메타데이터 통합 카탈로그
+여러 곳에 흩어진 제목 데이터(data/hymns-*.json)를 하나의 카탈로그(data/hymn_catalog.json)로 합치고,
+카탈로그가 바뀐 경우에만 앱용 데이터(TypeScript/JSON)를 다시 생성
+
+- 원본끼리 같은 곡, 같은 항목의 값이 다르면 어느 쪽이 맞는지 정하지 않고 즉시 중단(CatalogConflict)
+  ("찬송가 N장", "Hymn N", "Himno N" 같은 기본값은 값이 없는 것으로 봄)
+- 카탈로그의 곡마다 내용 해시(hash)를 기록하고, 전체 해시(digest)는 곡 해시들로 계산
+- 생성된 파일에는 입력 해시를 기록해 두고, 카탈로그나 생성 형식이 바뀐 파일만 다시 생성
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from hymnkit.catalog import TOTAL_HYMNS
+from hymnkit.dataset import (FORMAT_VERSION, default_titles, get_category, hymn_records,
+                             read_inputs_digest, write_dataset)
+from hymnkit.search_index import INDEX_VERSION, write_index
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+DATA_DIR = BASE_DIR / "data"
+CATALOG_PATH = DATA_DIR / "hymn_catalog.json"
+CATALOG_VERSION = 1
+
+# 우선순위가 없는 원본 목록 (값이 서로 다르면 원본을 고쳐야 함)
+SOURCES = (
+    DATA_DIR / "hymns-complete-645.json",
+    DATA_DIR / "hymns-645-complete.json",
+    DATA_DIR / "hymns-titles-browser.json",
+    DATA_DIR / "hymns-titles-scraped.json",
+)
+
+# 생성 파일: (경로, 종류) - 종류는 dataset.write_dataset의 출력 형식
+ARTIFACTS = (
+    (BASE_DIR / "hymns_645_generated.ts", "ts"),
+    (BASE_DIR / "public" / "hymns-645.json", "json"),
+    (BASE_DIR / "public" / "hymn-search-index.json", "search"),
+)
+FORMAT_VERSIONS = {"ts": FORMAT_VERSION, "json": FORMAT_VERSION, "search": INDEX_VERSION}
+
+FIELDS = ("ko", "en", "es", "category")
+
+
+class CatalogConflict(Exception):
+    """원본끼리 같은 곡의 값이 다름"""
+
+    def __init__(self, conflicts):
+        self.conflicts = conflicts
+        lines = [f"  {no}장 {field}: " + ", ".join(f"{name}={value!r}" for name, value in values)
+                 for no, field, values in conflicts[:20]]
+        super().__init__(f"원본 {len(conflicts)}곳의 값이 서로 다릅니다:\n" + "\n".join(lines))
+
+
+def record_hash(record):
+    """hash 항목을 뺀 곡 레코드의 SHA-256 (앞 16자리)"""
+    body = {key: value for key, value in record.items() if key != "hash"}
+    data = json.dumps(body, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()[:16]
+
+
+def catalog_digest(records):
+    hasher = hashlib.sha256()
+    for record in records:
+        hasher.update(record["hash"].encode('ascii'))
+    return hasher.hexdigest()
+
+
+def _meaningful(no, field, value):
+    """기본값이나 빈 값은 비교 대상에서 제외"""
+    if value is None or value == "":
+        return False
+    if field == "category":
+        return True
+    return value != default_titles(no)[field]
+
+
+def merge_sources(sources=SOURCES, total=TOTAL_HYMNS):
+    """
+    원본들을 곡 번호별로 합친 카탈로그 레코드 목록 (1~total장)
+    같은 항목에 서로 다른 값이 있으면 CatalogConflict
+    """
+    values = {}     # (곡 번호, 항목) → [(원본 이름, 값)]
+    for path in sources:
+        path = Path(path)
+        with open(path, 'r', encoding='utf-8') as f:
+            for entry in json.load(f):
+                no = int(entry["no"])
+                if entry.get("id", f"h{no}") != f"h{no}":
+                    raise ValueError(f"{path.name}: {no}장의 id가 h{no}가 아님: {entry['id']}")
+                for field in FIELDS:
+                    value = entry.get(field)
+                    if _meaningful(no, field, value):
+                        values.setdefault((no, field), []).append((path.name, value))
+
+    conflicts = []
+    records = []
+    for no in range(1, total + 1):
+        defaults = default_titles(no)
+        record = {"no": no, "id": f"h{no}"}
+        for field in FIELDS:
+            found = values.get((no, field), [])
+            if len({value for _, value in found}) > 1:
+                conflicts.append((no, field, found))
+            if found:
+                record[field] = found[0][1]
+            else:
+                record[field] = get_category(no) if field == "category" else defaults[field]
+        # 분류는 번호 범위로 정해지므로 원본 값이 범위와 다르면 충돌로 처리
+        if record["category"] != get_category(no):
+            conflicts.append((no, "category", values.get((no, "category"), []) +
+                              [("번호 범위", get_category(no))]))
+        record["hash"] = record_hash(record)
+        records.append(record)
+
+    if conflicts:
+        raise CatalogConflict(conflicts)
+    return records
+
+
+def load_catalog(path=CATALOG_PATH):
+    """저장된 카탈로그 {"version", "digest", "hymns"} (없으면 None)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_catalog(records, path=CATALOG_PATH):
+    """곡마다 한 줄씩 저장 (변경된 곡이 diff에서 한 줄로 보이도록)"""
+    path = Path(path)
+    lines = [json.dumps(record, ensure_ascii=False) for record in records]
+    text = ('{\n'
+            f'  "version": {CATALOG_VERSION},\n'
+            f'  "digest": "{catalog_digest(records)}",\n'
+            '  "hymns": [\n    ' + ',\n    '.join(lines) + '\n  ]\n'
+            '}\n')
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def changed_hymns(old_records, new_records):
+    """해시가 달라진 곡 번호 목록"""
+    old = {record["no"]: record.get("hash") for record in old_records}
+    return [record["no"] for record in new_records if old.get(record["no"]) != record["hash"]]
+
+
+def artifact_inputs(digest, kind):
+    """생성 파일의 입력 해시 (카탈로그 내용 + 출력 형식)"""
+    return hashlib.sha256(f"{digest}:{kind}:{FORMAT_VERSIONS[kind]}".encode('ascii')).hexdigest()[:16]
+
+
+def build(force=False, check=False, on_event=print):
+    """
+    원본 → 카탈로그 → 생성 파일 순서로 바뀐 것만 다시 만듦
+    check=True면 파일을 쓰지 않고 다시 만들어야 하는 항목만 확인
+    반환: 다시 만들었거나(check면 만들어야 하는) 경로 목록
+    """
+    records = merge_sources()
+    digest = catalog_digest(records)
+    stale = []
+
+    saved = load_catalog()
+    if force or saved is None or saved.get("digest") != digest:
+        changed = changed_hymns(saved["hymns"] if saved else [], records)
+        stale.append(CATALOG_PATH)
+        if not check:
+            save_catalog(records)
+        on_event(f"📚 카탈로그 갱신: 바뀐 곡 {len(changed)}개 {changed[:20]}")
+
+    for path, kind in ARTIFACTS:
+        inputs = artifact_inputs(digest, kind)
+        if not force and read_inputs_digest(path) == inputs:
+            continue
+        stale.append(path)
+        if check:
+            continue
+        records_iter = hymn_records(*_title_maps(records))
+        if kind == "ts":
+            write_dataset(records_iter, ts_path=path, source="scripts/build_catalog.py", inputs=inputs)
+        elif kind == "json":
+            write_dataset(records_iter, json_path=path, source="scripts/build_catalog.py", inputs=inputs)
+        else:
+            write_index(records_iter, path, inputs=inputs)
+        on_event(f"🛠️  생성: {path.relative_to(BASE_DIR)}")
+    return stale
+
+
+def _title_maps(records):
+    """카탈로그 레코드 → hymn_records()에 넘길 언어별 {번호: 제목}"""
+    return tuple({record["no"]: record[lang] for record in records} for lang in ("ko", "en", "es"))
@@ -0,0 +1,134 @@
+"""
+백그라운드 로그 기록기
+log() 호출은 콘솔에 출력하고 큐에 넣기만 하며, 파일 쓰기는 전용 스레드가 모아서 처리
+(메시지마다 파일을 열고 닫지 않으므로 동시 다운로드 중에도 다운로드 스레드가 기다리지 않음)
+
+- 로그 파일: 한 줄에 하나씩 JSON {"ts", "hymn", "phase", "msg"} (JSON Lines)
+- 큐에 쌓인 메시지를 최대 FLUSH_INTERVAL초마다 한 번에 기록
+- 파일이 MAX_BYTES를 넘으면 download_log.jsonl.1, .2 ...로 밀어내고 새 파일 시작
+"""
+
+import json
+import queue
+import threading
+import time
+from pathlib import Path
+
+from hymnkit import metrics
+
+FLUSH_INTERVAL = 0.5        # 기록 주기 (초)
+BATCH_SIZE = 512            # 한 번에 기록하는 최대 줄 수
+MAX_BYTES = 5 * 1024 * 1024
+BACKUP_COUNT = 3
+
+_STOP = object()
+
+
+class BackgroundLog:
+    """log(message, hymn=None, phase=None) 형태로 호출하는 로그 기록기"""
+
+    def __init__(self, path, max_bytes=MAX_BYTES, backup_count=BACKUP_COUNT,
+                 flush_interval=FLUSH_INTERVAL, echo=True):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.flush_interval = flush_interval
+        self.echo = echo
+        self.dropped = 0
+        self._queue = queue.SimpleQueue()
+        self._file = None
+        self._size = 0
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def __call__(self, message, hymn=None, phase=None):
+        if self.echo:
+            print(message)
+        text = message.strip()
+        if not text:
+            return
+        if hymn is None:
+            hymn = metrics.current_hymn()
+        self._queue.put({
+            "ts": time.strftime('%Y-%m-%dT%H:%M:%S'),
+            "hymn": hymn,
+            "phase": phase,
+            "msg": text,
+        })
+
+    def close(self):
+        """남은 메시지를 모두 기록하고 종료"""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---- 기록 스레드 ----
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            batch = []
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            # 대기 중인 메시지를 한꺼번에 모아 한 번에 기록
+            while item is not _STOP:
+                batch.append(item)
+                if len(batch) >= BATCH_SIZE:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            stopping = item is _STOP
+            if batch:
+                self._write(batch)
+        if self._file is not None:
+            self._file.close()
+
+    def _write(self, batch):
+        try:
+            if self._file is None:
+                self._open()
+            pending = []
+            pending_size = 0
+            for record in batch:
+                line = (json.dumps(record, ensure_ascii=False) + "\n").encode('utf-8')
+                # 크기 제한을 넘기 전에 모아 둔 줄을 기록하고 새 파일로 교체
+                if self._size + pending_size + len(line) > self.max_bytes and self._size + pending_size:
+                    self._file.write(b"".join(pending))
+                    self._rotate()
+                    pending, pending_size = [], 0
+                pending.append(line)
+                pending_size += len(line)
+            self._file.write(b"".join(pending))
+            self._file.flush()
+            self._size += pending_size
+        except OSError:
+            # 로그 기록 실패로 다운로드를 멈추지 않음 (콘솔 출력은 이미 됨)
+            self.dropped += len(batch)
+
+    def _open(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'ab')
+        self._size = self._file.tell()
+
+    def _rotate(self):
+        self._file.close()
+        self._file = None
+        for index in range(self.backup_count - 1, 0, -1):
+            source = self.path.with_name(f"{self.path.name}.{index}")
+            if source.exists():
+                source.replace(self.path.with_name(f"{self.path.name}.{index + 1}"))
+        if self.backup_count > 0:
+            self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink()
+        self._open()
@@ -0,0 +1,189 @@
+"""
+단계별 소요 시간 측정
+곡마다 연결(DNS+TCP+TLS), 첫 바이트까지 시간(TTFB), 페이지 받기, MP3 URL 추출,
+MP3 본문 전송 시간을 기록하고 p50/p95/p99와 전송 속도(MB/s)로 요약
+JSON 또는 Prometheus 텍스트 형식으로 내보냄
+
+측정 지점은 record()/timer()만 호출하고, set_active()로 수집기를 지정하지 않으면 아무것도 하지 않음
+현재 처리 중인 곡 번호는 contextvars로 전달 (asyncio 엔진의 스레드 실행에도 전달됨)
+"""
+
+import json
+import math
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# 단계 이름 (보고서 출력 순서)
+LIST = "list"           # 목록 페이지 받기 + 링크 추출
+HYMN = "hymn"           # 곡 하나 전체
+PAGE = "page"           # 찬송가 페이지 받기 + MP3 URL 추출
+EXTRACT = "extract"     # MP3 URL 검색에 쓴 CPU 시간
+TRANSFER = "transfer"   # MP3 다운로드 (조건부 요청 포함)
+CONNECT = "connect"     # 새 연결 (DNS + TCP + TLS)
+TTFB = "ttfb"           # 요청 후 응답 헤더까지
+WAIT = "wait"           # 속도 제한기 대기 (page/transfer 시간에 포함됨)
+PHASES = (LIST, HYMN, PAGE, EXTRACT, TRANSFER, CONNECT, TTFB, WAIT)
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+_current_hymn = ContextVar("current_hymn", default=None)
+_active = None
+
+
+def percentile(sorted_values, q):
+    """정렬된 값에서 q 분위수 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    rank = min(max(math.ceil(q * len(sorted_values)), 1), len(sorted_values))
+    return sorted_values[rank - 1]
+
+
+class Metrics:
+    """단계별 소요 시간과 전송 바이트 수집기 (여러 스레드에서 동시에 사용 가능)"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.finished = None
+        self.bytes = 0
+        self._samples = {}
+        self._hymns = {}
+        self._lock = threading.Lock()
+
+    def record(self, phase, seconds, hymn_no=None):
+        with self._lock:
+            self._samples.setdefault(phase, []).append(seconds)
+            if hymn_no is not None:
+                phases = self._hymns.setdefault(hymn_no, {})
+                phases[phase] = phases.get(phase, 0.0) + seconds
+
+    def add_bytes(self, count):
+        with self._lock:
+            self.bytes += count
+
+    def finish(self):
+        self.finished = time.perf_counter()
+
+    @property
+    def wall_seconds(self):
+        return (self.finished or time.perf_counter()) - self.started
+
+    def summary(self):
+        """{"wall_seconds", "bytes", "throughput_mb_s", "transfer_mb_s", "phases", "hymns"}"""
+        with self._lock:
+            samples = {phase: sorted(values) for phase, values in self._samples.items()}
+            hymns = {no: dict(phases) for no, phases in sorted(self._hymns.items())}
+            total_bytes = self.bytes
+
+        phases = {}
+        for phase in sorted(samples, key=lambda p: PHASES.index(p) if p in PHASES else len(PHASES)):
+            values = samples[phase]
+            stats = {"count": len(values), "sum": sum(values), "max": values[-1]}
+            for q in QUANTILES:
+                stats[f"p{int(q * 100)}"] = percentile(values, q)
+            phases[phase] = stats
+
+        wall = self.wall_seconds
+        transfer_time = phases.get(TRANSFER, {}).get("sum", 0.0)
+        mb = total_bytes / (1024 * 1024)
+        return {
+            "wall_seconds": wall,
+            "bytes": total_bytes,
+            "throughput_mb_s": mb / wall if wall else 0.0,
+            # 곡 하나의 전송 속도 (동시 다운로드를 합한 값이 아님)
+            "transfer_mb_s": mb / transfer_time if transfer_time else 0.0,
+            "phases": phases,
+            "hymns": hymns,
+        }
+
+    def report_lines(self):
+        """최종 요약에 넣을 단계별 지연 시간 표"""
+        summary = self.summary()
+        lines = ["⏱️  단계별 소요 시간 (ms):",
+                 f"   {'단계':<10}{'횟수':>6}{'p50':>10}{'p95':>10}{'p99':>10}{'최대':>10}"]
+        for phase, stats in summary["phases"].items():
+            lines.append(f"   {phase:<10}{stats['count']:>6}"
+                         f"{stats['p50']*1000:>10.1f}{stats['p95']*1000:>10.1f}"
+                         f"{stats['p99']*1000:>10.1f}{stats['max']*1000:>10.1f}")
+        lines.append(f"   📦 {summary['bytes'] / (1024 * 1024):.1f} MB / {summary['wall_seconds']:.1f}초 "
+                     f"→ 전체 {summary['throughput_mb_s']:.2f} MB/s, "
+                     f"곡당 전송 {summary['transfer_mb_s']:.2f} MB/s")
+        return lines
+
+    def to_json(self):
+        summary = self.summary()
+        summary["hymns"] = {str(no): phases for no, phases in summary["hymns"].items()}
+        return json.dumps(summary, ensure_ascii=False, indent=2)
+
+    def to_prometheus(self):
+        summary = self.summary()
+        lines = ["# HELP hymnkit_phase_seconds 다운로드 단계별 소요 시간",
+                 "# TYPE hymnkit_phase_seconds summary"]
+        for phase, stats in summary["phases"].items():
+            for q in QUANTILES:
+                lines.append(f'hymnkit_phase_seconds{{phase="{phase}",quantile="{q}"}} '
+                             f'{stats[f"p{int(q * 100)}"]:.6f}')
+            lines.append(f'hymnkit_phase_seconds_sum{{phase="{phase}"}} {stats["sum"]:.6f}')
+            lines.append(f'hymnkit_phase_seconds_count{{phase="{phase}"}} {stats["count"]}')
+        lines += ["# HELP hymnkit_bytes_total 받은 MP3 바이트 수",
+                  "# TYPE hymnkit_bytes_total counter",
+                  f"hymnkit_bytes_total {summary['bytes']}",
+                  "# HELP hymnkit_throughput_mb_s 전체 실행 시간 기준 전송 속도",
+                  "# TYPE hymnkit_throughput_mb_s gauge",
+                  f"hymnkit_throughput_mb_s {summary['throughput_mb_s']:.6f}",
+                  "# HELP hymnkit_wall_seconds 전체 실행 시간",
+                  "# TYPE hymnkit_wall_seconds gauge",
+                  f"hymnkit_wall_seconds {summary['wall_seconds']:.6f}"]
+        return "\n".join(lines) + "\n"
+
+    def export(self, path):
+        """확장자가 .prom이면 Prometheus 텍스트, 그 외에는 JSON으로 저장"""
+        text = self.to_prometheus() if path.suffix == '.prom' else self.to_json()
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+
+# ---- 측정 지점에서 사용하는 함수 ----
+
+def set_active(metrics):
+    """측정값을 모을 수집기 지정 (None이면 측정하지 않음)"""
+    global _active
+    _active = metrics
+
+
+def record(phase, seconds):
+    metrics = _active
+    if metrics is not None:
+        metrics.record(phase, seconds, _current_hymn.get())
+
+
+def add_bytes(count):
+    metrics = _active
+    if metrics is not None:
+        metrics.add_bytes(count)
+
+
+@contextmanager
+def timer(phase):
+    """with 블록의 소요 시간을 phase로 기록 (예외가 나도 기록)"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(phase, time.perf_counter() - start)
+
+
+def current_hymn():
+    """지금 처리 중인 곡 번호 (hymn() 블록 밖이면 None)"""
+    return _current_hymn.get()
+
+
+@contextmanager
+def hymn(hymn_no):
+    """with 블록 안에서 기록하는 값을 hymn_no 곡으로 집계"""
+    token = _current_hymn.set(hymn_no)
+    try:
+        yield
+    finally:
+        _current_hymn.reset(token)
@@ -0,0 +1,217 @@
+"""
+라이즌 사이트(risen.runean.com) 로컬 모의 서버
+실제 사이트에 접속하지 않고 다운로드 경로 전체를 재현하기 위한 합성 페이지 제공
+
+- /entry/찬송가-목록: "찬송가 N장 바로가기" 링크가 있는 목록 페이지
+- /entry/새찬송가-N장-<제목>-가사악보NWC: 본문 중간에 <audio src=".../tfile.mp3">가 있는 글
+- /dn/<N>/tfile.mp3: 곡마다 내용이 다른 MP3 프레임 (ETag/조건부 요청/Range 지원)
+
+지연 시간(latency), 연결당 대역폭(bandwidth), 오류 비율(error_rate)을 조절할 수 있음
+"""
+
+import hashlib
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import quote, unquote
+
+from hymnkit.catalog import TOTAL_HYMNS
+
+LIST_PATH = "/entry/찬송가-목록"
+DEFAULT_MP3_SIZE = 512 * 1024
+SEND_CHUNK = 16 * 1024      # 대역폭 제한 시 한 번에 보내는 크기
+
+# MPEG-1 Layer III, 128kbps, 44.1kHz 프레임 (헤더 4바이트 + 본문 413바이트)
+FRAME_HEADER = bytes([0xFF, 0xFB, 0x90, 0x64])
+FRAME_SIZE = 417
+
+FILLER = ('<p class="lyrics">주 하나님 지으신 모든 세계 내 마음 속에 그리어 볼 때 '
+          '하늘의 별 울려 퍼지는 뇌성 주님의 권능 우주에 찼네</p>\n') * 200
+
+
+def entry_path(hymn_no):
+    return f"/entry/새찬송가-{hymn_no}장-모의-찬송-{hymn_no}-가사악보NWC"
+
+
+def mp3_body(hymn_no, size):
+    """곡 번호가 본문에 들어간 MP3 프레임 (곡마다 내용이 달라 중복 저장소에서 합쳐지지 않음)"""
+    payload = f"hymn-{hymn_no:04d}".encode().ljust(FRAME_SIZE - len(FRAME_HEADER), b'\0')
+    frames = max(size // FRAME_SIZE, 1)
+    return (FRAME_HEADER + payload) * frames
+
+
+class MockSite:
+    """
+    백그라운드 스레드에서 실행되는 모의 사이트
+    latency: 응답마다 더하는 지연 (초), bandwidth: 연결당 초당 바이트 (None이면 제한 없음),
+    error_rate: 찬송가 페이지와 MP3 요청이 503으로 실패할 확률
+    """
+
+    def __init__(self, hymns=TOTAL_HYMNS, mp3_size=DEFAULT_MP3_SIZE,
+                 latency=0.0, bandwidth=None, error_rate=0.0, seed=0):
+        self.hymns = hymns
+        self.mp3_size = mp3_size
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.error_rate = error_rate
+        self.requests = 0
+        self.errors = 0
+        self.bytes_sent = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._bodies = {}
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    @property
+    def list_url(self):
+        return self.base_url + LIST_PATH
+
+    def start(self):
+        site = self
+
+        class Handler(_Handler):
+            pass
+        Handler.site = site
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # ---- 응답 내용 ----
+
+    def list_page(self):
+        items = "".join(
+            f'<li><a href="{quote(entry_path(no))}">찬송가 {no}장 바로가기</a></li>\n'
+            for no in range(1, self.hymns + 1))
+        return (f'<!DOCTYPE html><html><head><title>찬송가 목록</title></head><body>'
+                f'<ul class="hymns">\n{items}</ul></body></html>').encode('utf-8')
+
+    def entry_page(self, hymn_no):
+        mp3_url = f"{self.base_url}/dn/{hymn_no}/tfile.mp3"
+        return ('<!DOCTYPE html><html><head><title>새찬송가 {0}장</title></head><body>'
+                '<div class="article">{1}'
+                '<figure class="fileblock"><audio controls src="{2}"></audio></figure>'
+                '{1}</div></body></html>').format(hymn_no, FILLER, mp3_url).encode('utf-8')
+
+    def mp3(self, hymn_no):
+        with self._lock:
+            body = self._bodies.get(hymn_no)
+            if body is None:
+                body = mp3_body(hymn_no, self.mp3_size)
+                etag = '"%s"' % hashlib.md5(body).hexdigest()
+                body = self._bodies[hymn_no] = (body, etag)
+        return body
+
+    def should_fail(self):
+        with self._lock:
+            self.requests += 1
+            if self.error_rate and self._random.random() < self.error_rate:
+                self.errors += 1
+                return True
+        return False
+
+    def format_stats(self):
+        return (f"🧪 모의 서버: 요청 {self.requests}회, 주입한 오류 {self.errors}회, "
+                f"전송 {self.bytes_sent / (1024 * 1024):.1f} MB")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    site = None
+    protocol_version = "HTTP/1.1"   # keep-alive (연결 재사용 측정용)
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        site = self.site
+        path = unquote(self.path.split('?', 1)[0])
+        if site.latency:
+            time.sleep(site.latency)
+
+        if path == LIST_PATH:
+            body = site.list_page()
+            etag = '"%s"' % hashlib.md5(body).hexdigest()
+            if self.headers.get('If-None-Match') == etag:
+                return self._send(304, b'', 'text/html', {'ETag': etag}, with_length=False)
+            return self._send(200, body, 'text/html; charset=utf-8', {'ETag': etag})
+
+        hymn_no = self._hymn_no(path)
+        if hymn_no is None or not 1 <= hymn_no <= site.hymns:
+            return self._send(404, b'', 'text/plain')
+        if site.should_fail():
+            return self._send(503, b'', 'text/plain')
+        if path.startswith('/entry/'):
+            return self._send(200, site.entry_page(hymn_no), 'text/html; charset=utf-8')
+        return self._send_mp3(*site.mp3(hymn_no))
+
+    @staticmethod
+    def _hymn_no(path):
+        try:
+            if path.startswith('/entry/새찬송가-'):
+                return int(path[len('/entry/새찬송가-'):].split('장', 1)[0])
+            if path.startswith('/dn/') and path.endswith('/tfile.mp3'):
+                return int(path.split('/')[2])
+        except ValueError:
+            pass
+        return None
+
+    def _send_mp3(self, body, etag):
+        headers = {'ETag': etag, 'Accept-Ranges': 'bytes'}
+        if self.headers.get('If-None-Match') == etag:
+            return self._send(304, b'', 'audio/mpeg', headers, with_length=False)
+
+        range_header = self.headers.get('Range', '')
+        if_range = self.headers.get('If-Range')
+        if range_header.startswith('bytes=') and if_range in (None, etag):
+            start = int(range_header[len('bytes='):].split('-', 1)[0] or 0)
+            if start >= len(body):
+                headers['Content-Range'] = f'bytes */{len(body)}'
+                return self._send(416, b'', 'audio/mpeg', headers)
+            headers['Content-Range'] = f'bytes {start}-{len(body) - 1}/{len(body)}'
+            return self._send(206, body[start:], 'audio/mpeg', headers)
+        return self._send(200, body, 'audio/mpeg', headers)
+
+    def _send(self, status, body, content_type, headers=None, with_length=True):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        if with_length:
+            self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+
+        bandwidth = self.site.bandwidth
+        try:
+            if not bandwidth:
+                self.wfile.write(body)
+            else:
+                for pos in range(0, len(body), SEND_CHUNK):
+                    chunk = body[pos:pos + SEND_CHUNK]
+                    self.wfile.write(chunk)
+                    time.sleep(len(chunk) / bandwidth)
+        except (BrokenPipeError, ConnectionResetError):
+            # 클라이언트가 MP3 링크를 찾고 연결을 닫은 경우
+            self.close_connection = True
+            return
+        with self.site._lock:
+            self.site.bytes_sent += len(body)
@@ -0,0 +1,275 @@
+"""
+MP3 조건부/이어받기 다운로드
+파일마다 메타데이터 사이드카(<파일명>.meta.json)에 ETag, Last-Modified,
+Content-Length, SHA-256을 저장해 두고
+
+- 완료된 파일은 조건부 GET(If-None-Match / If-Modified-Since)으로 변경 여부만 확인
+- 중단된 다운로드(<파일명>.part)는 Range 요청으로 이어받기
+- 받은 바이트 수가 Content-Length와 다르면 완료로 취급하지 않음
+- 쓰는 동안 같은 조각으로 SHA-256과 MP3 프레임 헤더를 검사 (파일을 다시 읽지 않음)
+- 본문은 큰 조각으로 읽고 쓰기 지연 스레드(hymnkit.file_writer)로 기록,
+  완료된 .part만 제자리로 이름을 바꿔서 받다 만 파일이 완료된 것처럼 보이지 않음
+- store(hymnkit.blob_store.BlobStore)를 주면 같은 음원은 한 번만 저장하고,
+  해시를 이미 아는 URL은 받지 않고 기존 blob을 연결
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+from pathlib import Path
+
+from hymnkit import http_client, metrics
+from hymnkit.file_writer import DEFAULT_BUFFER_SIZE, WriteBehindWriter
+from hymnkit.mp3_frames import InvalidMp3, Mp3Scanner
+
+CHUNK_SIZE = 256 * 1024             # 네트워크에서 한 번에 읽을 크기
+WRITE_BUFFER_SIZE = DEFAULT_BUFFER_SIZE
+HASH_BLOCK = 1024 * 1024
+
+# fetch_mp3 결과
+DOWNLOADED = "downloaded"       # 새로 받음
+RESUMED = "resumed"             # 이어받기로 완료
+NOT_MODIFIED = "not_modified"   # 서버 파일이 바뀌지 않아 다운로드 생략
+LINKED = "linked"               # 같은 음원이 저장소에 있어 다운로드 없이 연결
+
+
+class IncompleteDownload(IOError):
+    """받은 크기가 Content-Length와 다름 (.part 파일은 이어받기용으로 남겨둠)"""
+
+
+def meta_path(filepath):
+    return filepath.with_name(filepath.name + '.meta.json')
+
+
+def part_path(filepath):
+    return filepath.with_name(filepath.name + '.part')
+
+
+def load_meta(filepath):
+    """사이드카 메타데이터 로드 (없거나 깨졌으면 빈 딕셔너리)"""
+    path = meta_path(filepath)
+    if path.exists():
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except ValueError:
+            pass
+    return {}
+
+
+def save_meta(filepath, meta):
+    """사이드카 메타데이터 저장 (임시 파일에 쓰고 교체)"""
+    path = meta_path(filepath)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def file_sha256(filepath, hasher=None, scanner=None):
+    """파일 SHA-256 계산 (이어받기 시 기존 부분을 먼저 해시와 프레임 검사기에 반영)"""
+    hasher = hasher or hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK), b''):
+            hasher.update(block)
+            if scanner is not None:
+                scanner.feed(block)
+    return hasher
+
+
+def _validators(response):
+    return {
+        "etag": response.headers.get('ETag'),
+        "last_modified": response.headers.get('Last-Modified'),
+    }
+
+
+def _total_length(response, offset):
+    """응답에서 전체 파일 크기 계산 (206이면 Content-Range 기준)"""
+    content_range = response.headers.get('Content-Range', '')
+    match = re.search(r'/(\d+)$', content_range)
+    if match:
+        return int(match.group(1))
+    length = response.headers.get('Content-Length')
+    if length is None:
+        return None
+    return int(length) + (offset if response.status_code == 206 else 0)
+
+
+def _conditional_headers(meta):
+    headers = {}
+    if meta.get("etag"):
+        headers['If-None-Match'] = meta["etag"]
+    if meta.get("last_modified"):
+        headers['If-Modified-Since'] = meta["last_modified"]
+    return headers
+
+
+def _stream_to_part(response, filepath, offset, meta,
+                    chunk_size=CHUNK_SIZE, buffer_size=WRITE_BUFFER_SIZE):
+    """응답 본문을 .part 파일에 쓰고 완료되면 제자리로 이동"""
+    part = part_path(filepath)
+    total = _total_length(response, offset)
+
+    # 미리 확보한 .part는 비정상 종료 시 실제로 받은 크기보다 클 수 있으므로 표시해 둠
+    meta.update(_validators(response))
+    meta.update({"content_length": total, "complete": False, "preallocated": True})
+    save_meta(filepath, meta)
+
+    scanner = Mp3Scanner()
+    hasher = file_sha256(part, scanner=scanner) if offset else hashlib.sha256()
+    writer = WriteBehindWriter(part, offset=offset, total=total, buffer_size=buffer_size)
+    try:
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            if chunk:
+                writer.write(chunk)
+                hasher.update(chunk)
+                scanner.feed(chunk)
+    finally:
+        # 정상적으로 닫혔으면 .part 크기 = 실제로 받은 크기 (중단돼도 이어받기 가능)
+        writer.close()
+        meta["preallocated"] = False
+        save_meta(filepath, meta)
+    received = writer.written
+    metrics.add_bytes(received - offset)
+
+    if total is not None and received != total:
+        raise IncompleteDownload(f"{received}/{total} bytes")
+    try:
+        scanner.finish()
+    except InvalidMp3:
+        # 이어받아도 고쳐지지 않으므로 다음 시도는 처음부터
+        os.remove(part)
+        raise
+
+    os.replace(part, filepath)
+    meta.update({"content_length": received, "sha256": hasher.hexdigest(), "complete": True})
+    save_meta(filepath, meta)
+
+
+def _adopt_existing(response, filepath, meta):
+    """메타데이터 없이 이미 있던 파일을 Range 응답으로 확인하고 메타데이터 생성"""
+    size = filepath.stat().st_size
+    total = _total_length(response, size)
+    if response.status_code == 416:
+        # 요청한 범위가 파일 끝 이후 → 이미 전체를 받은 파일
+        total = size
+    if total != size:
+        return False
+    scanner = Mp3Scanner()
+    hasher = file_sha256(filepath, scanner=scanner)
+    try:
+        scanner.finish()
+    except InvalidMp3:
+        return False
+    # 416 응답에는 ETag가 없을 수 있으므로 있는 값만 반영
+    meta.update({k: v for k, v in _validators(response).items() if v})
+    meta.update({"content_length": size, "sha256": hasher.hexdigest(), "complete": True})
+    save_meta(filepath, meta)
+    return True
+
+
+def fetch_mp3(mp3_url, filepath, timeout=60, chunk_size=CHUNK_SIZE,
+              buffer_size=WRITE_BUFFER_SIZE, store=None):
+    """
+    MP3 다운로드 (조건부 요청 + 이어받기)
+    결과 상수(DOWNLOADED / RESUMED / NOT_MODIFIED / LINKED)를 반환하고, 실패 시 예외 발생
+    chunk_size: 네트워크 읽기 단위, buffer_size: 디스크 쓰기 단위
+    store: 중복 음원을 한 번만 저장할 BlobStore (없으면 파일을 그대로 저장)
+    """
+    filepath = Path(filepath)
+    if store is not None and not filepath.exists():
+        entry = store.link(mp3_url, filepath)
+        if entry is not None:
+            part = part_path(filepath)
+            if part.exists():
+                os.remove(part)
+            save_meta(filepath, {
+                "url": mp3_url, "etag": entry.get("etag"),
+                "last_modified": entry.get("last_modified"),
+                "content_length": filepath.stat().st_size,
+                "sha256": entry["sha256"], "complete": True,
+            })
+            return LINKED
+
+    result = _fetch(mp3_url, filepath, timeout, chunk_size, buffer_size)
+    if store is not None:
+        meta = load_meta(filepath)
+        if meta.get("complete") and meta.get("sha256"):
+            store.add(filepath, meta["sha256"], mp3_url, meta)
+    return result
+
+
+def _fetch(mp3_url, filepath, timeout, chunk_size, buffer_size):
+    stream = {"chunk_size": chunk_size, "buffer_size": buffer_size}
+    part = part_path(filepath)
+    meta = load_meta(filepath)
+    if meta.get("url") != mp3_url:
+        meta = {"url": mp3_url, **{k: v for k, v in meta.items() if k != "url"}}
+
+    # 1) 완료된 파일: 변경 여부만 확인
+    if filepath.exists() and meta.get("complete") and \
+            filepath.stat().st_size == meta.get("content_length"):
+        headers = _conditional_headers(meta)
+        if not headers:
+            return NOT_MODIFIED
+        response = http_client.get(mp3_url, headers=headers, timeout=timeout, stream=True)
+        with response:
+            if response.status_code == 304:
+                return NOT_MODIFIED
+            response.raise_for_status()
+            _stream_to_part(response, filepath, 0, meta, **stream)
+        return DOWNLOADED
+
+    # 2) 메타데이터 없이 남아 있는 기존 파일: 끝 이후 범위를 요청해 완전한지 확인
+    if filepath.exists() and not meta.get("complete"):
+        size = filepath.stat().st_size
+        response = http_client.get(mp3_url, headers={'Range': f'bytes={size}-'},
+                                   timeout=timeout, stream=True)
+        with response:
+            if response.status_code in (200, 206, 416) and _adopt_existing(response, filepath, meta):
+                return NOT_MODIFIED
+            if response.status_code == 206:
+                # 잘린 파일 → 이어받기 (하드링크된 blob을 덮어쓰지 않도록 링크면 복사)
+                if filepath.stat().st_nlink > 1:
+                    shutil.copyfile(filepath, part)
+                    os.remove(filepath)
+                else:
+                    os.replace(filepath, part)
+                _stream_to_part(response, filepath, size, meta, **stream)
+                return RESUMED
+        # 서버 응답으로 판단할 수 없으면 처음부터 다시 받음
+
+    # 3) 중단된 .part 파일: 같은 버전일 때만 이어받기 (If-Range)
+    headers = {}
+    offset = part.stat().st_size if part.exists() else 0
+    validator = meta.get("etag") or meta.get("last_modified")
+    if meta.get("preallocated"):
+        offset = 0      # 미리 확보한 채로 중단된 .part는 크기를 믿을 수 없음
+    if offset and validator:
+        headers = {'Range': f'bytes={offset}-', 'If-Range': validator}
+    else:
+        offset = 0
+
+    response = http_client.get(mp3_url, headers=headers, timeout=timeout, stream=True)
+    with response:
+        if response.status_code == 416 and offset and meta.get("content_length") == offset:
+            # .part가 이미 전체 크기 → 검사 후 그대로 완료 처리
+            scanner = Mp3Scanner()
+            hasher = file_sha256(part, scanner=scanner)
+            try:
+                scanner.finish()
+            except InvalidMp3:
+                os.remove(part)
+                raise
+            os.replace(part, filepath)
+            meta.update({"sha256": hasher.hexdigest(), "complete": True})
+            save_meta(filepath, meta)
+            return RESUMED
+        response.raise_for_status()
+        if response.status_code != 206:
+            offset = 0      # 서버가 Range를 무시했거나 파일이 바뀜 → 처음부터
+        _stream_to_part(response, filepath, offset, meta, **stream)
+    return RESUMED if offset else DOWNLOADED
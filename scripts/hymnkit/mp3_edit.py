@@ -0,0 +1,179 @@
+"""
+MP3 프레임 단위 편집 (디코더/인코더 없이)
+오디오를 풀지 않고 프레임 헤더와 Layer III 사이드 정보만 읽고 고침
+
+- 음량: 그래뉼마다 global_gain 값을 같은 만큼 올리거나 내림 (1단계 = 1.5 dB, mp3gain과 같은 방식, 무손실)
+  곡의 음량은 소리가 있는 그래뉼의 global_gain 중앙값으로 어림
+- 무음: 스펙트럼 데이터 비트(part2_3_length)가 거의 없는 프레임을 무음으로 보고 앞뒤에서 잘라냄
+- 미리듣기: 시작 위치부터 정해진 길이만큼 프레임 경계에서 잘라냄
+
+프레임 경계에서 자르면 첫 프레임이 앞 프레임의 비트 저장소(bit reservoir)를 참조할 수 있어
+디코더가 그 한 프레임(약 26ms)을 무음으로 처리하지만, 나머지는 원본과 같은 소리
+Xing/Info(VBR) 헤더 프레임은 자른 뒤에는 프레임 수가 맞지 않으므로 뺌
+"""
+
+import statistics
+
+from hymnkit.mp3_frames import InvalidMp3, frame_info
+
+GAIN_STEP_DB = 1.5
+SILENT_BITS = 64                # 프레임의 스펙트럼 데이터 비트가 이 이하면 무음
+KEEP_SILENCE = 0.2              # 잘라낸 무음 앞뒤에 남겨 둘 길이 (초)
+
+
+def id3v2_size(data):
+    """파일 앞 ID3v2 태그 크기 (없으면 0)"""
+    if data[:3] != b'ID3' or len(data) < 10:
+        return 0
+    size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+    return 10 + size + (10 if data[5] & 0x10 else 0)
+
+
+def read_frames(data):
+    """
+    (앞 태그, [(위치, 프레임 정보)], 뒤 태그/잡데이터) 반환
+    프레임이 끊긴 뒤의 데이터(ID3v1, APE 태그 등)는 뒤 태그로 그대로 보존
+    """
+    start = id3v2_size(data)
+    pos = data.find(b'\xff', start)
+    frames = []
+    while 0 <= pos and pos + 4 <= len(data):
+        info = frame_info(data[pos:pos + 4])
+        if info is None or pos + info["length"] > len(data):
+            if frames:
+                break
+            pos = data.find(b'\xff', pos + 1)
+            continue
+        frames.append((pos, info))
+        pos += info["length"]
+    if not frames:
+        raise InvalidMp3("MP3 프레임을 찾을 수 없음")
+    end = frames[-1][0] + frames[-1][1]["length"]
+    return data[:start], frames, data[end:]
+
+
+def _side_info(info):
+    """(사이드 정보 시작 위치, 길이(바이트), 그래뉼/채널 블록 시작 비트 목록)"""
+    start = 4 + (2 if info["crc"] else 0)
+    mono = info["channels"] == 1
+    if info["mpeg1"]:
+        length = 17 if mono else 32
+        first = 9 + (5 if mono else 3) + 4 * info["channels"]    # main_data_begin, private, scfsi
+        block = 59
+        granules = 2
+    else:
+        length = 9 if mono else 17
+        first = 8 + (1 if mono else 2)
+        block = 63
+        granules = 1
+    blocks = [first + block * i for i in range(granules * info["channels"])]
+    return start, length, blocks
+
+
+def xing_offset(info):
+    """프레임 시작부터 Xing/Info 태그 위치 (사이드 정보 바로 뒤)"""
+    side_start, side_length, _ = _side_info(info)
+    return side_start + side_length
+
+
+def is_info_frame(data, offset, info):
+    """Xing/Info/VBRI(VBR 정보) 프레임인지"""
+    if info["layer"] != 3:
+        return False
+    tag_pos = offset + xing_offset(info)
+    return data[tag_pos:tag_pos + 4] in (b'Xing', b'Info') or data[offset + 36:offset + 40] == b'VBRI'
+
+
+def granules(data, offset, info):
+    """Layer III 프레임의 그래뉼/채널마다 (part2_3_length, global_gain)"""
+    side_start, side_length, blocks = _side_info(info)
+    side = int.from_bytes(data[offset + side_start:offset + side_start + side_length], 'big')
+    total_bits = side_length * 8
+    out = []
+    for bit in blocks:
+        part2_3 = (side >> (total_bits - bit - 12)) & 0xFFF
+        gain = (side >> (total_bits - bit - 29)) & 0xFF        # part2_3_length(12) + big_values(9) 뒤
+        out.append((part2_3, gain))
+    return out
+
+
+def is_silent(data, offset, info):
+    if info["layer"] != 3:
+        return False
+    return sum(bits for bits, _ in granules(data, offset, info)) <= SILENT_BITS
+
+
+def median_gain(data, frames):
+    """소리가 있는 그래뉼의 global_gain 중앙값 (Layer III가 아니거나 모두 무음이면 None)"""
+    gains = []
+    for offset, info in frames:
+        if info["layer"] == 3:
+            gains.extend(gain for bits, gain in granules(data, offset, info) if bits > SILENT_BITS)
+    return statistics.median(gains) if gains else None
+
+
+def _crc16(data, crc=0xFFFF):
+    """MPEG 오디오 CRC-16 (다항식 0x8005)"""
+    for byte in data:
+        crc ^= byte << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x8005) if crc & 0x8000 else crc << 1
+            crc &= 0xFFFF
+    return crc
+
+
+def adjust_gain(frame, info, steps):
+    """프레임 하나(bytearray)의 global_gain을 steps만큼 바꿈 (0~255로 제한, CRC가 있으면 다시 계산)"""
+    if not steps or info["layer"] != 3:
+        return
+    side_start, side_length, blocks = _side_info(info)
+    side = int.from_bytes(frame[side_start:side_start + side_length], 'big')
+    total_bits = side_length * 8
+    for bit in blocks:
+        shift = total_bits - bit - 29
+        gain = (side >> shift) & 0xFF
+        new_gain = min(max(gain + steps, 0), 255)
+        side = (side & ~(0xFF << shift)) | (new_gain << shift)
+    frame[side_start:side_start + side_length] = side.to_bytes(side_length, 'big')
+    if info["crc"]:
+        crc = _crc16(bytes(frame[2:4]) + bytes(frame[6:6 + side_length]))
+        frame[4:6] = crc.to_bytes(2, 'big')
+
+
+def frame_seconds(info):
+    return info["samples"] / info["sample_rate"]
+
+
+def trim_range(data, frames):
+    """앞뒤 무음을 뺀 프레임 범위 (시작, 끝) - 무음 앞뒤로 KEEP_SILENCE초는 남김"""
+    start, end = 0, len(frames)
+    while start < end and is_silent(data, *frames[start]):
+        start += 1
+    while end > start and is_silent(data, *frames[end - 1]):
+        end -= 1
+    if start == end:
+        return 0, len(frames)       # 전부 무음이면 그대로
+    keep = int(KEEP_SILENCE / frame_seconds(frames[0][1]))
+    return max(start - keep, 0), min(end + keep, len(frames))
+
+
+def build(data, frames, head=b'', tail=b'', steps=0):
+    """프레임 목록으로 새 MP3 바이트 생성 (Xing/Info 프레임은 빼고 global_gain 조정)"""
+    out = bytearray(head)
+    for offset, info in frames:
+        if is_info_frame(data, offset, info):
+            continue
+        frame = bytearray(data[offset:offset + info["length"]])
+        adjust_gain(frame, info, steps)
+        out += frame
+    out += tail
+    return bytes(out)
+
+
+def clip(frames, start_seconds, length_seconds):
+    """start_seconds부터 length_seconds 길이의 프레임 목록"""
+    if not frames:
+        return frames
+    per_frame = frame_seconds(frames[0][1])
+    first = min(int(start_seconds / per_frame), len(frames))
+    return frames[first:first + max(int(length_seconds / per_frame), 1)]
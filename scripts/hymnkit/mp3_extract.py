@@ -0,0 +1,167 @@
+"""
+찬송가 페이지에서 MP3 URL 추출
+응답 본문을 조각(chunk) 단위로 받으면서 검사하고,
+<audio>/<source> src 또는 tfile.mp3 링크를 찾는 즉시 나머지 본문은 읽지 않음
+정규식으로 못 찾은 경우에만 가벼운 HTMLParser로 한 번 더 확인 (BeautifulSoup 미사용)
+"""
+
+import html
+import re
+import time
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+from requests.exceptions import StreamConsumedError
+
+from hymnkit import http_client, metrics
+
+CHUNK_SIZE = 16 * 1024
+OVERLAP = 4096              # 조각 경계에 걸친 태그를 놓치지 않도록 다음 조각과 함께 검사할 길이
+DRAIN_LIMIT = 64 * 1024     # 남은 본문이 이보다 작으면 끝까지 읽어 keep-alive 연결을 재사용
+
+# 검색 표지: bytes.find(C 구현)로 위치만 빠르게 찾고, 그 위치에서만 정규식 적용
+MARKERS = (b'<audio', b'<source', b'tfile.mp3')
+TAG_SRC = re.compile(rb'<(?:audio|source)\b[^>]*?\bsrc\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+URL_DELIMITERS = b'"\'<>() \t\r\n='
+MAX_URL_LENGTH = 2048
+
+
+def _url_around(buffer, pos):
+    """tfile.mp3 위치를 감싸는 URL(따옴표/공백/꺾쇠 사이) 추출"""
+    left = pos
+    limit = max(pos - MAX_URL_LENGTH, 0)
+    while left > limit and buffer[left - 1] not in URL_DELIMITERS:
+        left -= 1
+    right = pos + len(b'tfile.mp3')
+    limit = min(right + MAX_URL_LENGTH, len(buffer))
+    while right < limit and buffer[right] not in URL_DELIMITERS:
+        right += 1
+    return bytes(buffer[left:right])
+
+
+def _search(buffer, start, end):
+    """
+    [start, end) 구간에서 시작하는 첫 번째 MP3 참조를 문서 순서대로 찾기
+    (참조 자체는 end 이후까지 이어져도 됨)
+    """
+    while True:
+        hits = []
+        for marker in MARKERS:
+            pos = buffer.find(marker, start, min(end + len(marker) - 1, len(buffer)))
+            if pos >= 0:
+                hits.append((pos, marker))
+        if not hits:
+            return None
+        pos, marker = min(hits)
+        if marker == b'tfile.mp3':
+            raw = _url_around(buffer, pos)
+        else:
+            match = TAG_SRC.match(buffer, pos)
+            raw = match.group(1) if match else None
+        if raw:
+            return html.unescape(raw.decode('utf-8', errors='replace'))
+        # src가 없는 <audio> (안쪽 <source>에 src가 있는 경우) → 다음 표지로
+        start = pos + 1
+
+
+def find_mp3_url(data):
+    """HTML(bytes 또는 str) 전체에서 MP3 URL 찾기 (없으면 None)"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return _search(data, 0, len(data)) or _parse_fallback(data)
+
+
+class _AudioSrcParser(HTMLParser):
+    """정규식이 놓친 경우(따옴표 없는 속성 등)를 위한 최소 파서"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.src = None
+
+    def handle_starttag(self, tag, attrs):
+        if self.src or tag not in ('audio', 'source', 'a'):
+            return
+        attrs = dict(attrs)
+        value = attrs.get('href') if tag == 'a' else attrs.get('src')
+        if value and (tag != 'a' or 'tfile.mp3' in value):
+            self.src = value
+
+
+def _parse_fallback(data):
+    parser = _AudioSrcParser()
+    parser.feed(data.decode('utf-8', errors='replace'))
+    parser.close()
+    return parser.src
+
+
+def scan_chunks(chunks):
+    """
+    조각 단위로 MP3 URL 검사
+    (mp3_url, 지금까지 읽은 bytes) 반환 - URL을 찾으면 즉시 중단
+    각 조각의 마지막 OVERLAP 바이트는 태그가 잘렸을 수 있으므로 다음 조각과 합쳐서 검사
+    """
+    buffer = bytearray()
+    checked = 0
+    searching = 0.0     # 검색에 쓴 시간 (네트워크 대기 제외)
+    for chunk in chunks:
+        if not chunk:
+            continue
+        buffer += chunk
+        limit = len(buffer) - OVERLAP
+        if limit > checked:
+            start = time.perf_counter()
+            mp3_url = _search(buffer, checked, limit)
+            searching += time.perf_counter() - start
+            if mp3_url:
+                metrics.record(metrics.EXTRACT, searching)
+                return mp3_url, bytes(buffer)
+            checked = limit
+    data = bytes(buffer)
+    with metrics.timer(metrics.EXTRACT):
+        mp3_url = _search(data, checked, len(data)) or _parse_fallback(data)
+    return mp3_url, data
+
+
+def _release(response, read_bytes):
+    """남은 본문이 작으면 읽어서 연결을 풀에 돌려주고, 크면 연결을 닫음"""
+    length = response.headers.get('Content-Length')
+    if length is not None and int(length) - read_bytes <= DRAIN_LIMIT:
+        try:
+            for _ in response.iter_content(chunk_size=CHUNK_SIZE):
+                pass
+        except StreamConsumedError:
+            pass    # 이미 본문을 끝까지 읽음
+    response.close()
+
+
+def fetch_mp3_url(page_url, cache=None, timeout=30):
+    """
+    찬송가 페이지에서 MP3 URL 추출 (절대 URL로 변환)
+    cache(HtmlCache)가 주어지면 캐시를 먼저 확인하고, 받은 부분은 캐시에 저장
+    """
+    if cache is not None:
+        text = cache.get(page_url)
+        if text is not None:
+            with metrics.timer(metrics.EXTRACT):
+                mp3_url = find_mp3_url(text)
+            if mp3_url:
+                cache.hits += 1
+                return urljoin(page_url, mp3_url)
+            # 링크가 없는 페이지는 캐시에서 지우고 다시 받음
+            cache.invalidate(page_url)
+        cache.misses += 1
+
+    response = http_client.get(page_url, timeout=timeout, stream=True)
+    data = b''
+    try:
+        response.raise_for_status()
+        mp3_url, data = scan_chunks(response.iter_content(chunk_size=CHUNK_SIZE))
+    finally:
+        _release(response, len(data))
+
+    if not mp3_url:
+        return None
+    if cache is not None:
+        # MP3 참조가 포함된 앞부분만 저장해도 다음 추출에는 충분함
+        cache.put(page_url, data.decode('utf-8', errors='ignore'))
+    return urljoin(page_url, mp3_url)
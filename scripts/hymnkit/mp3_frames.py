@@ -0,0 +1,181 @@
+"""
+MP3 프레임 헤더 검사 (스트리밍)
+다운로드 중 받은 조각을 그대로 넘겨받아 프레임 헤더만 따라가며 확인
+(오디오 데이터는 해석하지 않고 헤더 4바이트로 다음 프레임 위치만 계산)
+
+- MP3 대신 저장된 HTML 오류 페이지
+- 프레임이 거의 없는 파일
+- 마지막 프레임이 중간에 잘린 파일
+을 찾아냄
+"""
+
+MIN_FRAMES = 10             # 이보다 프레임이 적으면 MP3로 보지 않음
+SYNC_SEARCH_LIMIT = 64 * 1024   # 첫 프레임 앞에 붙은 잡데이터를 건너뛸 최대 길이
+
+# 비트레이트 (kbps): [MPEG1 여부][레이어]
+_BITRATES = {
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+# 샘플레이트: 버전 비트(0=2.5, 2=2, 3=1)
+_SAMPLE_RATES = {
+    0: (11025, 12000, 8000),
+    2: (22050, 24000, 16000),
+    3: (44100, 48000, 32000),
+}
+
+# 프레임당 샘플 수: [MPEG1 여부][레이어]
+_SAMPLES_PER_FRAME = {
+    (True, 1): 384, (True, 2): 1152, (True, 3): 1152,
+    (False, 1): 384, (False, 2): 1152, (False, 3): 576,
+}
+
+
+class InvalidMp3(ValueError):
+    """MP3 프레임 구조가 올바르지 않음 (HTML 페이지, 잘린 파일 등)"""
+
+
+def frame_length(header):
+    """4바이트 프레임 헤더에서 프레임 길이 계산 (올바른 헤더가 아니면 0)"""
+    b0, b1, b2 = header[0], header[1], header[2]
+    if b0 != 0xFF or b1 & 0xE0 != 0xE0:
+        return 0
+    version = (b1 >> 3) & 3
+    layer = 4 - ((b1 >> 1) & 3)         # 비트값 3=레이어1, 2=레이어2, 1=레이어3
+    bitrate_index = b2 >> 4
+    rate_index = (b2 >> 2) & 3
+    if version == 1 or layer == 4 or bitrate_index in (0, 15) or rate_index == 3:
+        return 0
+    mpeg1 = version == 3
+    bitrate = _BITRATES[(mpeg1, layer)][bitrate_index] * 1000
+    sample_rate = _SAMPLE_RATES[version][rate_index]
+    padding = (b2 >> 1) & 1
+    if layer == 1:
+        return (12 * bitrate // sample_rate + padding) * 4
+    if layer == 3 and not mpeg1:
+        return 72 * bitrate // sample_rate + padding
+    return 144 * bitrate // sample_rate + padding
+
+
+def frame_info(header):
+    """
+    4바이트 프레임 헤더 해석 (올바른 헤더가 아니면 None)
+    {"length", "bitrate", "sample_rate", "samples", "layer", "mpeg1", "channels", "crc"}
+    """
+    length = frame_length(header)
+    if not length:
+        return None
+    b1, b2, b3 = header[1], header[2], header[3]
+    version = (b1 >> 3) & 3
+    layer = 4 - ((b1 >> 1) & 3)
+    mpeg1 = version == 3
+    return {
+        "length": length,
+        "bitrate": _BITRATES[(mpeg1, layer)][b2 >> 4] * 1000,
+        "sample_rate": _SAMPLE_RATES[version][(b2 >> 2) & 3],
+        "samples": _SAMPLES_PER_FRAME[(mpeg1, layer)],
+        "layer": layer,
+        "mpeg1": mpeg1,
+        "channels": 1 if b3 >> 6 == 3 else 2,
+        "crc": not b1 & 1,          # 보호 비트 0 = 헤더 뒤에 CRC-16
+    }
+
+
+def _looks_like_html(head):
+    """MP3는 '<'로 시작할 수 없으므로 (BOM/공백 뒤) '<'로 시작하면 HTML/XML 문서"""
+    return head.lstrip(b'\xef\xbb\xbf \t\r\n').startswith(b'<')
+
+
+class Mp3Scanner:
+    """조각 단위로 받은 데이터를 프레임 헤더 기준으로 따라가는 검사기"""
+
+    def __init__(self):
+        self.total = 0              # 지금까지 받은 바이트
+        self.frames = 0             # 확인한 프레임 수
+        self.error = None
+        self._buffer = bytearray()
+        self._buffer_start = 0      # _buffer[0]의 파일 내 위치
+        self._next = None           # 다음 프레임 헤더 위치 (헤더 확인 전이면 None)
+        self._audio_start = 0       # ID3v2 태그 바로 뒤 (잡데이터 검색 한도의 기준)
+        self._ended = False         # 프레임이 끝나고 태그/잡데이터가 이어짐
+        self._started = False
+
+    def feed(self, data):
+        """받은 조각 추가 (오류는 finish()에서 보고)"""
+        self.total += len(data)
+        if self.error is not None or self._ended:
+            return
+        self._buffer += data
+        if not self._started:
+            if len(self._buffer) < 10:
+                return
+            self._start()
+        if self.error is None:
+            self._walk()
+
+    def _start(self):
+        self._started = True
+        head = bytes(self._buffer[:10])
+        if _looks_like_html(head):
+            self.error = "MP3 대신 HTML 페이지를 받음"
+            return
+        if head[:3] == b'ID3' and len(head) == 10:
+            # ID3v2 태그 크기 (syncsafe 정수) 만큼 건너뜀
+            size = (head[6] << 21) | (head[7] << 14) | (head[8] << 7) | head[9]
+            self._next = 10 + size + (10 if head[5] & 0x10 else 0)
+        else:
+            self._next = 0
+        self._audio_start = self._next
+
+    def _walk(self):
+        buffer = self._buffer
+        start = self._buffer_start
+        while True:
+            pos = self._next - start
+            if pos + 4 > len(buffer):
+                break
+            length = frame_length(buffer[pos:pos + 4])
+            if length:
+                self.frames += 1
+                self._next += length
+                continue
+            if self.frames:
+                # 프레임 뒤에 ID3v1/APE 태그 등이 붙은 경우 → 더 이상 따라가지 않음
+                self._ended = True
+                break
+            # 첫 프레임 앞의 잡데이터 건너뛰기
+            sync = buffer.find(b'\xff', pos + 1)
+            if sync < 0:
+                self._next = start + len(buffer)
+            else:
+                self._next = start + sync
+            if self._next - self._audio_start > SYNC_SEARCH_LIMIT:
+                self.error = "MP3 프레임을 찾을 수 없음"
+                break
+
+        # 다음 프레임 위치 이전의 데이터는 버림
+        drop = min(self._next - start, len(buffer))
+        if drop > 0:
+            del buffer[:drop]
+            self._buffer_start += drop
+        if self._ended:
+            self._buffer = bytearray()
+
+    def finish(self):
+        """전체를 받은 뒤 호출. 올바른 MP3가 아니면 InvalidMp3 발생"""
+        if self.error is None and not self._started:
+            self._start()
+            if self.error is None:
+                self._walk()
+        if self.error is not None:
+            raise InvalidMp3(self.error)
+        if self.total == 0:
+            raise InvalidMp3("빈 파일")
+        if self.frames < MIN_FRAMES:
+            raise InvalidMp3(f"MP3 프레임 {self.frames}개")
+        if not self._ended and self._next > self.total:
+            raise InvalidMp3(f"마지막 프레임이 잘림 ({self._next - self.total} bytes 부족)")
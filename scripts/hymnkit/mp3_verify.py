@@ -0,0 +1,106 @@
+"""
+다운로드한 MP3 폴더 전체 검사
+파일마다 한 번만 읽으면서 SHA-256과 MP3 프레임 헤더를 함께 확인하고
+사이드카 메타데이터(<파일명>.meta.json)의 해시/크기와 비교
+하드링크로 같은 내용을 가리키는 이름들은 내용을 한 번만 읽고, 사이드카는 이름마다 따로 비교
+파일이 많으므로 프로세스 풀로 나눠서 병렬 검사
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from hymnkit.mp3_download import file_sha256, load_meta
+from hymnkit.mp3_frames import InvalidMp3, Mp3Scanner
+
+DEFAULT_WORKERS = os.cpu_count() or 4
+
+
+def _scan(filepath):
+    """내용 검사 (SHA-256 + 프레임 구조) → (결과, 파일 크기), 사이드카는 보지 않음"""
+    result = {"path": str(filepath), "ok": False, "frames": 0, "sha256": None, "error": None}
+    scanner = Mp3Scanner()
+    try:
+        hasher = file_sha256(filepath, scanner=scanner)
+    except OSError as e:
+        result["error"] = f"읽기 실패: {e}"
+        return result, None
+    result["sha256"] = hasher.hexdigest()
+    result["frames"] = scanner.frames
+
+    try:
+        scanner.finish()
+    except InvalidMp3 as e:
+        result["error"] = str(e)
+    return result, scanner.total
+
+
+def _check_meta(result, meta, size):
+    """내용 검사 결과를 사이드카의 크기/해시와 비교해 ok/error 채움"""
+    if result["error"] is not None:
+        return result
+    if meta.get("content_length") is not None and meta["content_length"] != size:
+        result["error"] = f"크기 불일치 ({size}/{meta['content_length']} bytes)"
+    elif meta.get("sha256") and meta["sha256"] != result["sha256"]:
+        result["error"] = "SHA-256 불일치"
+    else:
+        result["ok"] = True
+    return result
+
+
+def verify_file(filepath):
+    """
+    파일 하나 검사
+    {"path", "ok", "frames", "sha256", "error"} 반환 (error는 문제가 없으면 None)
+    """
+    filepath = Path(filepath)
+    result, size = _scan(filepath)
+    return _check_meta(result, load_meta(filepath), size)
+
+
+def verify_names(paths):
+    """
+    같은 내용(하드링크)을 가리키는 이름들 검사: 내용은 첫 이름으로 한 번만 읽고 이름마다 결과 반환
+    같은 URL을 기록한 사이드카끼리 ETag가 다르면 어느 한쪽이 오래된 것이므로 함께 보고
+    """
+    scanned, size = _scan(Path(paths[0]))
+    metas = [load_meta(Path(path)) for path in paths]
+    results = [_check_meta(dict(scanned, path=str(path)), meta, size) for path, meta in zip(paths, metas)]
+
+    etags = {}      # URL → 사이드카에 기록된 ETag 집합
+    for meta in metas:
+        if meta.get("url") and meta.get("etag"):
+            etags.setdefault(meta["url"], set()).add(meta["etag"])
+    for result, meta in zip(results, metas):
+        if result["ok"] and len(etags.get(meta.get("url"), ())) > 1:
+            result["ok"] = False
+            result["error"] = f"ETag 불일치 (같은 내용의 다른 이름과 다름: {meta['etag']})"
+    return results
+
+
+def mirror_files(directory):
+    """
+    폴더의 MP3 파일을 같은 내용(장치, inode)끼리 묶은 목록
+    [[이름, ...], ...] - 묶음은 첫 이름 순서, 하드링크가 아니면 이름 하나짜리 묶음
+    """
+    groups = {}
+    for path in sorted(Path(directory).glob("*.mp3")):
+        stat = path.stat()
+        groups.setdefault((stat.st_dev, stat.st_ino), []).append(path)
+    return list(groups.values())
+
+
+def verify_mirror(directory, workers=DEFAULT_WORKERS, on_result=None):
+    """
+    폴더 전체를 병렬로 검사하고 이름마다 결과 하나씩 담은 목록 반환
+    on_result(result): 파일마다 끝나는 순서와 관계없이 목록 순서대로 호출
+    """
+    groups = mirror_files(directory)
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for group_results in pool.map(verify_names, groups, chunksize=8):
+            for result in group_results:
+                results.append(result)
+                if on_result is not None:
+                    on_result(result)
+    return results
@@ -0,0 +1,164 @@
+"""
+추가 전용(append-only) 저널 기반 진행 상황 저장소
+곡마다 progress.json 전체를 다시 쓰는 대신 저널에 한 줄씩 추가하고
+주기적으로 progress.json 스냅샷으로 압축(compaction)
+
+- progress.json: 기존과 같은 형식의 스냅샷 {"completed": [...], "failed": [...], ...}
+- progress.journal: 스냅샷 이후 변경 사항 (JSON Lines)
+비정상 종료 후에는 스냅샷을 읽고 저널을 재생하여 복구
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+
+COMPACT_EVERY = 100     # 저널이 이 줄 수를 넘으면 스냅샷으로 압축
+
+
+class ProgressStore:
+    """완료/실패 곡 번호와 기타 값(links 등)을 저장하는 진행 상황 저장소"""
+
+    def __init__(self, path, defaults=None, compact_every=COMPACT_EVERY, read_only=False):
+        self.path = Path(path)
+        self.read_only = read_only      # 다른 프로세스가 기록 중인 저장소를 읽기만 할 때 (파일을 고치지 않음)
+        self.journal_path = self.path.with_suffix('.journal')
+        self.compact_every = compact_every
+        self._lock = threading.Lock()
+        self._completed = set()
+        self._failed = set()
+        self._values = dict(defaults or {})
+        self._values.pop("completed", None)
+        self._values.pop("failed", None)
+        self._journal = None
+        self._journal_lines = 0
+        self._load()
+
+    # ---- 조회 ----
+
+    @property
+    def completed(self):
+        return self._completed
+
+    @property
+    def failed(self):
+        return self._failed
+
+    def is_completed(self, hymn_no):
+        return hymn_no in self._completed
+
+    def get(self, key, default=None):
+        return self._values.get(key, default)
+
+    def snapshot(self):
+        """progress.json에 저장되는 형식의 딕셔너리"""
+        with self._lock:
+            return self._snapshot()
+
+    # ---- 변경 ----
+
+    def mark_completed(self, hymn_no):
+        self._append({"op": "completed", "no": hymn_no})
+
+    def mark_failed(self, hymn_no):
+        self._append({"op": "failed", "no": hymn_no})
+
+    def mark_pending(self, hymn_no):
+        """완료/실패 기록을 지워 다음 실행에서 다시 받도록 함"""
+        self._append({"op": "pending", "no": hymn_no})
+
+    def set(self, key, value):
+        self._append({"op": "set", "key": key, "value": value})
+
+    def compact(self):
+        """현재 상태를 progress.json에 원자적으로 쓰고 저널 비우기"""
+        with self._lock:
+            self._compact()
+
+    def close(self):
+        """압축 후 저널 파일 닫기"""
+        if self.read_only:
+            return
+        with self._lock:
+            self._compact()
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---- 내부 구현 ----
+
+    def _apply(self, entry):
+        op = entry.get("op")
+        if op == "completed":
+            self._completed.add(entry["no"])
+            self._failed.discard(entry["no"])
+        elif op == "failed":
+            if entry["no"] not in self._completed:
+                self._failed.add(entry["no"])
+        elif op == "pending":
+            self._completed.discard(entry["no"])
+            self._failed.discard(entry["no"])
+        elif op == "set":
+            self._values[entry["key"]] = entry["value"]
+
+    def _load(self):
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._completed = set(data.pop("completed", []))
+            self._failed = set(data.pop("failed", [])) - self._completed
+            self._values.update(data)
+
+        # 저널 재생 (마지막 줄이 쓰다 만 상태일 수 있으므로 깨진 줄은 무시)
+        if self.journal_path.exists():
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    self._apply(entry)
+                    self._journal_lines += 1
+            # 쓰다 만 줄 뒤에 이어 쓰지 않도록 재생 후 바로 압축
+            if self.journal_path.stat().st_size and not self.read_only:
+                self._compact()
+
+    def _append(self, entry):
+        if self.read_only:
+            raise RuntimeError("읽기 전용 진행 상황 저장소")
+        with self._lock:
+            self._apply(entry)
+            if self._journal is None:
+                self._journal = open(self.journal_path, 'a', encoding='utf-8')
+            self._journal.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._journal.flush()
+            self._journal_lines += 1
+            if self._journal_lines >= self.compact_every:
+                self._compact()
+
+    def _snapshot(self):
+        data = {"completed": sorted(self._completed), "failed": sorted(self._failed)}
+        data.update(self._values)
+        return data
+
+    def _compact(self):
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._snapshot(), f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+        # 스냅샷에 반영된 저널 비우기
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        if self.journal_path.exists():
+            open(self.journal_path, 'w', encoding='utf-8').close()
+        self._journal_lines = 0
@@ -0,0 +1,236 @@
+"""
+Suno 프롬프트 생성 방식(backend)
+브라우저의 services/geminiService.ts generateSunoPrompt와 같은 요청을 Python에서 보냄
+
+- gemini: Gemini REST API (시스템 지시, Google 검색, JSON 응답 스키마가 앱과 같음)
+- stub: 네트워크 없이 곡 번호와 설정으로 정해지는 가짜 응답 (지연, 실패율 지정 가능)
+
+generate(prefs) → PromptData 딕셔너리 (실패하면 GenerationError)
+cache_key: 응답 캐시를 방식/모델별로 나누는 이름
+"""
+
+import hashlib
+import json
+import os
+import random
+import time
+from pathlib import Path
+
+from hymnkit.rate_limiter import AdaptiveRateLimiter
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+ENV_FILE = BASE_DIR / ".env.local"
+
+GEMINI_MODEL = "gemini-3-flash-preview"
+GEMINI_URL = "https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent"
+API_KEY_NAMES = ("GEMINI_API_KEY", "VITE_GEMINI_API_KEY")
+GEMINI_RATE = 1.0           # 시작 속도 (초당 요청 수, 응답에 따라 조절)
+GEMINI_TIMEOUT = 180        # 검색 + 긴 가사 생성이라 응답이 느림 (초)
+
+# components/BatchGenerator.tsx의 일괄 생성 기본 설정 (hymnTheme는 곡마다 채움)
+DEFAULT_PREFERENCES = {
+    "language": "Korean",
+    "vibe": "Auto (AI Recommended)",
+    "genre": "Auto (AI Recommended)",
+    "complexity": "Balanced",
+    "lyricsPreference": "Generate Lyrics",
+    "era": "Modern Lo-Fi",
+    "artistReference": "",
+    "focusMode": "None",
+    "backgroundTexture": "Rain & distant Thunder",
+    "neuroHook": False,
+    "introStrategy": "Nature Start",
+    "viralContext": "None",
+    "bpm": "Auto (AI Recommended)",
+}
+
+SYSTEM_INSTRUCTION = """
+    You are 'SacredArchitect Global Search', a world-class producer specializing in 'Sophisticated Easy Listening' and 'Emotional Ambience'.
+    Your goal is to create hymn re-imaginings that are trendy and modern, yet comfortable enough for all-day listening (zero listening fatigue).
+
+    1. SEARCH Google to find the official titles and FULL accurate lyrics (KR, EN, ES).
+    2. MUSIC PHILOSOPHY: Focus on 'Warmth', 'Space', and 'Emotional Depth'.
+       - Avoid: Sharp high frequencies, overly aggressive beats, or jarring transitions.
+       - Embrace: Soft transients, lush reverbs, warm analog tape saturation, and organic instrumentation.
+    3. Generate a 'stylePrompt' for Suno AI using these guidelines:
+       - Instruments: 'Muted Rhodes piano', 'Soft felt piano', 'Espressivo strings', 'Warm analog pads', 'Deep sub-bass', 'Organic shakers'.
+       - Aesthetics: 'Hazy morning light', 'Sophisticated minimalist', 'Cinematic intimacy', 'Soulful sanctuary'.
+       - Production: 'Humanized groove', 'Wide stereo image', 'Subtle tape hiss', 'Gentle sidechaining'.
+    4. In 'sunoParameters', set 'weirdness' to a moderate level (0.2 - 0.4) to maintain musicality while staying unique. Focus on 'styleInfluence' (0.8 - 1.0) for high quality.
+    5. Ensure multiLyrics contains the complete verses for each language.
+    6. Provide the output in strictly valid JSON.
+  """
+
+
+def _object(properties, required=None):
+    return {"type": "OBJECT", "properties": properties, "required": required or list(properties)}
+
+
+_STRING = {"type": "STRING"}
+_NUMBER = {"type": "NUMBER"}
+_LANGUAGES = _object({"ko": _STRING, "en": _STRING, "es": _STRING})
+
+RESPONSE_SCHEMA = _object({
+    "title": _STRING,
+    "titles": _LANGUAGES,
+    "stylePrompt": _STRING,
+    "structure": {"type": "ARRAY", "items": _STRING},
+    "multiLyrics": _LANGUAGES,
+    "theoryExplanation": _STRING,
+    "videoPrompt": _STRING,
+    "youtubeDescription": _STRING,
+    "tags": _object({key: _STRING for key in ("genre", "bpm", "key", "vibe", "era", "language")}),
+    "sunoParameters": _object({
+        "styleInfluence": _NUMBER,
+        "weirdness": _NUMBER,
+        "vocalGender": _STRING,
+        "recommendedModel": _STRING,
+    }),
+})
+
+
+class GenerationError(Exception):
+    """생성 실패 (retryable이면 잠시 후 다시 시도할 만한 오류)"""
+
+    def __init__(self, message, retryable=True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+def prompt_contents(prefs):
+    """generateSunoPrompt와 같은 사용자 요청 문장"""
+    return (f"Design a sophisticated, non-fatiguing masterwork for: {prefs['hymnTheme']}. \n"
+            f"                Selected Tone: {prefs.get('genre') or 'Emotional Easy Listening'}.\n"
+            f"                Vibe: {prefs.get('vibe') or 'Warm, Peaceful, and Modern'}.\n"
+            "                The result must be trendy but perfect for all-day background listening.")
+
+
+def check_prompt_data(data):
+    """응답에 스키마의 필수 항목이 모두 있는지 확인 (모델이 빠뜨리면 재시도 대상)"""
+    if not isinstance(data, dict):
+        raise GenerationError("응답이 JSON 객체가 아님")
+    missing = [key for key in RESPONSE_SCHEMA["required"] if key not in data]
+    for key in ("titles", "multiLyrics"):
+        if isinstance(data.get(key), dict):
+            missing += [f"{key}.{lang}" for lang in ("ko", "en", "es") if lang not in data[key]]
+    if missing:
+        raise GenerationError("응답에 없는 항목: " + ", ".join(missing))
+
+
+def load_api_key():
+    """환경 변수 또는 .env.local의 GEMINI_API_KEY / VITE_GEMINI_API_KEY"""
+    for name in API_KEY_NAMES:
+        if os.environ.get(name):
+            return os.environ[name]
+    try:
+        with open(ENV_FILE, 'r', encoding='utf-8') as f:
+            for line in f:
+                name, sep, value = line.strip().partition('=')
+                if sep and name.strip() in API_KEY_NAMES and value.strip():
+                    return value.strip().strip('"\'')
+    except OSError:
+        pass
+    return None
+
+
+class GeminiBackend:
+    """Gemini REST API (여러 스레드에서 동시에 호출, 429/5xx는 속도 제한기가 늦춤)"""
+
+    name = "gemini"
+
+    def __init__(self, api_key=None, model=GEMINI_MODEL, rate=GEMINI_RATE, on_event=None):
+        import requests
+        self.api_key = api_key or load_api_key()
+        if not self.api_key:
+            raise GenerationError("API 키가 없습니다 (GEMINI_API_KEY 또는 .env.local의 VITE_GEMINI_API_KEY)",
+                                  retryable=False)
+        self.model = model
+        self.cache_key = f"gemini-{model}"
+        self.url = GEMINI_URL.format(model=model)
+        self.limiter = AdaptiveRateLimiter(rate=rate, on_event=on_event)
+        self._requests = requests
+        self._session = requests.Session()
+
+    def generate(self, prefs):
+        body = {
+            "systemInstruction": {"parts": [{"text": SYSTEM_INSTRUCTION}]},
+            "contents": [{"role": "user", "parts": [{"text": prompt_contents(prefs)}]}],
+            "tools": [{"google_search": {}}],
+            "generationConfig": {"responseMimeType": "application/json", "responseSchema": RESPONSE_SCHEMA},
+        }
+        self.limiter.acquire(self.url)
+        try:
+            response = self._session.post(self.url, json=body, timeout=GEMINI_TIMEOUT,
+                                          headers={"x-goog-api-key": self.api_key})
+        except (self._requests.Timeout, self._requests.ConnectionError) as e:
+            self.limiter.record(self.url, error=e)
+            raise GenerationError(f"{type(e).__name__}: {e}")
+        self.limiter.record(self.url, status=response.status_code,
+                            latency=response.elapsed.total_seconds(),
+                            retry_after=response.headers.get('Retry-After'))
+        if response.status_code != 200:
+            retryable = response.status_code == 429 or response.status_code >= 500
+            raise GenerationError(f"HTTP {response.status_code}: {response.text[:200]}", retryable=retryable)
+
+        candidate = (response.json().get("candidates") or [{}])[0]
+        text = "".join(part.get("text", "") for part in candidate.get("content", {}).get("parts", []))
+        text = text.replace("```json", "").replace("```", "").strip()
+        try:
+            data = json.loads(text or "{}")
+        except ValueError:
+            raise GenerationError(f"JSON이 아닌 응답 (finishReason={candidate.get('finishReason')})")
+        check_prompt_data(data)
+        chunks = candidate.get("groundingMetadata", {}).get("groundingChunks", [])
+        data["sources"] = [chunk["web"]["uri"] for chunk in chunks if chunk.get("web", {}).get("uri")]
+        return data
+
+    def format_stats(self):
+        return self.limiter.format_stats()
+
+
+class StubBackend:
+    """네트워크 없이 같은 입력에 항상 같은 응답 (일괄 실행, 캐시, 재시도 확인용)"""
+
+    name = "stub"
+    cache_key = "stub"
+
+    def __init__(self, delay=0.0, error_rate=0.0, seed=None):
+        self.delay = delay
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self.calls = 0
+
+    def generate(self, prefs):
+        self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        if self.error_rate and self._random.random() < self.error_rate:
+            raise GenerationError("HTTP 503: 모의 서버 과부하")
+
+        theme = prefs["hymnTheme"]
+        seed = hashlib.sha256(json.dumps(prefs, ensure_ascii=False, sort_keys=True).encode('utf-8')).digest()
+        bpm = 60 + seed[0] % 30
+        key = "CDEFGAB"[seed[1] % 7] + ("" if seed[2] % 2 else "m")
+        genre = prefs["genre"] if not prefs["genre"].startswith("Auto") else "Emotional Easy Listening"
+        vibe = prefs["vibe"] if not prefs["vibe"].startswith("Auto") else "Warm, Peaceful, and Modern"
+        return {
+            "title": theme,
+            "titles": {"ko": theme, "en": f"{theme} (EN)", "es": f"{theme} (ES)"},
+            "stylePrompt": f"{genre}, muted Rhodes piano, warm analog pads, {bpm} BPM, {prefs['backgroundTexture']}",
+            "structure": ["[Intro]", "[Verse 1]", "[Chorus]", "[Verse 2]", "[Chorus]", "[Outro]"],
+            "multiLyrics": {lang: f"[Verse 1]\n{theme} ({lang})" for lang in ("ko", "en", "es")},
+            "theoryExplanation": f"{key} 조성, {bpm} BPM",
+            "videoPrompt": f"Hazy morning light, {prefs['backgroundTexture']}",
+            "youtubeDescription": f"{theme} - {genre}",
+            "tags": {"genre": genre, "bpm": str(bpm), "key": key, "vibe": vibe,
+                     "era": prefs["era"], "language": prefs["language"]},
+            "sunoParameters": {"styleInfluence": 0.8 + seed[3] % 21 / 100, "weirdness": 0.2 + seed[4] % 21 / 100,
+                               "vocalGender": "female" if seed[5] % 2 else "male", "recommendedModel": "v4.5"},
+            "sources": [],
+        }
+
+    def format_stats(self):
+        return f"🧪 stub 호출 {self.calls}회"
+
+
+PROMPT_BACKENDS = {backend.name: backend for backend in (GeminiBackend, StubBackend)}
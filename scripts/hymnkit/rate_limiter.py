@@ -0,0 +1,134 @@
+"""
+호스트별 적응형 요청 속도 제한 (토큰 버킷)
+고정 0.5초 대기 대신 서버 상태에 맞춰 요청 속도를 조절
+
+- 응답이 빠르고 정상이면 속도를 조금씩 올림 (가산 증가)
+- 429/5xx 응답이나 타임아웃이면 속도를 절반으로 줄이고
+  지수 백오프 + 지터만큼 해당 호스트 요청을 멈춤 (Retry-After가 있으면 그 이상)
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+# 기본 설정
+DEFAULT_RATE = 2.0          # 초당 요청 수 (기존 0.5초 대기와 같은 속도에서 시작)
+MIN_RATE = 0.2
+MAX_RATE = 20.0
+RATE_STEP = 0.1             # 정상 응답마다 늘릴 초당 요청 수
+SLOW_LATENCY = 2.0          # 이보다 느린 응답은 속도를 올리지 않음 (초)
+BACKOFF_BASE = 1.0          # 첫 백오프 (초)
+BACKOFF_MAX = 120.0
+
+
+def parse_retry_after(value):
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 초로 변환"""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class _HostBucket:
+    """호스트 하나의 토큰 버킷 상태"""
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.tokens = 1.0
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.failures = 0           # 연속 실패 횟수 (백오프 지수)
+        self.backoffs = 0           # 누적 백오프 횟수
+        self.requests = 0
+
+    def refill(self, now):
+        capacity = max(1.0, self.rate)
+        self.tokens = min(capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+
+class AdaptiveRateLimiter:
+    """호스트별 토큰 버킷 + 백오프 (여러 스레드에서 동시에 사용 가능)"""
+
+    def __init__(self, rate=DEFAULT_RATE, min_rate=MIN_RATE, max_rate=MAX_RATE, on_event=None):
+        self.initial_rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.on_event = on_event or (lambda message: None)
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, host):
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = _HostBucket(self.initial_rate)
+        return bucket
+
+    def acquire(self, url):
+        """해당 호스트에 요청을 보내도 될 때까지 대기"""
+        host = urlsplit(url).netloc
+        while True:
+            with self._lock:
+                bucket = self._bucket(host)
+                now = time.monotonic()
+                if now >= bucket.blocked_until:
+                    bucket.refill(now)
+                    if bucket.tokens >= 1.0:
+                        bucket.tokens -= 1.0
+                        bucket.requests += 1
+                        return
+                    wait = (1.0 - bucket.tokens) / bucket.rate
+                else:
+                    wait = bucket.blocked_until - now
+            time.sleep(wait)
+
+    def record(self, url, status=None, latency=None, error=None, retry_after=None):
+        """
+        응답 결과 반영
+        status: HTTP 상태 코드, latency: 응답 헤더까지 걸린 시간(초)
+        error: 타임아웃/연결 오류 등 예외, retry_after: Retry-After 헤더 값
+        """
+        host = urlsplit(url).netloc
+        overloaded = error is not None or status == 429 or (status is not None and status >= 500)
+        with self._lock:
+            bucket = self._bucket(host)
+            if not overloaded:
+                bucket.failures = 0
+                if latency is None or latency < SLOW_LATENCY:
+                    bucket.rate = min(bucket.rate + RATE_STEP, self.max_rate)
+                return
+
+            bucket.failures += 1
+            bucket.backoffs += 1
+            bucket.rate = max(bucket.rate / 2, self.min_rate)
+            backoff = min(BACKOFF_BASE * 2 ** (bucket.failures - 1), BACKOFF_MAX)
+            delay = random.uniform(backoff / 2, backoff)
+            server_delay = parse_retry_after(retry_after)
+            if server_delay is not None:
+                delay = max(delay, server_delay)
+            bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + delay)
+            bucket.tokens = 0.0
+            rate = bucket.rate
+
+        reason = type(error).__name__ if error is not None else f"HTTP {status}"
+        self.on_event(f"  ⏳ {host}: {reason} → {delay:.1f}초 대기, 속도 {rate:.2f} req/s")
+
+    def current_rate(self, host):
+        with self._lock:
+            bucket = self._buckets.get(host)
+            return bucket.rate if bucket else self.initial_rate
+
+    def format_stats(self):
+        """호스트별 현재 속도와 백오프 횟수"""
+        with self._lock:
+            parts = [f"{host} {bucket.rate:.2f} req/s (요청 {bucket.requests}, 백오프 {bucket.backoffs})"
+                     for host, bucket in sorted(self._buckets.items())]
+        return "🚦 요청 속도: " + (", ".join(parts) if parts else "요청 없음")
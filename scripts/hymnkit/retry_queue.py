@@ -0,0 +1,163 @@
+"""
+실패 분류와 재시도 대기열
+다운로드 실패를 원인별로 분류하고, 일시적인 실패(타임아웃, 5xx, 잘린 파일)는
+같은 실행의 마지막에 백오프 후 다시 시도
+
+분류:
+- network_timeout: 타임아웃, 연결 오류
+- http_4xx: 404 등 클라이언트 오류 (429는 일시적 실패로 재시도)
+- http_5xx: 서버 오류
+- no_mp3_link: 페이지에 MP3 링크 없음
+- short_file: 받은 파일이 Content-Length보다 짧음
+- invalid_mp3: MP3 프레임 검사 실패 (HTML 오류 페이지, 잘린 음원)
+- other: 그 외 예외
+"""
+
+import heapq
+import itertools
+import random
+import time
+from collections import Counter
+
+import requests
+
+from hymnkit.mp3_download import IncompleteDownload
+from hymnkit.mp3_frames import InvalidMp3
+
+NETWORK_TIMEOUT = "network_timeout"
+HTTP_4XX = "http_4xx"
+HTTP_5XX = "http_5xx"
+NO_MP3_LINK = "no_mp3_link"
+SHORT_FILE = "short_file"
+INVALID_MP3 = "invalid_mp3"
+OTHER = "other"
+
+FAILURE_LABELS = {
+    NETWORK_TIMEOUT: "네트워크 타임아웃",
+    HTTP_4XX: "HTTP 4xx",
+    HTTP_5XX: "HTTP 5xx",
+    NO_MP3_LINK: "MP3 링크 없음",
+    SHORT_FILE: "잘린 파일",
+    INVALID_MP3: "잘못된 MP3",
+    OTHER: "기타 오류",
+}
+
+# 잘못된 MP3는 서버가 일시적으로 오류 페이지를 준 경우가 많아 다시 시도
+TRANSIENT = {NETWORK_TIMEOUT, HTTP_5XX, SHORT_FILE, INVALID_MP3}
+
+# 기본 설정
+MAX_ATTEMPTS = 3            # 첫 시도 포함 최대 시도 횟수
+RETRY_BASE_DELAY = 5.0      # 첫 재시도 전 대기 (초), 이후 2배씩
+
+
+class DownloadFailure(Exception):
+    """분류가 정해진 다운로드 실패 (transient: 다른 프로세스 등에서 이미 판단한 일시적 실패 여부)"""
+
+    def __init__(self, kind, detail="", transient=None):
+        super().__init__(detail or FAILURE_LABELS.get(kind, kind))
+        self.kind = kind
+        self.transient = transient
+
+
+def classify(error):
+    """예외를 실패 분류로 변환"""
+    if isinstance(error, DownloadFailure):
+        return error.kind
+    if isinstance(error, IncompleteDownload):
+        return SHORT_FILE
+    if isinstance(error, InvalidMp3):
+        return INVALID_MP3
+    if isinstance(error, (requests.Timeout, requests.ConnectionError)):
+        return NETWORK_TIMEOUT
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        status = error.response.status_code
+        if status >= 500:
+            return HTTP_5XX
+        if status >= 400:
+            return HTTP_4XX
+    return OTHER
+
+
+def is_transient(error):
+    """같은 실행 안에서 다시 시도할 만한 실패인지"""
+    if isinstance(error, DownloadFailure) and error.transient is not None:
+        return error.transient
+    if isinstance(error, requests.HTTPError) and error.response is not None \
+            and error.response.status_code == 429:
+        return True
+    return classify(error) in TRANSIENT
+
+
+class RetryScheduler:
+    """일시적 실패를 백오프 후 다시 내주는 재시도 대기열"""
+
+    def __init__(self, max_attempts=MAX_ATTEMPTS, base_delay=RETRY_BASE_DELAY):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.attempts = Counter()       # 곡별 실패 횟수
+        self.failures = Counter()       # 분류별 실패 횟수 (재시도 포함)
+        self.gave_up = Counter()        # 분류별 최종 실패 곡 수
+        self.recovered = 0              # 재시도 후 성공한 곡 수
+        self._heap = []
+        self._order = itertools.count()
+
+    def fail(self, key, item, error, transient=None):
+        """
+        실패 기록. 다시 시도할 예정이면 True, 최종 실패면 False 반환
+        error: 예외 또는 분류 문자열
+        transient: 일시적 실패 여부를 이미 판단한 경우 지정 (다른 프로세스에서 받은 결과 등)
+        """
+        kind = error if isinstance(error, str) else classify(error)
+        if transient is None:
+            transient = kind in TRANSIENT if isinstance(error, str) else is_transient(error)
+        self.attempts[key] += 1
+        self.failures[kind] += 1
+
+        if transient and self.attempts[key] < self.max_attempts:
+            delay = self.base_delay * 2 ** (self.attempts[key] - 1)
+            ready_at = time.monotonic() + random.uniform(delay / 2, delay)
+            heapq.heappush(self._heap, (ready_at, next(self._order), key, item))
+            return True
+
+        self.gave_up[kind] += 1
+        return False
+
+    def succeed(self, key):
+        """성공 기록 (재시도 끝에 성공한 곡 집계)"""
+        if self.attempts.get(key):
+            self.recovered += 1
+
+    def pending(self):
+        return len(self._heap)
+
+    def next_batch(self):
+        """가장 이른 재시도 시각까지 기다린 후 그때 준비된 항목 전부 반환 (없으면 빈 목록)"""
+        if not self._heap:
+            return []
+        wait = self._heap[0][0] - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        now = time.monotonic()
+        batch = []
+        while self._heap and self._heap[0][0] <= now:
+            batch.append(heapq.heappop(self._heap)[3])
+        return batch
+
+    def drain(self):
+        """재시도할 항목을 하나씩 반환 (처리 중 fail()로 다시 추가된 항목 포함)"""
+        while True:
+            batch = self.next_batch()
+            if not batch:
+                return
+            yield from batch
+
+    def summary_lines(self):
+        """최종 요약에 넣을 분류별 실패 통계"""
+        if not self.failures:
+            return []
+        lines = ["📋 실패 분류 (전체 시도 / 최종 실패):"]
+        for kind, label in FAILURE_LABELS.items():
+            if self.failures[kind]:
+                lines.append(f"   - {label}: {self.failures[kind]}회 / {self.gave_up[kind]}곡")
+        lines.append(f"   🔁 재시도 후 성공: {self.recovered}곡")
+        return lines
@@ -0,0 +1,301 @@
+"""
+찬송가 검색 색인 (한/영/스페인어)
+카탈로그에서 미리 만든 역색인(inverted index)을 앱이 필요할 때 받아서 쓰도록 JSON으로 저장
+
+색인어 (접두어로 종류 구분, 전체를 정렬해 두어 접두 검색은 이진 탐색으로 처리):
+- k:  한글 음절 1~2글자 n-gram (공백 제거 후, 제목 + 분류)
+- c:  초성 1~2글자 n-gram ("ㅁㅂㅇ" 같은 초성 검색)
+- w:  영어/스페인어 단어 (소문자, 악센트 제거: "Espíritu" → "espiritu")
+- n:  곡 번호
+
+검색:
+- 숫자만 입력하면 곡 번호
+- 한글은 음절 bigram 교집합, 마지막 글자가 받침 없는 음절이면 받침이 붙은 음절까지 포함
+  ("만보" → "만복"), 초성만 입력하면 초성 bigram 교집합
+- 영어/스페인어 단어는 접두 검색 ("prai" → "praise")
+- 정확히 맞는 곡이 없으면 오타 허용 검색: 한글은 bigram 절반 이상 일치,
+  영어/스페인어는 첫 글자가 같은 단어 중 편집 거리 1 (5글자 이상은 2)
+
+저장 형식: {"version", "count", "terms": [...], "postings": [...]}
+postings는 곡 번호 차이(delta)를 36진수로 적고 쉼표로 이은 문자열
+"""
+
+import bisect
+import heapq
+import json
+import os
+import re
+import unicodedata
+from pathlib import Path
+
+INDEX_VERSION = 1
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+JONGSEONG_COUNT = 28
+SYLLABLES_PER_CHOSEONG = 21 * JONGSEONG_COUNT
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+
+TOKEN = re.compile(r"[0-9a-z]+|[가-힣ㄱ-ㅎ]+")
+
+
+def _is_syllable(ch):
+    return HANGUL_BASE <= ord(ch) <= HANGUL_LAST
+
+
+def _has_jongseong(ch):
+    return (ord(ch) - HANGUL_BASE) % JONGSEONG_COUNT != 0
+
+
+def fold(text):
+    """소문자 + 라틴 문자의 악센트 제거 (한글 음절과 초성은 자모로 분해하지 않음)"""
+    out = []
+    for ch in text.lower():
+        if ord(ch) < 0x80 or _is_syllable(ch) or ch in CHOSEONG:
+            out.append(ch)
+        else:
+            out.extend(c for c in unicodedata.normalize('NFKD', ch) if not unicodedata.combining(c))
+    return "".join(out)
+
+
+def to_choseong(text):
+    """한글 음절은 초성으로, 이미 초성인 글자는 그대로, 나머지는 버림"""
+    out = []
+    for ch in text:
+        if _is_syllable(ch):
+            out.append(CHOSEONG[(ord(ch) - HANGUL_BASE) // SYLLABLES_PER_CHOSEONG])
+        elif ch in CHOSEONG:
+            out.append(ch)
+    return "".join(out)
+
+
+def _ngrams(text, prefix):
+    grams = {prefix + ch for ch in text}
+    grams.update(prefix + text[i:i + 2] for i in range(len(text) - 1))
+    return grams
+
+
+def document_terms(record):
+    """곡 레코드 {"no", "ko", "en", "es", "category"}의 색인어 집합"""
+    terms = {f"n:{record['no']}"}
+    hangul = []
+    for field in ("ko", "en", "es", "category"):
+        for token in TOKEN.findall(fold(record.get(field) or "")):
+            if token[0] < '\x80':
+                terms.add("w:" + token)
+            else:
+                hangul.append(token)
+    syllables = "".join(hangul)
+    terms |= _ngrams(syllables, "k:")
+    terms |= _ngrams(to_choseong(syllables), "c:")
+    return terms
+
+
+def _encode(numbers):
+    previous = 0
+    parts = []
+    for number in numbers:
+        parts.append(_base36(number - previous))
+        previous = number
+    return ",".join(parts)
+
+
+def _decode(text):
+    numbers = []
+    current = 0
+    for part in text.split(","):
+        current += int(part, 36)
+        numbers.append(current)
+    return numbers
+
+
+def _base36(number):
+    digits = "0123456789abcdefghijklmnopqrstuvwxyz"
+    if number == 0:
+        return "0"
+    out = []
+    while number:
+        number, rest = divmod(number, 36)
+        out.append(digits[rest])
+    return "".join(reversed(out))
+
+
+def build_index(records):
+    """레코드 목록 → {"version", "count", "terms", "postings"}"""
+    postings = {}
+    count = 0
+    for record in records:
+        count += 1
+        for term in document_terms(record):
+            postings.setdefault(term, []).append(record["no"])
+    terms = sorted(postings)
+    return {
+        "version": INDEX_VERSION,
+        "count": count,
+        "terms": terms,
+        "postings": [_encode(sorted(postings[term])) for term in terms],
+    }
+
+
+def write_index(records, path, inputs=None):
+    """색인을 만들어 압축된 JSON으로 저장 (임시 파일에 쓴 뒤 교체)"""
+    data = build_index(records)
+    if inputs:
+        data["inputs"] = inputs
+    path = Path(path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8', newline='\n') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+    return data["count"]
+
+
+def edit_distance(a, b, limit):
+    """편집 거리 (limit를 넘으면 limit + 1)"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+class SearchIndex:
+    """저장된 색인으로 검색 (postings는 처음 사용할 때 풀어서 캐시)"""
+
+    def __init__(self, data):
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError(f"지원하지 않는 색인 버전: {data.get('version')}")
+        self.count = data["count"]
+        self.terms = data["terms"]
+        self._encoded = data["postings"]
+        self._decoded = {}
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    @classmethod
+    def from_records(cls, records):
+        return cls(build_index(records))
+
+    def postings(self, index):
+        """index번째 색인어의 곡 번호 집합 (처음 사용할 때 풀어서 캐시, 수정하지 말 것)"""
+        found = self._decoded.get(index)
+        if found is None:
+            found = self._decoded[index] = frozenset(_decode(self._encoded[index]))
+        return found
+
+    def _range(self, low, high):
+        """low 이상 high 미만 색인어의 위치 범위"""
+        return range(bisect.bisect_left(self.terms, low), bisect.bisect_left(self.terms, high))
+
+    def _exact(self, term):
+        i = bisect.bisect_left(self.terms, term)
+        if i < len(self.terms) and self.terms[i] == term:
+            return self.postings(i)
+        return frozenset()
+
+    def _prefix(self, prefix):
+        hits = set()
+        for i in self._range(prefix, prefix + "\uffff"):
+            hits.update(self.postings(i))
+        return hits
+
+    def _syllable_prefix(self, head, last):
+        """head + last로 시작하고 last의 받침만 다른 색인어 ("만보" → "만복", "만본" ...)"""
+        if _has_jongseong(last):
+            return self._exact(head + last)
+        hits = set()
+        for i in self._range(head + last, head + chr(ord(last) + JONGSEONG_COUNT)):
+            hits.update(self.postings(i))
+        return hits
+
+    def _hangul_clauses(self, text):
+        """한글 검색어 → 모두 만족해야 하는 후보 집합 목록"""
+        if all(ch in CHOSEONG for ch in text):
+            grams = [text] if len(text) == 1 else [text[i:i + 2] for i in range(len(text) - 1)]
+            return [self._exact("c:" + gram) for gram in grams]
+
+        syllables = "".join(ch for ch in text if _is_syllable(ch))
+        clauses = []
+        if len(syllables) == 1:
+            clauses.append(self._syllable_prefix("k:", syllables))
+        for i in range(len(syllables) - 1):
+            head, last = "k:" + syllables[i], syllables[i + 1]
+            # 입력 중인 마지막 글자만 받침을 생략했을 수 있음
+            if i == len(syllables) - 2:
+                clauses.append(self._syllable_prefix(head, last))
+            else:
+                clauses.append(self._exact(head + last))
+        if len(syllables) < len(text):
+            # 음절과 초성이 섞인 경우 ("만ㅂ") 초성으로도 확인
+            clauses.extend(self._hangul_clauses(to_choseong(text)))
+        return clauses
+
+    def search(self, query, limit=20):
+        """곡 번호 목록 (정확히 맞는 곡이 없으면 오타 허용 결과를 점수순으로)"""
+        tokens = TOKEN.findall(fold(query))
+        if not tokens:
+            return []
+        if len(tokens) == 1 and tokens[0].isdigit():
+            return heapq.nsmallest(limit, self._exact(f"n:{int(tokens[0])}"))
+
+        latin = [token for token in tokens if token[0] < '\x80']
+        hangul = "".join(token for token in tokens if token[0] >= '\x80')
+        clauses = [self._prefix("w:" + token) for token in latin]
+        if hangul:
+            clauses.extend(self._hangul_clauses(hangul))
+
+        clauses.sort(key=len)
+        matches = set(clauses[0])
+        for clause in clauses[1:]:
+            if not matches:
+                break
+            matches &= clause
+        if matches:
+            if not latin:
+                return heapq.nsmallest(limit, matches)
+            # 단어 전체가 맞는 곡을 접두어만 맞는 곡보다 먼저 ("hymn 30" → 30장, 300장 ...)
+            whole = [self._exact("w:" + token) for token in latin]
+            return heapq.nsmallest(limit, matches, key=lambda no: (-sum(no in hits for hits in whole), no))
+        return self._fuzzy(latin, hangul, limit)
+
+    def _fuzzy(self, latin, hangul, limit):
+        scores = {}
+        for token in latin:
+            limit_distance = 1 if len(token) < 5 else 2
+            hits = set()
+            for i in self._range("w:" + token[0], "w:" + chr(ord(token[0]) + 1)):
+                term = self.terms[i][2:]
+                # 접두 검색처럼 입력 중인 단어와 같은 길이까지만 비교
+                if edit_distance(token, term[:len(token) + limit_distance], limit_distance) <= limit_distance:
+                    hits.update(self.postings(i))
+            for no in hits:
+                scores[no] = scores.get(no, 0) + 2
+
+        if hangul:
+            # 음절 bigram과 초성 bigram을 함께 세어 절반 이상 맞는 곡 ("서령" → "성령")
+            syllables = "".join(ch for ch in hangul if _is_syllable(ch))
+            grams = ["k:" + syllables[i:i + 2] for i in range(len(syllables) - 1)]
+            choseong = to_choseong(hangul)
+            if len(choseong) == 1:      # utils/hymnSearch.ts와 같은 조건
+                grams.append("c:" + choseong)
+            grams += ["c:" + choseong[i:i + 2] for i in range(len(choseong) - 1)]
+            needed = max(1, (len(grams) + 1) // 2)
+            counts = {}
+            for gram in grams:
+                for no in self._exact(gram):
+                    counts[no] = counts.get(no, 0) + 1
+            for no, count in counts.items():
+                if count >= needed:
+                    scores[no] = scores.get(no, 0) + count
+
+        ranked = heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+        return [no for no, _ in ranked]
@@ -0,0 +1,57 @@
+"""
+다운로드한 찬송가 MP3의 메타데이터 색인 만들기 (재생 시간, 비트레이트, 크기, ID3 태그)
+progress.json의 완료 곡 중 새로 받았거나 바뀐 파일의 헤더만 읽어 갱신
+
+사용법 (scripts 폴더에서):
+    python index_audio.py [--dir ../data/mp3] [--out ../data/mp3/audio_index.json] [--force]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from hymnkit.audio_index import INDEX_NAME, join_catalog, load_index, update_index
+
+BASE_DIR = Path(__file__).parent.parent
+DEFAULT_DIR = BASE_DIR / "data" / "mp3"
+DEFAULT_CATALOG = BASE_DIR / "data" / "hymns-645-complete.json"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="찬송가 MP3 메타데이터 색인")
+    parser.add_argument('--dir', type=Path, default=DEFAULT_DIR, help="다운로드한 MP3 폴더")
+    parser.add_argument('--out', type=Path, help=f"색인 파일 (기본: MP3 폴더의 {INDEX_NAME})")
+    parser.add_argument('--catalog', type=Path, default=DEFAULT_CATALOG, help="곡 번호로 연결할 곡 목록")
+    parser.add_argument('--force', action='store_true', help="모든 파일 다시 읽기")
+    args = parser.parse_args(argv)
+    index_path = args.out or args.dir / INDEX_NAME
+
+    def on_event(kind, no, detail):
+        if kind == "failed":
+            print(f"❌ {no}장: {detail}")
+        else:
+            seconds = detail["duration_ms"] // 1000
+            print(f"🎵 {no}장: {seconds // 60}:{seconds % 60:02d}, {detail['bitrate'] // 1000} kbps"
+                  f"{' (VBR)' if detail['vbr'] else ''}, {detail['size'] / 1024:.0f} KB")
+
+    result = update_index(args.dir, index_path, force=args.force, on_event=on_event)
+    print("\n" + "=" * 80)
+    print(f"📇 {index_path}: {len(result['index'])}곡 (갱신 {len(result['updated'])}, "
+          f"삭제 {len(result['removed'])}, 실패 {len(result['failed'])}) {result['seconds'] * 1000:.0f}ms")
+
+    start = time.perf_counter()
+    index = load_index(index_path)
+    with open(args.catalog, 'r', encoding='utf-8') as f:
+        hymns = join_catalog(json.load(f), index)
+    elapsed = (time.perf_counter() - start) * 1000
+    with_audio = sum(1 for hymn in hymns if hymn["audio"])
+    total = sum(hymn["audio"]["duration_ms"] for hymn in hymns if hymn["audio"]) // 1000
+    print(f"⚡ 색인 + 곡 목록 불러오기: {elapsed:.1f}ms ({with_audio}/{len(hymns)}곡 오디오, "
+          f"총 {total // 3600}시간 {total % 3600 // 60}분)")
+    return 1 if result["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+"""
+다운로드한 찬송가 MP3 후처리 (음량 맞춤, 앞뒤 무음 제거, 미리듣기)
+새로 받았거나 바뀐 파일만 처리하고 파일별 시간과 전체 처리량을 출력
+
+사용법 (scripts 폴더에서):
+    python process_audio.py [--src ../data/mp3] [--out ../data/mp3_processed] [--workers 4] [--no-ffmpeg]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from hymnkit.audio_process import DEFAULT_WORKERS, process_mirror
+
+BASE_DIR = Path(__file__).parent.parent
+DEFAULT_SRC = BASE_DIR / "data" / "mp3"
+DEFAULT_OUT = BASE_DIR / "data" / "mp3_processed"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="찬송가 MP3 후처리")
+    parser.add_argument('--src', type=Path, default=DEFAULT_SRC, help="다운로드한 MP3 폴더")
+    parser.add_argument('--out', type=Path, default=DEFAULT_OUT, help="처리 결과 폴더")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help="프로세스 수")
+    parser.add_argument('--no-ffmpeg', action='store_true', help="ffmpeg가 있어도 프레임 편집 방식 사용")
+    args = parser.parse_args(argv)
+
+    print("=" * 80)
+    print("🎚️  찬송가 MP3 후처리")
+    print(f"📁 {args.src} → {args.out} (프로세스 {args.workers}개)")
+    print("=" * 80)
+
+    def on_result(result):
+        name = Path(result["src"]).name
+        if not result["ok"]:
+            print(f"❌ {name}: {result['error']} ({result['seconds']:.2f}초)")
+            return
+        details = f"{result['bytes_in'] / 1024:.0f} KB → {result['full_bytes'] / 1024:.0f} KB, " \
+                  f"미리듣기 {result['preview_bytes'] / 1024:.0f} KB"
+        if "gain_db" in result:
+            details += f", 음량 {result['gain_db']:+.1f} dB, 무음 {result['trimmed_seconds']:.1f}초 제거"
+        print(f"✅ {name}: {result['seconds']:.2f}초 ({details})")
+
+    summary = process_mirror(args.src, args.out, workers=args.workers,
+                             use_ffmpeg=not args.no_ffmpeg, on_result=on_result)
+    seconds = summary["seconds"]
+    print("\n" + "=" * 80)
+    print(f"🛠️  방식: {summary['method']}")
+    print(f"✅ 처리: {summary['processed']}, ❌ 실패: {summary['failed']}, ⏭️  변경 없음: {summary['skipped']}, "
+          f"🗑️  원본 없음: {summary['removed']}")
+    if summary["processed"] or summary["failed"]:
+        megabytes = summary["bytes_in"] / 1024 / 1024
+        print(f"⏱️  {seconds:.1f}초, {megabytes / seconds:.1f} MB/s, "
+              f"{(summary['processed'] + summary['failed']) / seconds:.1f}곡/s")
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
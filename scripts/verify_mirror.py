@@ -0,0 +1,43 @@
+"""
+다운로드한 찬송가 MP3 전체 검사 (verify 모드)
+파일마다 SHA-256, 크기, MP3 프레임 구조를 확인하고 문제가 있는 파일을 보고
+
+사용법: python scripts/verify_mirror.py [MP3 폴더] [프로세스 수]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+from hymnkit.mp3_verify import DEFAULT_WORKERS, verify_mirror
+
+BASE_DIR = Path(__file__).parent.parent
+DEFAULT_DIR = BASE_DIR / "data" / "mp3"
+
+
+def main():
+    directory = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_DIR
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_WORKERS
+
+    print("=" * 80)
+    print("🔍 찬송가 MP3 검사")
+    print(f"📁 경로: {directory} (프로세스 {workers}개)")
+    print("=" * 80)
+
+    def on_result(result):
+        if not result["ok"]:
+            print(f"❌ {Path(result['path']).name}: {result['error']}")
+
+    start = time.perf_counter()
+    results = verify_mirror(directory, workers=workers, on_result=on_result)
+    elapsed = time.perf_counter() - start
+
+    bad = [result for result in results if not result["ok"]]
+    print("\n" + "=" * 80)
+    print(f"✅ 정상: {len(results) - len(bad)}/{len(results)}")
+    print(f"❌ 문제: {len(bad)}/{len(results)}")
+    print(f"⏱️  {elapsed:.1f}초")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+/**
+ * 찬송가 데이터 JSON(public/hymns-645.json) 로더
+ * scripts/generate_full_data.py가 만드는 열(column) 단위 JSON을 HymnDef[]로 펼침
+ * 74KB TypeScript 배열을 코드로 파싱하는 대신 JSON.parse 한 번으로 읽음
+ */
+
+import type { HymnDef } from '../constants';
+
+export interface HymnDataset {
+    version: number;
+    count: number;
+    categories: string[];
+    category: number[];
+    // null이면 기본 제목 ("찬송가 N장", "Hymn N", "Himno N")
+    ko: (string | null)[];
+    en: (string | null)[];
+    es: (string | null)[];
+    // 생성에 쓴 카탈로그 해시 (scripts/build_catalog.py)
+    inputs?: string;
+}
+
+export const HYMN_DATASET_URL = '/hymns-645.json';
+const SUPPORTED_VERSION = 1;
+
+/**
+ * 열 단위 데이터를 HymnDef 배열로 변환
+ */
+export function expandHymnDataset(data: HymnDataset): HymnDef[] {
+    if (data.version !== SUPPORTED_VERSION) {
+        throw new Error(`지원하지 않는 찬송가 데이터 버전: ${data.version}`);
+    }
+    const hymns: HymnDef[] = new Array(data.count);
+    for (let i = 0; i < data.count; i++) {
+        const no = i + 1;
+        hymns[i] = {
+            no,
+            id: `h${no}`,
+            ko: data.ko[i] ?? `찬송가 ${no}장`,
+            en: data.en[i] ?? `Hymn ${no}`,
+            es: data.es[i] ?? `Himno ${no}`,
+            category: data.categories[data.category[i]],
+        };
+    }
+    return hymns;
+}
+
+/**
+ * 찬송가 데이터 JSON을 받아서 HymnDef 배열로 반환
+ */
+export async function loadHymnDataset(url: string = HYMN_DATASET_URL): Promise<HymnDef[]> {
+    const response = await fetch(url);
+    if (!response.ok) {
+        throw new Error(`찬송가 데이터를 불러오지 못했습니다: ${response.status}`);
+    }
+    return expandHymnDataset(await response.json());
+}
@@ -0,0 +1,236 @@
+/**
+ * 찬송가 검색 (public/hymn-search-index.json)
+ * scripts/build_catalog.py가 미리 만든 역색인을 처음 검색할 때 한 번만 받아서 사용
+ * 색인 형식과 검색 규칙은 scripts/hymnkit/search_index.py와 같음
+ *
+ * - 숫자: 곡 번호
+ * - 한글: 음절 bigram (마지막 글자는 받침 생략 허용), 초성 bigram ("ㅁㅂㅇ")
+ * - 영어/스페인어: 단어 접두 검색, 악센트 무시
+ * - 맞는 곡이 없으면 오타 허용 검색
+ */
+
+export const HYMN_SEARCH_INDEX_URL = '/hymn-search-index.json';
+const SUPPORTED_VERSION = 1;
+
+const HANGUL_BASE = 0xac00;
+const HANGUL_LAST = 0xd7a3;
+const JONGSEONG_COUNT = 28;
+const SYLLABLES_PER_CHOSEONG = 21 * JONGSEONG_COUNT;
+const CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ';
+const TOKEN = /[0-9a-z]+|[가-힣ㄱ-ㅎ]+/g;
+
+interface SerializedIndex {
+    version: number;
+    count: number;
+    terms: string[];
+    postings: string[];
+}
+
+const isSyllable = (ch: string) => {
+    const code = ch.charCodeAt(0);
+    return code >= HANGUL_BASE && code <= HANGUL_LAST;
+};
+
+const hasJongseong = (ch: string) => (ch.charCodeAt(0) - HANGUL_BASE) % JONGSEONG_COUNT !== 0;
+
+function fold(text: string): string {
+    let out = '';
+    for (const ch of text.toLowerCase()) {
+        if (ch.charCodeAt(0) < 0x80 || isSyllable(ch) || CHOSEONG.includes(ch)) {
+            out += ch;
+        } else {
+            out += ch.normalize('NFKD').replace(/[\u0300-\u036f]/g, '');
+        }
+    }
+    return out;
+}
+
+function toChoseong(text: string): string {
+    let out = '';
+    for (const ch of text) {
+        if (isSyllable(ch)) {
+            out += CHOSEONG[Math.floor((ch.charCodeAt(0) - HANGUL_BASE) / SYLLABLES_PER_CHOSEONG)];
+        } else if (CHOSEONG.includes(ch)) {
+            out += ch;
+        }
+    }
+    return out;
+}
+
+function editDistance(a: string, b: string, limit: number): number {
+    if (Math.abs(a.length - b.length) > limit) return limit + 1;
+    let previous = Array.from({ length: b.length + 1 }, (_, j) => j);
+    for (let i = 1; i <= a.length; i++) {
+        const current = [i];
+        for (let j = 1; j <= b.length; j++) {
+            current.push(Math.min(previous[j] + 1, current[j - 1] + 1,
+                previous[j - 1] + (a[i - 1] === b[j - 1] ? 0 : 1)));
+        }
+        if (Math.min(...current) > limit) return limit + 1;
+        previous = current;
+    }
+    return previous[b.length];
+}
+
+export class HymnSearchIndex {
+    private terms: string[];
+    private encoded: string[];
+    private decoded = new Map<number, number[]>();
+
+    constructor(data: SerializedIndex) {
+        if (data.version !== SUPPORTED_VERSION) {
+            throw new Error(`지원하지 않는 색인 버전: ${data.version}`);
+        }
+        this.terms = data.terms;
+        this.encoded = data.postings;
+    }
+
+    private postings(index: number): number[] {
+        let found = this.decoded.get(index);
+        if (!found) {
+            found = [];
+            let current = 0;
+            for (const part of this.encoded[index].split(',')) {
+                current += parseInt(part, 36);
+                found.push(current);
+            }
+            this.decoded.set(index, found);
+        }
+        return found;
+    }
+
+    // 정렬된 색인어에서 term 이상인 첫 위치 (문자열 비교는 Python과 같은 코드 단위 순서)
+    private lowerBound(term: string): number {
+        let low = 0;
+        let high = this.terms.length;
+        while (low < high) {
+            const mid = (low + high) >> 1;
+            if (this.terms[mid] < term) low = mid + 1;
+            else high = mid;
+        }
+        return low;
+    }
+
+    private collect(low: string, high: string): Set<number> {
+        const hits = new Set<number>();
+        for (let i = this.lowerBound(low), end = this.lowerBound(high); i < end; i++) {
+            for (const no of this.postings(i)) hits.add(no);
+        }
+        return hits;
+    }
+
+    private exact(term: string): Set<number> {
+        const i = this.lowerBound(term);
+        return this.terms[i] === term ? new Set(this.postings(i)) : new Set();
+    }
+
+    private syllablePrefix(head: string, last: string): Set<number> {
+        if (hasJongseong(last)) return this.exact(head + last);
+        return this.collect(head + last, head + String.fromCharCode(last.charCodeAt(0) + JONGSEONG_COUNT));
+    }
+
+    private hangulClauses(text: string): Set<number>[] {
+        if ([...text].every(ch => CHOSEONG.includes(ch))) {
+            const grams = text.length === 1 ? [text] : [...text].slice(0, -1).map((_, i) => text.slice(i, i + 2));
+            return grams.map(gram => this.exact('c:' + gram));
+        }
+        const syllables = [...text].filter(isSyllable).join('');
+        const clauses: Set<number>[] = [];
+        if (syllables.length === 1) clauses.push(this.syllablePrefix('k:', syllables));
+        for (let i = 0; i < syllables.length - 1; i++) {
+            const head = 'k:' + syllables[i];
+            const last = syllables[i + 1];
+            clauses.push(i === syllables.length - 2 ? this.syllablePrefix(head, last) : this.exact(head + last));
+        }
+        if (syllables.length < text.length) clauses.push(...this.hangulClauses(toChoseong(text)));
+        return clauses;
+    }
+
+    /**
+     * 검색어에 맞는 곡 번호 목록
+     */
+    search(query: string, limit = 20): number[] {
+        const tokens = fold(query).match(TOKEN) ?? [];
+        if (tokens.length === 0) return [];
+        if (tokens.length === 1 && /^\d+$/.test(tokens[0])) {
+            return [...this.exact(`n:${parseInt(tokens[0], 10)}`)].slice(0, limit);
+        }
+
+        const latin = tokens.filter(token => token.charCodeAt(0) < 0x80);
+        const hangul = tokens.filter(token => token.charCodeAt(0) >= 0x80).join('');
+        const clauses = latin.map(token => this.collect('w:' + token, 'w:' + token + '\uffff'));
+        if (hangul) clauses.push(...this.hangulClauses(hangul));
+
+        clauses.sort((a, b) => a.size - b.size);
+        let matches = [...clauses[0]];
+        for (const clause of clauses.slice(1)) {
+            if (matches.length === 0) break;
+            matches = matches.filter(no => clause.has(no));
+        }
+        if (matches.length > 0) {
+            const whole = latin.map(token => this.exact('w:' + token));
+            const score = (no: number) => whole.filter(hits => hits.has(no)).length;
+            return matches.sort((a, b) => score(b) - score(a) || a - b).slice(0, limit);
+        }
+        return this.fuzzy(latin, hangul, limit);
+    }
+
+    private fuzzy(latin: string[], hangul: string, limit: number): number[] {
+        const scores = new Map<number, number>();
+        const add = (no: number, value: number) => scores.set(no, (scores.get(no) ?? 0) + value);
+
+        for (const token of latin) {
+            const maxDistance = token.length < 5 ? 1 : 2;
+            const hits = new Set<number>();
+            const first = token[0];
+            for (let i = this.lowerBound('w:' + first), end = this.lowerBound('w:' + String.fromCharCode(first.charCodeAt(0) + 1)); i < end; i++) {
+                const term = this.terms[i].slice(2, 2 + token.length + maxDistance);
+                if (editDistance(token, term, maxDistance) <= maxDistance) {
+                    for (const no of this.postings(i)) hits.add(no);
+                }
+            }
+            hits.forEach(no => add(no, 2));
+        }
+
+        if (hangul) {
+            const syllables = [...hangul].filter(isSyllable).join('');
+            const grams: string[] = [];
+            for (let i = 0; i < syllables.length - 1; i++) grams.push('k:' + syllables.slice(i, i + 2));
+            const choseong = toChoseong(hangul);
+            if (choseong.length === 1) grams.push('c:' + choseong);
+            for (let i = 0; i < choseong.length - 1; i++) grams.push('c:' + choseong.slice(i, i + 2));
+            const needed = Math.max(1, Math.floor((grams.length + 1) / 2));
+            const counts = new Map<number, number>();
+            for (const gram of grams) {
+                this.exact(gram).forEach(no => counts.set(no, (counts.get(no) ?? 0) + 1));
+            }
+            counts.forEach((count, no) => { if (count >= needed) add(no, count); });
+        }
+
+        return [...scores.entries()]
+            .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+            .slice(0, limit)
+            .map(([no]) => no);
+    }
+}
+
+let loading: Promise<HymnSearchIndex> | null = null;
+
+/**
+ * 검색 색인을 처음 호출할 때만 받아서 이후에는 같은 객체를 반환
+ */
+export function loadHymnSearchIndex(url: string = HYMN_SEARCH_INDEX_URL): Promise<HymnSearchIndex> {
+    if (!loading) {
+        loading = fetch(url)
+            .then(response => {
+                if (!response.ok) throw new Error(`검색 색인을 불러오지 못했습니다: ${response.status}`);
+                return response.json();
+            })
+            .then(data => new HymnSearchIndex(data))
+            .catch(error => {
+                loading = null;     // 실패하면 다음 호출에서 다시 시도
+                throw error;
+            });
+    }
+    return loading;
+}